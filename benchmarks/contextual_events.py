@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Benchmark contextual event matching against the interpreter it replaced.
+
+Compares LifeSimulator.get_contextual_events() with a linear scan over
+reference_check(), a copy of the old per-event interpreter, on a four-partner
+polycule in two ways:
+
+- random day states, where every input changes between passes (the worst
+  case for the cached context), median of interleaved runs;
+- a seeded headless game, timing both at every call the day loop makes.
+
+Any state where the two disagree fails the run.
+
+    python benchmarks/contextual_events.py
+    python benchmarks/contextual_events.py --synthetic 2000
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Mapping
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unwritten_chapters import (  # noqa: E402
+    PARTNER_MOODS, SEASONS, STAT_NAMES, WEATHER_TYPES, HeadlessRunner, LifeSimulator, RandomPolicy,
+)
+
+EVENTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "events")
+PARTNERS = ["Alex", "Blake", "Casey", "Drew"]
+
+
+def reference_check(game, event):
+    """The per-event interpreter get_contextual_events replaced, kept as the baseline"""
+    conditions = event.get("conditions", {})
+    if not conditions:
+        return True
+
+    partners = game.game_data.get("partners", [])
+
+    # Check weather condition
+    if "weather" in conditions:
+        if game.current_weather not in conditions["weather"]:
+            return False
+
+    # Check season condition
+    if "season" in conditions:
+        if game.current_season != conditions["season"]:
+            return False
+
+    # Check partner mood condition
+    if "partner_mood" in conditions:
+        mood_match = False
+        for partner in partners:
+            mood = game.get_partner_mood(partner)
+            if mood in conditions["partner_mood"]:
+                mood_match = True
+                break
+        if not mood_match:
+            return False
+
+    # Check partner traits condition
+    if "partner_traits" in conditions:
+        trait_match = False
+        for partner in partners:
+            traits = game.get_partner_traits(partner)
+            for trait in conditions["partner_traits"]:
+                if trait in traits:
+                    trait_match = True
+                    break
+            if trait_match:
+                break
+        if not trait_match:
+            return False
+
+    # Check partner love language condition
+    if "partner_love_language" in conditions:
+        lang_match = False
+        for partner in partners:
+            lang = game.partner_data.get(partner, {}).get("love_language", "")
+            if lang == conditions["partner_love_language"]:
+                lang_match = True
+                break
+        if not lang_match:
+            return False
+
+    # Check player stat conditions
+    if "player_stat" in conditions:
+        for stat, requirement in conditions["player_stat"].items():
+            value = game.stats.get(stat, 50)
+            if "min" in requirement and value < requirement["min"]:
+                return False
+            if "max" in requirement and value > requirement["max"]:
+                return False
+
+    # Check relationship level conditions
+    if "relationship" in conditions:
+        avg_rel = game.get_average_relationship()
+        req = conditions["relationship"]
+        if "min" in req and avg_rel < req["min"]:
+            return False
+        if "max" in req and avg_rel > req["max"]:
+            return False
+
+    # Check energy conditions
+    if "energy" in conditions:
+        req = conditions["energy"]
+        if "min" in req and game.energy < req["min"]:
+            return False
+        if "max" in req and game.energy > req["max"]:
+            return False
+
+    # Check for inside jokes
+    if conditions.get("has_inside_jokes") and not game.inside_jokes:
+        return False
+
+    # Check for active goals
+    if conditions.get("has_active_goal"):
+        active_goals = [g for g, d in game.shared_goals.items() if d.get("active")]
+        if not active_goals:
+            return False
+
+    # Check for metamours
+    if conditions.get("has_metamours") and len(partners) <= 1:
+        return False
+
+    # Check metamour relationship level
+    if "metamour_relationship" in conditions and game.metamour_relationships:
+        req = conditions["metamour_relationship"]
+        # Check any metamour pair
+        match = False
+        for pair, rel in game.metamour_relationships.items():
+            if "min" in req and rel >= req["min"]:
+                match = True
+                break
+            if "max" in req and rel <= req["max"]:
+                match = True
+                break
+        if not match:
+            return False
+
+    # Check for support network
+    if conditions.get("has_support_network") and not game.support_network:
+        return False
+
+    # Check for unrevealed backstory
+    if conditions.get("backstory_unrevealed"):
+        has_unrevealed = False
+        for partner in partners:
+            data = game.partner_data.get(partner, {})
+            backstory = data.get("backstory", {})
+            revealed = data.get("backstory_revealed", [])
+            if len(revealed) < len(backstory):
+                has_unrevealed = True
+                break
+        if not has_unrevealed:
+            return False
+
+    # Check days together condition
+    if "days_together" in conditions:
+        days = game.game_data.get("days_together", 0)
+        req = conditions["days_together"]
+        if isinstance(req, Mapping):
+            if "min" in req and days < req["min"]:
+                return False
+            if "max" in req and days > req["max"]:
+                return False
+        elif isinstance(req, int) and days < req:
+            return False
+
+    # Check personal growth as direct condition (outside player_stat)
+    if "personal_growth" in conditions:
+        growth = game.stats.personal_growth
+        req = conditions["personal_growth"]
+        if isinstance(req, Mapping):
+            if "min" in req and growth < req["min"]:
+                return False
+            if "max" in req and growth > req["max"]:
+                return False
+
+    # Check if conflict is active (proxy: low relationship or high stress)
+    if conditions.get("conflict_active"):
+        avg_rel = game.get_average_relationship()
+        stress = game.stats.stress
+        if not (avg_rel < 40 or stress > 65):
+            return False
+
+    # Check if surprise can be planned
+    if conditions.get("can_surprise"):
+        # Check that we have pending_surprises attribute and partners
+        if not hasattr(game, 'pending_surprises'):
+            return False
+        # Limit active surprises to prevent spam
+        if len(game.pending_surprises) >= 2:
+            return False
+
+    return True
+
+
+def randomize(game, rng):
+    """Put the game in a random day state and tell the context cache everything moved"""
+    game.current_weather = rng.choice(list(WEATHER_TYPES))
+    game.current_season = rng.choice(list(SEASONS))
+    for partner in PARTNERS:
+        game.partner_data[partner].mood = rng.choice(list(PARTNER_MOODS))
+        game.partner_relationships[partner] = rng.randint(10, 100)
+    for stat in STAT_NAMES:
+        setattr(game.stats, stat, rng.randint(0, 100))
+    game.energy = rng.randint(0, 100)
+    game.game_data["days_together"] = rng.randint(0, 500)
+    game.inside_jokes = [{"joke": "the thing", "day_created": 1, "partner": PARTNERS[0]}] * rng.randint(0, 1)
+    game.shared_goals = {"trip": {"progress": 10, "active": rng.random() < 0.5}}
+    for pair in game.metamour_relationships:
+        game.metamour_relationships[pair] = rng.randint(0, 100)
+    game.pending_surprises = [{"partner": PARTNERS[1], "type": "gift"}] * rng.randint(0, 3)
+    game.mark_context_dirty()
+
+
+def play(events_dir, days, seed):
+    """Time both matchers at every get_contextual_events call in a seeded game"""
+    game = LifeSimulator(save_file=os.devnull, events_dir=events_dir, verbose=False, seed=seed)
+    game.new_game("Player", PARTNERS, "polycule", "balanced")
+    events = game.catalog.contextual_events
+    compiled = game.get_contextual_events
+    totals = {"interpreter": 0.0, "compiled": 0.0, "calls": 0}
+
+    def timed():
+        start = time.perf_counter()
+        expected = [event for event in events if reference_check(game, event)]
+        middle = time.perf_counter()
+        got = compiled()
+        totals["interpreter"] += middle - start
+        totals["compiled"] += time.perf_counter() - middle
+        totals["calls"] += 1
+        if [event["id"] for event in got] != [event["id"] for event in expected]:
+            sys.exit(f"mismatch on day {game.game_data['days_together']}")
+        return got
+
+    game.get_contextual_events = timed
+    for _ in HeadlessRunner(game, RandomPolicy(seed)).run(days):
+        pass
+    calls = totals["calls"]
+    return calls, totals["interpreter"] / calls * 1e6, totals["compiled"] / calls * 1e6
+
+
+def report(label, old_us, new_us):
+    print(f"{label}")
+    print(f"  interpreter: {old_us:8.1f} us/pass")
+    print(f"  compiled:    {new_us:8.1f} us/pass")
+    print(f"  speedup:     {old_us / new_us:8.1f}x")
+
+
+def synthetic_events_dir(count, rng):
+    """Copy the shipped events and add `count` contextual events varied from the real ones"""
+    path = tempfile.mkdtemp(prefix="uc-bench-")
+    for name in os.listdir(EVENTS_DIR):
+        shutil.copy(os.path.join(EVENTS_DIR, name), path)
+    events_file = os.path.join(path, "contextual_events.json")
+    with open(events_file, encoding="utf-8") as f:
+        events = json.load(f)
+    weathers, moods, seasons = list(WEATHER_TYPES), list(PARTNER_MOODS), list(SEASONS)
+    for i in range(count):
+        event = copy.deepcopy(rng.choice(events[:88]))
+        event["id"] = f"{event['id']}_synthetic_{i}"
+        conditions = event.setdefault("conditions", {})
+        if "weather" in conditions:
+            conditions["weather"] = rng.sample(weathers, rng.randint(1, 3))
+        if "partner_mood" in conditions:
+            conditions["partner_mood"] = rng.sample(moods, rng.randint(1, 3))
+        if "season" in conditions:
+            conditions["season"] = rng.choice(seasons)
+        for stat, requirement in conditions.get("player_stat", {}).items():
+            for bound in requirement:
+                requirement[bound] = max(0, min(100, requirement[bound] + rng.randint(-15, 15)))
+        events.append(event)
+    with open(events_file, "w", encoding="utf-8") as f:
+        json.dump(events, f)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--states", type=int, default=500, help="Random day states per run")
+    parser.add_argument("--runs", type=int, default=30, help="Interleaved timing runs")
+    parser.add_argument("--days", type=int, default=1000, help="Days in the seeded headless game")
+    parser.add_argument("--synthetic", type=int, default=0, metavar="N",
+                        help="Add N contextual events varied from the shipped ones")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    events_dir = synthetic_events_dir(args.synthetic, rng) if args.synthetic else EVENTS_DIR
+    try:
+        game = LifeSimulator(save_file=os.devnull, events_dir=events_dir, verbose=False, seed=args.seed)
+        game.new_game("Player", PARTNERS, "polycule", "balanced")
+        events = game.catalog.contextual_events
+        seeds = [rng.random() for _ in range(args.states)]
+        for seed in seeds:
+            randomize(game, random.Random(seed))
+            expected = [event["id"] for event in events if reference_check(game, event)]
+            got = [event["id"] for event in game.get_contextual_events()]
+            if got != expected:
+                sys.exit(f"mismatch on {game.current_weather}/{game.current_season}: {got} != {expected}")
+
+        def run(match):
+            elapsed = 0.0
+            for seed in seeds:
+                randomize(game, random.Random(seed))
+                start = time.perf_counter()
+                match()
+                elapsed += time.perf_counter() - start
+            return elapsed / len(seeds) * 1e6
+
+        old, new = [], []
+        for _ in range(args.runs):
+            old.append(run(lambda: [event for event in events if reference_check(game, event)]))
+            new.append(run(game.get_contextual_events))
+        calls, played_old, played_new = play(events_dir, args.days, args.seed)
+    finally:
+        if args.synthetic:
+            shutil.rmtree(events_dir, ignore_errors=True)
+
+    report(f"{len(events)} contextual events, {args.states} random states (median of {args.runs} runs)",
+           statistics.median(old), statistics.median(new))
+    report(f"{args.days} played days, {calls} calls", played_old, played_new)
+
+
+if __name__ == "__main__":
+    main()
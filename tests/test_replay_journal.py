@@ -0,0 +1,64 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import unwritten_chapters as uc  # noqa: E402
+
+EVENTS_DIR = os.path.join(ROOT, "events")
+
+
+def snapshot(game):
+    return json.loads(json.dumps(game._snapshot_state()))
+
+
+class ResumeAfterUnsavedDaysTest(unittest.TestCase):
+    """Save, play on without saving, load that save and keep journaling"""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.save_file = os.path.join(self.dir, "game_state.json")
+        self.journal_path = self.save_file + ".journal"
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def new_game(self):
+        return uc.LifeSimulator(save_file=self.save_file, events_dir=EVENTS_DIR, verbose=False, seed=4)
+
+    def play(self, game, journal, days, policy_seed):
+        for _ in uc.HeadlessRunner(game, uc.RandomPolicy(policy_seed), journal=journal).run(days):
+            pass
+
+    def test_verify_drops_abandoned_days(self):
+        game = self.new_game()
+        game.new_game("Player", ["Alex", "Blake"], "couple", "balanced")
+        journal = uc.ReplayJournal(self.journal_path)
+        journal.start(game)
+        self.play(game, journal, 30, 1)
+        game.save_game()
+        self.play(game, journal, 20, 2)  # Never saved
+        journal.close()
+
+        game = self.new_game()
+        self.assertTrue(game.load_game())
+        self.assertEqual(game.game_data["days_together"], 30)
+        journal = uc.ReplayJournal(self.journal_path)
+        journal.resume(game)
+        self.play(game, journal, 40, 3)
+        journal.close()
+
+        replayed = uc.replay_journal(self.journal_path, EVENTS_DIR)
+        verified = uc.replay_journal(self.journal_path, EVENTS_DIR, verify=True)
+        self.assertEqual(verified.game_data["days_together"], 70)
+        self.assertEqual(snapshot(replayed), snapshot(game))
+        self.assertEqual(snapshot(verified), snapshot(game))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,11 +18,34 @@ Features:
 - Story arcs, achievements, and daily moments
 """
 
+import argparse
+import asyncio
+import base64
+import bisect
+import contextlib
+import functools
+import gzip
+import hashlib
+import io
 import json
+import lzma
+import marshal
+import queue
 import random
 import os
+import secrets
+import sqlite3
 import sys
+import tempfile
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 
 def safe_print(text: str):
@@ -223,6 +246,13 @@ QUALITY_TIME_ACTIVITIES = [
     "food",           # Cooking or eating out together
 ]
 
+# Chance each partner initiates an action of their own at the end of a day
+PARTNER_TURN_CHANCE = 0.7
+
+# Independent random streams each simulator owns, so a new draw in one system
+# never shifts the rolls of another
+RNG_STREAMS = ["weather", "drift", "events", "dice", "partners", "surprises"]
+
 # Love Languages - affects how partners receive love
 LOVE_LANGUAGES = {
     "words": {
@@ -519,30 +549,1666 @@ DIFFICULTY_SETTINGS = {
     }
 }
 
+# Contextual event conditions that match discrete state values - indexed at load time
+CONTEXTUAL_INDEXED_CONDITIONS = ["weather", "season", "partner_mood", "partner_traits", "partner_love_language"]
+CONTEXTUAL_FLAG_CONDITIONS = ["has_inside_jokes", "has_active_goal", "has_metamours", "has_support_network",
+                              "backstory_unrevealed", "conflict_active", "can_surprise"]
+
+
+# Order compiled condition predicates run in: cheap scalar and flag checks first,
+# then set lookups, then stat ranges and per-pair scans
+CONDITION_EVAL_ORDER = [
+    "has_inside_jokes", "has_active_goal", "has_metamours", "has_support_network", "can_surprise",
+    "weather", "season", "energy", "days_together", "relationship", "conflict_active",
+    "partner_love_language", "partner_mood", "partner_traits", "personal_growth", "player_stat",
+    "metamour_relationship", "backstory_unrevealed",
+]
+
+
+# Condition-context entries, grouped by what changes them. Their mutators mark a
+# group dirty (LifeSimulator.mark_context_dirty), so a cached context only
+# recomputes dirty groups. Stats, relationship, energy and days change almost
+# everywhere and are re-read directly on each pass instead.
+CONDITION_CONTEXT_GROUPS = {
+    "weather": ("weather",),
+    "season": ("season",),
+    "partners": ("partner_mood", "partner_traits", "partner_love_language", "backstory_unrevealed",
+                 "has_metamours"),
+    "goals": ("has_active_goal",),
+    "metamours": ("metamour_relationship",),
+    "inside_jokes": ("has_inside_jokes",),
+    "support_network": ("has_support_network",),
+    "surprises": ("can_surprise",),
+}
+
+
+def _range_predicate(key: str, low: Optional[float], high: Optional[float], stat: str = None, default: int = 50):
+    """Build a predicate checking ctx[key] (or one player stat) against optional bounds"""
+    if stat is not None:
+        if low is not None and high is not None:
+            return lambda ctx: low <= ctx["stats"].get(stat, default) <= high
+        if low is not None:
+            return lambda ctx: ctx["stats"].get(stat, default) >= low
+        if high is not None:
+            return lambda ctx: ctx["stats"].get(stat, default) <= high
+    else:
+        if low is not None and high is not None:
+            return lambda ctx: low <= ctx[key] <= high
+        if low is not None:
+            return lambda ctx: ctx[key] >= low
+        if high is not None:
+            return lambda ctx: ctx[key] <= high
+    return lambda ctx: True
+
+
+def compile_event_conditions(conditions: Dict[str, Any]) -> List[tuple]:
+    """Compile a contextual event's conditions into (condition, predicate) pairs.
+
+    Predicates take the shared context from LifeSimulator.get_condition_context().
+    This is the one definition of what conditions mean; check_event_conditions
+    compiles ad-hoc events with it too.
+    """
+    predicates = []
+
+    for key in CONDITION_EVAL_ORDER:
+        if key not in conditions:
+            continue
+        req = conditions[key]
+
+        if key == "weather":
+            allowed = frozenset(req)
+            predicates.append((key, lambda ctx, allowed=allowed: ctx["weather"] in allowed))
+        elif key == "season":
+            predicates.append((key, lambda ctx, season=req: ctx["season"] == season))
+        elif key in ("partner_mood", "partner_traits"):
+            allowed = frozenset(req)
+            predicates.append((key, lambda ctx, key=key, allowed=allowed: not allowed.isdisjoint(ctx[key])))
+        elif key == "partner_love_language":
+            predicates.append((key, lambda ctx, lang=req: lang in ctx["partner_love_language"]))
+        elif key == "player_stat":
+            for stat, r in req.items():
+                predicates.append((key, _range_predicate(key, r.get("min"), r.get("max"), stat=stat)))
+        elif key in ("relationship", "energy", "days_together"):
+            if isinstance(req, Mapping):
+                low, high = req.get("min"), req.get("max")
+            elif key == "days_together" and isinstance(req, int):
+                low, high = req, None
+            else:
+                continue
+            predicates.append((key, _range_predicate(key, low, high)))
+        elif key == "personal_growth":
+            if not isinstance(req, Mapping):
+                continue
+            predicates.append((key, _range_predicate(key, req.get("min"), req.get("max"),
+                                                     stat="personal_growth", default=0)))
+        elif key == "metamour_relationship":
+            low, high = req.get("min"), req.get("max")
+            # Any pair meeting either bound matches; no metamours means no constraint
+            predicates.append((key, lambda ctx, low=low, high=high: not ctx["metamour_relationship"] or any(
+                (low is not None and rel >= low) or (high is not None and rel <= high)
+                for rel in ctx["metamour_relationship"])))
+        elif req:
+            # Boolean flags
+            predicates.append((key, lambda ctx, key=key: ctx[key]))
+
+    return predicates
+
+
+def condition_dependencies(conditions: Dict[str, Any]) -> List[str]:
+    """List the condition-context dimensions a contextual event's conditions read"""
+    dims = []
+    for key, req in conditions.items():
+        if key == "player_stat":
+            dims.extend(f"stats.{stat}" for stat in req)
+        elif key == "personal_growth":
+            dims.append("stats.personal_growth")
+        elif key in CONDITION_EVAL_ORDER:
+            dims.append(key)
+    return dims
+
+
+def build_contextual_index(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build an inverted index over the discrete conditions of contextual events.
+
+    Postings are bitmasks over event positions: for each indexed condition, the
+    events allowed today are the ones that don't declare it plus the postings for
+    today's values. AND-ing those masks leaves only candidates whose discrete
+    conditions all match, without touching the other events at all.
+    """
+    all_mask = (1 << len(events)) - 1
+    postings = {}  # {condition: {value: mask of events listing value}}
+    free = {}  # {condition: mask of events that don't declare it}
+
+    for i, event in enumerate(events):
+        conditions = event.get("conditions", {})
+        bit = 1 << i
+        for key in CONTEXTUAL_INDEXED_CONDITIONS:
+            if key not in conditions:
+                continue
+            values = conditions[key]
+            if isinstance(values, str):
+                values = [values]
+            key_postings = postings.setdefault(key, {})
+            for value in values:
+                key_postings[value] = key_postings.get(value, 0) | bit
+            free[key] = free.get(key, all_mask) & ~bit
+        for flag in CONTEXTUAL_FLAG_CONDITIONS:
+            if conditions.get(flag):
+                postings.setdefault(flag, {True: all_mask})
+                free[flag] = free.get(flag, all_mask) & ~bit
+
+    return {"postings": postings, "free": free, "all": all_mask}
+
+
+def iter_mask_bits(mask: int):
+    """Yield the positions of set bits in a mask, lowest first"""
+    offset = 0
+    for byte in mask.to_bytes((mask.bit_length() + 7) // 8, "little"):
+        if byte:
+            for bit in _BYTE_BITS[byte]:
+                yield offset + bit
+        offset += 8
+
+
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+# Event category files, in draw-table order. Intimate events are always loaded
+# but only appear in a simulator's view once the player opts in.
+EVENT_CATEGORY_FILES = [
+    "good_surprises.json",
+    "relationship_events.json",
+    "health_events.json",
+    "natural_disasters.json",
+    "milestones.json",
+    "complications.json",
+    "career_events.json",
+    "personal_growth.json",
+    "intimate_events.json",
+]
+INTIMATE_CATEGORY = "intimate_events"
+
+# Every file the catalog reads, and the compiled bundle that can stand in for them
+CATALOG_SOURCE_FILES = EVENT_CATEGORY_FILES + ["story_arcs.json", "contextual_events.json", "partner_actions.json"]
+# The bundle is marshal data: plain containers and strings only, so loading a
+# bundle dropped into an events directory (say, by a mod) cannot run code
+CATALOG_BUNDLE_FILE = "catalog.bundle"
+CATALOG_BUNDLE_FORMAT = 3
+
+# Keys every entry must define, checked before a bundle is written
+EVENT_REQUIRED_KEYS = ["id", "title", "description", "roll_requirement", "responses"]
+CATALOG_REQUIRED_KEYS = {
+    "story_arcs.json": ["id", "title", "stages"],
+    "contextual_events.json": EVENT_REQUIRED_KEYS + ["conditions"],
+    "partner_actions.json": ["id", "title", "description", "roll_requirement", "partner_choices"],
+}
+ARC_STAGE_REQUIRED_KEYS = ["stage", "title", "description", "roll_requirement", "responses"]
+
+
+# Player stats, in display order
+STAT_NAMES = ("happiness", "health", "stress", "financial_stability", "confidence",
+              "personal_growth", "social_connection", "household_harmony")
+
+# What a CompiledEffects entry changes: a player stat, partner relationships
+# (the "relationship" key), or nothing for keys that are neither
+STAT_EFFECT = "stat"
+RELATIONSHIP_EFFECT = "relationship"
+IGNORED_EFFECT = "ignored"
+
+
+EFFECT_KEYS = ("effects", "effects_success", "effects_failure")  # Event fields holding stat effects
+
+# (positive, negative) effect scaling for events without separate success/failure
+# effects: success amplifies gains (+20%) and softens penalties (-20%), failure
+# cuts gains (-30%) and deepens penalties (+30%)
+OUTCOME_SCALING = {True: (1.2, 0.8), False: (0.7, 1.3)}
+
+
+def _effect_kind(key: str) -> str:
+    """Classify an effects key as STAT_EFFECT, RELATIONSHIP_EFFECT or IGNORED_EFFECT"""
+    if key in STAT_NAMES:
+        return STAT_EFFECT
+    return RELATIONSHIP_EFFECT if key == "relationship" else IGNORED_EFFECT
+
+
+class CompiledEffects(Mapping):
+    """A read-only effects mapping, translated once into (stat, kind, value) entries.
+
+    The kind is STAT_EFFECT, RELATIONSHIP_EFFECT or IGNORED_EFFECT, so applying
+    an outcome needs no per-key classification. Scaled outcome tables and bonus
+    variants are built on first use and cached.
+    """
+
+    __slots__ = ("_effects", "entries", "_variants")
+
+    def __init__(self, effects: Mapping):
+        self._effects = dict(effects)
+        self.entries = tuple(
+            (stat, _effect_kind(stat), value) for stat, value in self._effects.items())
+        self._variants = {}
+
+    def scaled(self, multiplier: float, positive: float = 1, negative: float = 1) -> "CompiledEffects":
+        """The outcome table: each value times multiplier, then positive or negative by sign"""
+        key = (multiplier, positive, negative)
+        table = self._variants.get(key)
+        if table is None:
+            table = {}
+            for stat, value in self._effects.items():
+                value = int(value * multiplier)
+                if value > 0:
+                    value = int(value * positive)
+                elif value < 0:
+                    value = int(value * negative)
+                table[stat] = value
+            table = self._variants[key] = CompiledEffects(table)
+        return table
+
+    def with_effect(self, stat: str, value: int) -> "CompiledEffects":
+        """These effects with stat set to value"""
+        key = (stat, value)
+        variant = self._variants.get(key)
+        if variant is None:
+            variant = self._variants[key] = CompiledEffects({**self._effects, stat: value})
+        return variant
+
+    def __getitem__(self, key: str) -> int:
+        return self._effects[key]
+
+    def __iter__(self):
+        return iter(self._effects)
+
+    def __len__(self) -> int:
+        return len(self._effects)
+
+    def copy(self) -> Dict[str, int]:
+        """Return a plain, mutable dict of the effects (like MappingProxyType.copy)"""
+        return dict(self._effects)
+
+    def __repr__(self) -> str:
+        return f"CompiledEffects({self._effects!r})"
+
+
+def compile_effects(effects: Mapping) -> CompiledEffects:
+    """Return effects as CompiledEffects, compiling plain dicts (catalog effects already are)"""
+    return effects if isinstance(effects, CompiledEffects) else CompiledEffects(effects)
+
+
+def freeze_event_data(value: Any) -> Any:
+    """Recursively convert loaded JSON into read-only mappings and tuples, compiling effects"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: CompiledEffects(v) if k in EFFECT_KEYS and isinstance(v, dict)
+                                 else freeze_event_data(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_event_data(v) for v in value)
+    return value
+
+
+def thaw_event_data(value: Any) -> Any:
+    """Recursively copy frozen event data back into plain dicts and lists, e.g. for JSON"""
+    if isinstance(value, Mapping):
+        return {k: thaw_event_data(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw_event_data(v) for v in value]
+    return value
+
+
+def read_event_file(events_dir: str, filename: str) -> Optional[Any]:
+    """Parse one JSON file from the events directory (None if missing)"""
+    file_path = os.path.join(events_dir, filename)
+    try:
+        with open(file_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"[!] Warning: Could not find {filename}")
+        return None
+
+
+def validate_catalog_data(filename: str, data: Any) -> List[str]:
+    """Check a catalog file's entries for required keys, returning any problems found"""
+    if not isinstance(data, list):
+        return [f"{filename}: expected a list of entries"]
+
+    required = CATALOG_REQUIRED_KEYS.get(filename, EVENT_REQUIRED_KEYS)
+    errors = []
+    for i, entry in enumerate(data):
+        label = f"{filename}[{entry.get('id', i) if isinstance(entry, dict) else i}]"
+        if not isinstance(entry, dict):
+            errors.append(f"{label}: expected an object")
+            continue
+        missing = [key for key in required if key not in entry]
+        if missing:
+            errors.append(f"{label}: missing {', '.join(missing)}")
+        for stage in entry.get("stages", []) if filename == "story_arcs.json" else []:
+            missing = [key for key in ARC_STAGE_REQUIRED_KEYS if key not in stage]
+            if missing:
+                errors.append(f"{label} stage {stage.get('stage', '?')}: missing {', '.join(missing)}")
+    return errors
+
+
+def build_catalog_bundle(events_dir: str = "events") -> bool:
+    """Validate every catalog file and write them, pre-indexed, into one marshalled bundle.
+
+    The bundle records each source's mtime, size and hash so the loader can tell
+    when it has gone stale and fall back to the JSON files.
+    """
+    sources = {}
+    data = {}
+    errors = []
+    for filename in CATALOG_SOURCE_FILES:
+        file_path = os.path.join(events_dir, filename)
+        try:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            print(f"[!] Warning: Could not find {filename}")
+            sources[filename] = None
+            data[filename] = None
+            continue
+        stat = os.stat(file_path)
+        sources[filename] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": hashlib.sha256(raw).hexdigest(),
+        }
+        try:
+            data[filename] = json.loads(raw)
+        except ValueError as e:
+            errors.append(f"{filename}: invalid JSON ({e})")
+            continue
+        errors.extend(validate_catalog_data(filename, data[filename]))
+
+    if errors:
+        for error in errors:
+            print(f"[!] {error}")
+        print("[!] Catalog bundle not written")
+        return False
+
+    # Each file is marshalled on its own so the catalog can decode categories lazily
+    bundle = {
+        "format": CATALOG_BUNDLE_FORMAT,
+        "marshal_version": marshal.version,
+        "sources": sources,
+        "data": {
+            filename: None if entries is None else marshal.dumps(entries)
+            for filename, entries in data.items()
+        },
+        "contextual_index": build_contextual_index(data["contextual_events.json"] or []),
+    }
+    bundle_path = os.path.join(events_dir, CATALOG_BUNDLE_FILE)
+    tmp_path = bundle_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        marshal.dump(bundle, f)
+    os.replace(tmp_path, bundle_path)
+
+    total = sum(len(entries) for entries in data.values() if entries)
+    print(f"[OK] Wrote {bundle_path} ({total} entries from {len(CATALOG_SOURCE_FILES)} files)")
+    return True
+
+
+def _source_matches(file_path: str, recorded: Optional[Dict[str, Any]]) -> bool:
+    """Check a catalog source file against the fingerprint recorded in a bundle"""
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return recorded is None
+    if recorded is None:
+        return False
+    if stat.st_mtime_ns == recorded["mtime_ns"] and stat.st_size == recorded["size"]:
+        return True
+    # Touched but possibly unchanged - fall back to the content hash
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest() == recorded["sha256"]
+
+
+def load_catalog_bundle(events_dir: str = "events") -> Optional[Dict[str, Any]]:
+    """Load the compiled catalog bundle if it exists and matches every source file"""
+    bundle_path = os.path.join(events_dir, CATALOG_BUNDLE_FILE)
+    try:
+        with open(bundle_path, 'rb') as f:
+            bundle = marshal.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError):
+        print(f"[!] Warning: Ignoring unreadable {CATALOG_BUNDLE_FILE} (rebuild it with --build-catalog)")
+        return None
+
+    if (not isinstance(bundle, dict) or bundle.get("format") != CATALOG_BUNDLE_FORMAT
+            or bundle.get("marshal_version") != marshal.version):
+        return None
+    sources = bundle.get("sources", {})
+    for filename in CATALOG_SOURCE_FILES:
+        if filename not in sources:
+            return None
+        if not _source_matches(os.path.join(events_dir, filename), sources[filename]):
+            return None
+    return bundle
+
+
+class _CategoryView(Mapping):
+    """Read-only {category: events} mapping that loads each category on first access"""
+
+    def __init__(self, catalog: "EventCatalog", names: tuple):
+        self._catalog = catalog
+        self._names = names
+
+    def __getitem__(self, category: str) -> tuple:
+        if category not in self._names:
+            raise KeyError(category)
+        return self._catalog.category(category)
+
+    def __contains__(self, category: object) -> bool:
+        return category in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"<categories {list(self._names)}>"
+
+
+class EventCatalog:
+    """Frozen event data shared by every LifeSimulator in the process.
+
+    Holds the event categories, story arcs, partner actions and contextual
+    events, along with everything compiled from them (contextual condition
+    index and predicates, weighted draw tables). Each file is read and frozen
+    on first access, at most once; call preload() to pay for everything up
+    front. Use get_event_catalog() so each events directory is shared.
+    """
+
+    def __init__(self, events_dir: str = "events"):
+        self.events_dir = events_dir
+        self.bundled = False
+        self._bundle = None
+        self._bundle_checked = False
+        self._sources = {}  # {filename: frozen entries}
+        self._contextual = None  # compiled contextual data, see _compile_contextual_events
+        self._intimate_thresholds = None
+        self._lock = threading.RLock()
+
+        category_names = tuple(f.replace(".json", "") for f in EVENT_CATEGORY_FILES)
+        self.categories = _CategoryView(self, category_names)
+        self._views = {
+            True: self.categories,
+            False: _CategoryView(self, tuple(c for c in category_names if c != INTIMATE_CATEGORY)),
+        }
+
+        # Compiled weighted draw tables, keyed by (intimate view, difficulty, partner count, intimate band)
+        self._sampling_tables = {}
+
+    def preload(self) -> "EventCatalog":
+        """Load every catalog file and compile the contextual index now rather than on first use"""
+        for category in self.categories:
+            self.category(category)
+        self.story_arcs
+        self.partner_actions
+        self.contextual_index
+        self.intimate_thresholds
+        return self
+
+    def _get_bundle(self) -> Optional[Dict[str, Any]]:
+        """Load and check the compiled bundle the first time any source is needed"""
+        if not self._bundle_checked:
+            # A valid compiled bundle replaces parsing every JSON file
+            self._bundle = load_catalog_bundle(self.events_dir)
+            self.bundled = self._bundle is not None
+            self._bundle_checked = True
+            if self.bundled:
+                print(f"[OK] Loaded event catalog bundle from {self.events_dir}")
+        return self._bundle
+
+    def get_source(self, filename: str, label: str = "entries") -> tuple:
+        """Get one catalog file's entries, frozen, from the bundle or its JSON file"""
+        entries = self._sources.get(filename)
+        if entries is not None:
+            return entries
+        with self._lock:
+            entries = self._sources.get(filename)
+            if entries is None:
+                bundle = self._get_bundle()
+                if bundle is not None:
+                    blob = bundle["data"][filename]
+                    data = marshal.loads(blob) if blob is not None else None
+                else:
+                    data = read_event_file(self.events_dir, filename)
+                    if data is not None:
+                        print(f"[OK] Loaded {len(data)} {label}")
+                entries = freeze_event_data(data) if data is not None else ()
+                self._sources[filename] = entries
+        return entries
+
+    def category(self, category: str) -> tuple:
+        """Get one event category's frozen events, loading the file on first access"""
+        return self.get_source(f"{category}.json", f"events from {category}")
+
+    # Multi-stage story arcs, contextual/conditional events, and
+    # partner-initiated actions for turn-based play
+    @property
+    def story_arcs(self) -> tuple:
+        return self.get_source("story_arcs.json", "story arcs")
+
+    @property
+    def contextual_events(self) -> tuple:
+        return self.get_source("contextual_events.json", "contextual events")
+
+    @property
+    def partner_actions(self) -> tuple:
+        return self.get_source("partner_actions.json", "partner actions")
+
+    @property
+    def contextual_index(self) -> Dict[str, Any]:
+        return self._get_contextual()["index"]
+
+    @property
+    def contextual_range_predicates(self) -> tuple:
+        return self._get_contextual()["range_predicates"]
+
+    @property
+    def contextual_dependents(self) -> Dict[str, int]:
+        return self._get_contextual()["dependents"]
+
+    @property
+    def intimate_thresholds(self) -> List[int]:
+        """Distinct min_relationship gates of intimate events, ascending"""
+        if self._intimate_thresholds is None:
+            self._intimate_thresholds = sorted({
+                event.get("min_relationship", 60) for event in self.category(INTIMATE_CATEGORY)
+            })
+        return self._intimate_thresholds
+
+    def _get_contextual(self) -> Dict[str, Any]:
+        """Get the compiled contextual data, compiling it on first access"""
+        compiled = self._contextual
+        if compiled is None:
+            with self._lock:
+                if self._contextual is None:
+                    self._contextual = self._compile_contextual_events()
+                compiled = self._contextual
+        return compiled
+
+    def _compile_contextual_events(self) -> Dict[str, Any]:
+        """Build the condition index, range predicates and dependency masks for contextual events"""
+        events = self.contextual_events
+        bundle = self._get_bundle()
+        if bundle is not None:
+            index = bundle["contextual_index"]
+        else:
+            index = build_contextual_index(events)
+        # Compile each condition block once; the index already covers discrete keys,
+        # so matching only runs the remaining range predicates
+        indexed = set(CONTEXTUAL_INDEXED_CONDITIONS) | set(CONTEXTUAL_FLAG_CONDITIONS)
+        range_predicates = []
+        # Which events read each context dimension, for incremental re-matching
+        dependents = {}  # {dimension: mask of events}
+        for i, event in enumerate(events):
+            conditions = event.get("conditions", {})
+            range_predicates.append(tuple(pred for key, pred in compile_event_conditions(conditions)
+                                          if key not in indexed))
+            for dim in condition_dependencies(conditions):
+                dependents[dim] = dependents.get(dim, 0) | 1 << i
+        return {
+            "index": index,
+            "range_predicates": tuple(range_predicates),
+            "dependents": dependents,
+        }
+
+    def category_view(self, include_intimate: bool = False) -> Mapping:
+        """Get the read-only {category: events} mapping, with or without intimate events"""
+        return self._views[bool(include_intimate)]
+
+    def sampling_table(self, include_intimate: bool, difficulty: str, num_partners: int,
+                       avg_relationship: float) -> tuple:
+        """Get the compiled (entries, cumulative weights, total) table for weighted event draws.
+
+        Tables depend only on the intimate view, difficulty, partner count and how
+        many intimate relationship thresholds are met, so each combination is
+        built once and shared by every simulator.
+        """
+        intimate_band = bisect.bisect_right(self.intimate_thresholds, avg_relationship) if include_intimate else 0
+        key = (bool(include_intimate), difficulty, num_partners, intimate_band)
+
+        table = self._sampling_tables.get(key)
+        if table is None:
+            table = self._build_sampling_table(include_intimate, difficulty, num_partners, avg_relationship)
+            self._sampling_tables[key] = table
+        return table
+
+    def _build_sampling_table(self, include_intimate: bool, difficulty: str, num_partners: int,
+                              avg_relationship: float) -> tuple:
+        """Build cumulative integer weights over every eligible (category, event) pair"""
+        settings = DIFFICULTY_SETTINGS.get(difficulty, DIFFICULTY_SETTINGS["balanced"])
+
+        # Weight multiplier for relationship events based on partner count
+        relationship_weight = 1 + (num_partners - 1) * 0.5
+
+        # Crisis categories (negative events) - weighted by difficulty
+        crisis_categories = ["complications", "natural_disasters", "health_events"]
+
+        entries = []
+        cumulative = []
+        total = 0
+        for category, events_list in self.category_view(include_intimate).items():
+            # Determine how many copies each event is worth (weighting)
+            copies = 1
+
+            # Relationship event weighting for multi-partner
+            if category == "relationship_events" and num_partners > 1:
+                copies = int(relationship_weight)
+
+            # Crisis weighting based on difficulty
+            if category in crisis_categories:
+                copies = max(1, int(copies * settings["crisis_weight"]))
+
+            for event in events_list:
+                # Gate intimate events behind relationship thresholds
+                if category == INTIMATE_CATEGORY:
+                    if avg_relationship < event.get("min_relationship", 60):
+                        continue
+
+                total += copies
+                entries.append((category, event))
+                cumulative.append(total)
+
+        return tuple(entries), tuple(cumulative), total
+
+
+_EVENT_CATALOGS = {}  # {absolute events dir: EventCatalog}
+_EVENT_CATALOGS_LOCK = threading.Lock()
+
+
+def get_event_catalog(events_dir: str = "events") -> EventCatalog:
+    """Get the process-wide catalog for an events directory, creating it on first use"""
+    key = os.path.abspath(events_dir)
+    catalog = _EVENT_CATALOGS.get(key)
+    if catalog is None:
+        with _EVENT_CATALOGS_LOCK:
+            catalog = _EVENT_CATALOGS.get(key)
+            if catalog is None:
+                catalog = EventCatalog(events_dir)
+                _EVENT_CATALOGS[key] = catalog
+    return catalog
+
+
+# Records kept in memory per history log; older ones live on only in its rollups
+HISTORY_WINDOW = 100
+# Fields each saved history log rolls its records up by
+HISTORY_ROLLUPS = {
+    "event_history": ("category", "involved_partner"),
+    "partner_action_history": ("partner", "action_id"),
+    "memories": ("type",),
+}
+
+
+class HistoryLog:
+    """Bounded history of event or action records, with running rollups.
+
+    Only the most recent `window` records are kept. Every record ever added is
+    counted into per-field rollups ({field: {value: {count, successes}}}) and
+    into total, so memory and save size stay flat however long a campaign runs.
+    Records leaving the window can also be spilled to a JSON-lines file.
+    """
+
+    def __init__(self, rollup_fields: tuple = (), window: int = HISTORY_WINDOW,
+                 spill_path: Optional[str] = None):
+        self.rollup_fields = rollup_fields
+        self.records = deque(maxlen=window)
+        self.total = 0
+        self.rollups = {field: {} for field in rollup_fields}
+        self.spill_path = spill_path
+        self._spill_file = None
+
+    def append(self, record: Dict[str, Any]):
+        """Add a record, rolling it into the aggregates and spilling whatever it evicts"""
+        if self.spill_path and len(self.records) == self.records.maxlen:
+            if self._spill_file is None:
+                self._spill_file = open(self.spill_path, 'a', buffering=1)
+            self._spill_file.write(json.dumps(self.records[0], separators=(",", ":")) + "\n")
+        self.records.append(record)
+        self.total += 1
+        success = 1 if record.get("success") else 0
+        for field in self.rollup_fields:
+            value = record.get(field)
+            if value is None:
+                continue
+            group = self.rollups[field].setdefault(str(value), {"count": 0, "successes": 0})
+            group["count"] += 1
+            group["successes"] += success
+
+    def recent(self, count: int) -> List[Dict[str, Any]]:
+        """Get up to the last `count` records, oldest first"""
+        start = max(0, len(self.records) - count)
+        return [self.records[i] for i in range(start, len(self.records))]
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready form for saves"""
+        return {"total": self.total, "recent": list(self.records), "rollups": self.rollups}
+
+    def load_dict(self, data: Dict[str, Any]):
+        """Restore from to_dict() output (a saved window longer than ours keeps its newest records)"""
+        self.records.clear()
+        self.records.extend(data.get("recent", []))
+        self.total = data.get("total", len(self.records))
+        self.rollups = {field: {} for field in self.rollup_fields}
+        for field, groups in data.get("rollups", {}).items():
+            self.rollups[field] = groups
+
+    def load_records(self, records: List[Dict[str, Any]]):
+        """Rebuild from a complete legacy record list, rolling up every entry"""
+        self.records.clear()
+        self.total = 0
+        self.rollups = {field: {} for field in self.rollup_fields}
+        spill_path, self.spill_path = self.spill_path, None
+        for record in records:
+            self.append(record)
+        self.spill_path = spill_path
+
+    def close(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+
+# Rolling windows (in days) StatsHistory keeps O(1) mean/slope/min for
+STATS_HISTORY_WINDOWS = (7, 30, 90)
+RELATIONSHIP_COLUMN = "relationship:{}"  # StatsHistory column for a partner's relationship
+
+
+class StatsHistory:
+    """Daily stat and relationship snapshots, one signed byte per value, stored by column.
+
+    Only the last `keep` rows (the longest window) are held, so memory and save
+    size stay flat however long a campaign runs; total counts every row ever
+    recorded. Row i holds the state at the end of day first_day + total - len + i.
+    For each window in `windows`, every column keeps a running sum,
+    position-weighted sum and monotonic min queue, so mean(), slope() and
+    minimum() over those windows are O(1). Any other window is answered by
+    scanning the rows held.
+    """
+
+    def __init__(self, windows: tuple = STATS_HISTORY_WINDOWS):
+        self.windows = tuple(windows)
+        self.keep = max(self.windows)
+        self.first_day = None  # Day of the first row ever recorded
+        self.columns = {}  # {column name: array('b')}
+        self._dropped = 0  # Rows recorded before the ones held
+        self._rolling = {}  # {column: [[window, sum, weighted sum, min deque of (row, value)], ...]}
+        self._encoded_rows = []  # base64 rows already built for saves
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    @property
+    def total(self) -> int:
+        """Rows recorded since the first, including those no longer held"""
+        return self._dropped + len(self)
+
+    def record(self, day: int, values: Dict[str, int]):
+        """Append one day's values (a column seen for the first time is backfilled with its value)"""
+        if self.first_day is None:
+            self.first_day = day
+        rows = len(self)
+        for name, value in values.items():
+            value = -128 if value < -128 else 127 if value > 127 else int(value)
+            column = self.columns.get(name)
+            if column is None:
+                column = self.columns[name] = array('b')
+                self._rolling[name] = [[window, 0, 0, deque()] for window in self.windows]
+                self._encoded_rows = []  # Every row gains this column
+                for _ in range(rows):
+                    self._append(name, column, value)
+            self._append(name, column, value)
+        excess = len(self) - self.keep
+        if excess > 0:
+            for column in self.columns.values():
+                del column[:excess]
+            del self._encoded_rows[:excess]
+            self._dropped += excess
+
+    def _append(self, name: str, column: array, value: int):
+        """Add a value to a column and slide each of its rolling windows forward"""
+        held = len(column)
+        row = self._dropped + held  # Counted from the first row ever recorded
+        column.append(value)
+        for rolling in self._rolling[name]:
+            window, total, weighted, minimums = rolling
+            if held >= window:
+                # Drop the oldest value; every remaining one moves down a position
+                total -= column[held - window]
+                weighted += (window - 1) * value - total
+                if minimums[0][0] <= row - window:
+                    minimums.popleft()
+            else:
+                weighted += held * value
+            rolling[1] = total + value
+            rolling[2] = weighted
+            while minimums and minimums[-1][1] >= value:
+                minimums.pop()
+            minimums.append((row, value))
+
+    def _rolling_window(self, name: str, window: int) -> Optional[list]:
+        """Get the incrementally maintained [window, sum, weighted sum, min deque] for a column, if tracked"""
+        for rolling in self._rolling.get(name, ()):
+            if rolling[0] == window:
+                return rolling
+        return None
+
+    def _span(self, name: str, window: int) -> tuple:
+        """Get (column, number of rows the window covers)"""
+        column = self.columns[name]
+        return column, min(window, len(column))
+
+    def mean(self, name: str, window: int) -> float:
+        """Average of a column over the last `window` days"""
+        column, n = self._span(name, window)
+        if n == 0:
+            return 0.0
+        rolling = self._rolling_window(name, window)
+        total = rolling[1] if rolling else sum(column[len(column) - n:])
+        return total / n
+
+    def slope(self, name: str, window: int) -> float:
+        """Least-squares trend of a column over the last `window` days, in points per day"""
+        column, n = self._span(name, window)
+        if n < 2:
+            return 0.0
+        rolling = self._rolling_window(name, window)
+        if rolling:
+            total, weighted = rolling[1], rolling[2]
+        else:
+            recent = column[len(column) - n:]
+            total = sum(recent)
+            weighted = sum(i * v for i, v in enumerate(recent))
+        sum_i = n * (n - 1) / 2
+        sum_ii = (n - 1) * n * (2 * n - 1) / 6
+        return (n * weighted - sum_i * total) / (n * sum_ii - sum_i * sum_i)
+
+    def minimum(self, name: str, window: int) -> int:
+        """Lowest value of a column over the last `window` days"""
+        column, n = self._span(name, window)
+        if n == 0:
+            raise ValueError(f"No history recorded for {name}")
+        rolling = self._rolling_window(name, window)
+        return rolling[3][0][1] if rolling else min(column[len(column) - n:])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready form for saves: one base64 string per day's row, so saves can append them"""
+        names = list(self.columns)
+        columns = [self.columns[name] for name in names]
+        # Rows never change once recorded, so only encode the ones added since last time
+        for row in range(len(self._encoded_rows), len(self)):
+            values = array('b', [column[row] for column in columns])
+            self._encoded_rows.append(base64.b64encode(values.tobytes()).decode("ascii"))
+        return {"first_day": self.first_day, "total": self.total, "columns": names,
+                "rows": list(self._encoded_rows)}
+
+    def load_dict(self, data: Dict[str, Any]):
+        """Restore from to_dict() output (of saved rows, only the newest `keep` are held)"""
+        self.columns = {}
+        self._rolling = {}
+        self._encoded_rows = []
+        names = data.get("columns", [])
+        rows = data.get("rows", [])
+        held = rows[max(0, len(rows) - self.keep):]
+        self.first_day = data.get("first_day")
+        self._dropped = data.get("total", len(rows)) - len(held)
+        for i, row in enumerate(held):
+            values = array('b')
+            values.frombytes(base64.b64decode(row))
+            self.record(self.first_day + self._dropped + i, dict(zip(names, values)))
+
+
+# Journaled saves: one base snapshot line, then one delta line per save. Deltas
+# diff the state split into parts (game_data per key, partner_data per partner
+# field, history rollups per group), and lists that only ever grow are saved by
+# appending their new entries.
+SAVE_FORMAT = 1
+SAVE_VERSION = 3  # Version of the saved game state; older states go through SAVE_MIGRATIONS on load
+SAVE_SPLIT_DEPTH = {"game_data": 1, "partner_data": 2, "event_history": 3, "partner_action_history": 3,
+                    "memories": 3, "stats_history": 1}
+# {list path: path of its running count, or None to count the list itself}. A
+# history's recent window slides, so its total says how many entries are new.
+SAVE_APPEND_ONLY = {
+    ("event_history", "recent"): ("event_history", "total"),
+    ("partner_action_history", "recent"): ("partner_action_history", "total"),
+    ("game_data", "completed_arcs"): None,
+    ("stats_history", "rows"): ("stats_history", "total"),
+    ("memories", "recent"): ("memories", "total"),
+    ("inside_jokes",): None,
+}
+SAVE_COMPACT_EVERY = 200  # Deltas appended before the next save rewrites the base snapshot
+
+# Approximate memory per hosted game (measured with tracemalloc), used by LifeSimulator.estimate_memory
+SESSION_BASE_BYTES = 32 * 1024
+SESSION_RECORD_BYTES = 500  # Per history record held in memory
+SESSION_STATS_CELL_BYTES = 2  # Per day per stats history column
+
+SAVE_STORE_COMMIT_EVERY = 32  # Saves a SQLiteSaveStore batches into one transaction
+SAVE_WRITE_ERRORS = (OSError, sqlite3.Error, KeyError)  # How a save can fail to reach its file or store
+
+# Optional compressed saves. Each base or delta is its own gzip member / xz stream,
+# so deltas still append and the standard readers decode the file as one stream.
+SAVE_COMPRESSION_EXTENSIONS = {".gz": "gzip", ".xz": "lzma", ".lzma": "lzma"}
+SAVE_COMPRESSION_MAGIC = {b"\x1f\x8b": "gzip", b"\xfd7zXZ\x00": "lzma"}
+LZMA_PRESETS = {"base": 6, "delta": 0}  # Deltas are too small for the slow presets to pay off
+
+
+def flatten_save_data(save_data: Dict[str, Any]) -> Dict[tuple, Any]:
+    """Split save data into the {path: value} parts journaled saves diff (see SAVE_SPLIT_DEPTH)"""
+    parts = {}
+
+    def split(path, value, depth):
+        if depth and isinstance(value, dict):
+            for key, sub_value in value.items():
+                split(path + (key,), sub_value, depth - 1)
+        else:
+            parts[path] = value
+
+    for key, value in save_data.items():
+        split((key,), value, SAVE_SPLIT_DEPTH.get(key, 0))
+    return parts
+
+
+def apply_save_delta(save_data: Dict[str, Any], delta: Dict[str, Any]):
+    """Apply one journaled delta record to loaded save data in place"""
+    for path, value in delta.get("set", ()):
+        container = save_data
+        for key in path[:-1]:
+            container = container.setdefault(key, {})
+        container[path[-1]] = value
+    for path, entries in delta.get("append", ()):
+        container = save_data
+        for key in path[:-1]:
+            container = container.setdefault(key, {})
+        container.setdefault(path[-1], []).extend(entries)
+
+
+def _compression_from_magic(head: bytes) -> Optional[str]:
+    """Tell how a save file is compressed from its first bytes ("gzip", "lzma" or None)"""
+    for magic, compression in SAVE_COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def _open_save_text(raw, compression: Optional[str]):
+    """Wrap an open binary save file for reading as text, decompressing as it streams"""
+    if compression == "gzip":
+        raw = gzip.GzipFile(fileobj=raw, mode='rb')
+    elif compression == "lzma":
+        raw = lzma.LZMAFile(raw, mode='rb')
+    return io.TextIOWrapper(raw, encoding="utf-8")
+
+
+def read_save_file(path: str) -> tuple:
+    """Read a save file, replaying any journaled deltas onto its base snapshot.
+
+    Returns (save_data, number of deltas, compression). The count is None when
+    the next save must write a fresh base: the file is a legacy single-document
+    save, or its last delta was torn by a crash mid-append.
+    """
+    with open(path, 'rb') as raw:
+        compression = _compression_from_magic(raw.read(6))
+        raw.seek(0)
+        f = _open_save_text(raw, compression)
+        first_line = f.readline()
+        if not first_line.startswith('{"type":"base"'):
+            f.seek(0)
+            return json.load(f), None, compression
+        base = json.loads(first_line)
+        if base.get("format") != SAVE_FORMAT:
+            raise ValueError(f"{path} uses save format {base.get('format')}, expected {SAVE_FORMAT}")
+        save_data = base["state"]
+        deltas = 0
+        try:
+            for line in f:
+                if not line.strip():
+                    continue
+                apply_save_delta(save_data, json.loads(line))
+                deltas += 1
+        except (ValueError, EOFError, OSError, lzma.LZMAError, zlib.error):
+            # A save interrupted mid-append; everything before it is intact,
+            # but nothing more may be appended after the torn record
+            return save_data, None, compression
+    return save_data, deltas, compression
+
+
+def encode_save_record(record: Dict[str, Any], compression: Optional[str] = None,
+                       preset: str = "base") -> bytes:
+    """Encode one base or delta record as a line of JSON, compressed if asked.
+
+    Compressed records are streamed through the compressor as the JSON encoder
+    produces them, so only the compressed bytes are ever held in memory.
+    """
+    if compression is None:
+        return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+    buffer = io.BytesIO()
+    if compression == "gzip":
+        stream = gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=6, mtime=0)
+    elif compression == "lzma":
+        stream = lzma.LZMAFile(buffer, mode='wb', preset=LZMA_PRESETS[preset])
+    else:
+        raise ValueError(f"Unknown save compression: {compression}")
+    with io.TextIOWrapper(stream, encoding="utf-8") as text:
+        json.dump(record, text, separators=(",", ":"))
+        text.write("\n")
+    return buffer.getvalue()
+
+
+def write_save_file(path: str, data: bytes, append: bool = False):
+    """Write encoded save data durably.
+
+    A full write goes to a temp file in the same directory, is fsynced and then
+    renamed over the old save, so a crash leaves either the old file or the new
+    one. An append is fsynced before returning; a torn final record from a crash
+    is discarded on load.
+    """
+    if append:
+        with open(path, 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        return
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    if os.name == "posix":
+        # Make the rename itself durable
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def generate_support_network(rng: random.Random) -> List[Dict]:
+    """Generate a random support network for the player"""
+    network = []
+    # Everyone gets a best friend
+    network.append({
+        "name": rng.choice(["Alex", "Jordan", "Sam", "Riley", "Casey", "Morgan"]),
+        "type": "best_friend",
+        "relationship": rng.randint(60, 80)
+    })
+    # Maybe family
+    if rng.random() < 0.7:
+        network.append({
+            "name": rng.choice(["Mom", "Dad", "Sibling", "Cousin"]),
+            "type": "family",
+            "relationship": rng.randint(40, 70)
+        })
+    # Maybe therapist
+    if rng.random() < 0.3:
+        network.append({
+            "name": "Dr. " + rng.choice(["Chen", "Williams", "Garcia", "Smith"]),
+            "type": "therapist",
+            "relationship": 50
+        })
+    return network
+
+
+def random_weather(season: str, rng: random.Random) -> str:
+    """Get random weather based on season"""
+    if season == "winter":
+        weights = {"sunny": 1, "cloudy": 3, "rainy": 1, "stormy": 1, "snowy": 3, "perfect": 0}
+    elif season == "summer":
+        weights = {"sunny": 4, "cloudy": 2, "rainy": 1, "stormy": 1, "snowy": 0, "perfect": 2}
+    elif season == "spring":
+        weights = {"sunny": 2, "cloudy": 2, "rainy": 3, "stormy": 1, "snowy": 0, "perfect": 2}
+    else:  # fall
+        weights = {"sunny": 2, "cloudy": 3, "rainy": 2, "stormy": 1, "snowy": 0, "perfect": 1}
+
+    weather_list = list(weights.keys())
+    weight_list = list(weights.values())
+    return rng.choices(weather_list, weights=weight_list)[0]
+
+
+def season_for_month(month: int) -> str:
+    """Get the season a calendar month falls in"""
+    for season, data in SEASONS.items():
+        if month in data["months"]:
+            return season
+    return "spring"
+
+
+# Save migrations by the version they upgrade from: SAVE_MIGRATIONS[n] turns a
+# version n state into version n + 1, in place
+SAVE_MIGRATIONS = {}
+
+
+def save_migration(from_version: int):
+    """Register a function as the migration from save version `from_version`"""
+    def register(migrate):
+        SAVE_MIGRATIONS[from_version] = migrate
+        return migrate
+    return register
+
+
+def migrate_save_data(save_data: Dict[str, Any]) -> int:
+    """Upgrade saved game state to SAVE_VERSION in place; returns the version it started at.
+
+    Saves from before versioning count as version 0. Random backfill is seeded
+    from the save itself, so migrating the same old save always gives the same game.
+    """
+    version = save_data.get("save_version", 0)
+    if version > SAVE_VERSION:
+        raise ValueError(f"Save version {version} is newer than this game understands ({SAVE_VERSION})")
+    for from_version in range(version, SAVE_VERSION):
+        SAVE_MIGRATIONS[from_version](save_data)
+    save_data["save_version"] = SAVE_VERSION
+    return version
+
+
+def _migration_rng(save_data: Dict[str, Any], from_version: int) -> random.Random:
+    return random.Random(f"{save_data['game_data']['seed']}:migrate:{from_version}")
+
+
+@save_migration(0)
+def _migrate_multiple_partners(save_data: Dict[str, Any]):
+    """Version 1: partners by name instead of a single ai_name, and a seed for every game"""
+    game_data = save_data["game_data"]
+    if not save_data.get("partner_relationships") and "ai_name" in game_data:
+        legacy_name = game_data.get("ai_name", "AI")
+        save_data["partner_relationships"] = {legacy_name: save_data["stats"].get("relationship", 50)}
+        game_data["partners"] = [legacy_name]
+        game_data["partner_config"] = "solo"
+    save_data.setdefault("partner_relationships", {})
+    save_data.setdefault("partner_data", {})
+    if "seed" not in game_data:
+        # Derive the seed from the save, so every copy of it migrates the same way
+        digest = hashlib.sha256(json.dumps(game_data, sort_keys=True).encode("utf-8")).digest()
+        game_data["seed"] = int.from_bytes(digest[:8], "big") >> 1
+
+
+@save_migration(1)
+def _migrate_partner_details(save_data: Dict[str, Any]):
+    """Version 2: partner personalities and backstories, support network, weather and the newer systems"""
+    rng = _migration_rng(save_data, 1)
+    partner_data = save_data["partner_data"]
+    for partner in save_data["partner_relationships"]:
+        if partner not in partner_data:
+            partner_data[partner] = {
+                "traits": rng.sample(list(PARTNER_TRAITS.keys()), rng.randint(1, 2)),
+                "mood": "content",
+                "favorite": rng.choice(QUALITY_TIME_ACTIVITIES)
+            }
+        data = partner_data[partner]
+        if "love_language" not in data:
+            data["love_language"] = rng.choice(list(LOVE_LANGUAGES.keys()))
+        if "conflict_style" not in data:
+            data["conflict_style"] = rng.choice(list(CONFLICT_STYLES.keys()))
+        if "backstory" not in data:
+            data["backstory"] = {
+                "dream": rng.choice(BACKSTORY_ELEMENTS["dreams"]),
+                "fear": rng.choice(BACKSTORY_ELEMENTS["fears"]),
+                "childhood": rng.choice(BACKSTORY_ELEMENTS["childhood"]),
+                "past": rng.choice(BACKSTORY_ELEMENTS["past_relationships"]),
+            }
+            data["backstory_revealed"] = []
+        data.setdefault("surprise_cooldown", 0)
+
+    if "support_network" not in save_data:
+        save_data["support_network"] = generate_support_network(rng)
+    if "current_season" not in save_data:
+        # The season the game was last saved in, not the one it happens to be migrated in
+        saved_on = save_data.get("last_saved") or save_data["game_data"].get("start_date")
+        month = datetime.fromisoformat(saved_on).month if saved_on else 3
+        save_data["current_season"] = season_for_month(month)
+    if "current_weather" not in save_data:
+        save_data["current_weather"] = random_weather(save_data["current_season"], rng)
+    for key, default in (("achievements", {}), ("active_arcs", []), ("inside_jokes", []),
+                         ("shared_goals", {}), ("energy", 100), ("pending_surprises", []),
+                         ("metamour_relationships", {})):
+        save_data.setdefault(key, default)
+
+
+@save_migration(2)
+def _migrate_history_logs(save_data: Dict[str, Any]):
+    """Version 3: bounded history logs with rollups, and the stats time series"""
+    game_data = save_data["game_data"]
+    legacy = {"event_history": game_data.pop("events_experienced", None),
+              "partner_action_history": game_data.pop("partner_actions_taken", None),
+              "memories": None}
+    for key, rollup_fields in HISTORY_ROLLUPS.items():
+        records = save_data.get(key, legacy[key] or [])
+        if isinstance(records, list):
+            history = HistoryLog(rollup_fields)
+            history.load_records(records)
+            save_data[key] = history.to_dict()
+    game_data.pop("stats_history", None)  # An unused placeholder list
+    save_data.setdefault("stats_history", StatsHistory().to_dict())
+
+
+SAVE_FILE_EXTENSIONS = (".json", ".gz", ".xz", ".lzma")  # What migrate_saves() picks up from a directory
+
+
+def migrate_save_file(path: str) -> Dict[str, Any]:
+    """Migrate one save file in place, rewriting it as a single base snapshot if it was out of date"""
+    try:
+        save_data, deltas, compression = read_save_file(path)
+        from_version = migrate_save_data(save_data)
+        if from_version != SAVE_VERSION or deltas is None:
+            record = {"type": "base", "format": SAVE_FORMAT, "state": save_data}
+            write_save_file(path, encode_save_record(record, compression))
+    except (OSError, ValueError, KeyError) as e:
+        return {"path": path, "error": f"{type(e).__name__}: {e}"}
+    return {"path": path, "from_version": from_version, "to_version": SAVE_VERSION,
+            "rewritten": from_version != SAVE_VERSION or deltas is None}
+
+
+def migrate_saves(directory: str, workers: Optional[int] = None):
+    """Migrate every save file in a directory across worker processes, yielding results as they finish"""
+    paths = sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                   if name.endswith(SAVE_FILE_EXTENSIONS))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(migrate_save_file, path) for path in paths]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+class SessionNotFoundError(KeyError):
+    """Raised by a SaveStore for a session it does not hold"""
+
+
+class SaveStore(ABC):
+    """Holds many players' saves, each a session of one base snapshot plus appended deltas.
+
+    `save` takes the same base and delta records a journaled save file holds; `load`
+    rebuilds the session's state from them.
+    """
+
+    @abstractmethod
+    def list_sessions(self) -> List[Dict[str, Any]]:
+        """Describe every stored session: session_id, player_name, day, updated and deltas"""
+
+    @abstractmethod
+    def load(self, session_id: str) -> tuple:
+        """Return (save_data, number of deltas) for a session; SessionNotFoundError if there is none"""
+
+    @abstractmethod
+    def save(self, session_id: str, record: Dict[str, Any], append: bool):
+        """Store a base record (replacing the session) or append a delta record to it"""
+
+    @abstractmethod
+    def delete(self, session_id: str):
+        """Remove a session and all its deltas"""
+
+    def flush(self):
+        """Make every save so far durable"""
+
+    def close(self):
+        """Flush, then release the store"""
+        self.flush()
+
+
+class SQLiteSaveStore(SaveStore):
+    """A SaveStore in one SQLite database: a row per session and a row per delta.
+
+    The database runs in WAL mode so readers never wait on the writer, and saves
+    are committed in batches of `commit_every`; call flush() (or close()) to commit
+    the rest, as LifeSimulator.save_game does after every explicit save. One store
+    may be shared between threads.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            session_id TEXT PRIMARY KEY,
+            player_name TEXT,
+            day INTEGER NOT NULL DEFAULT 0,
+            updated TEXT,
+            deltas INTEGER NOT NULL DEFAULT 0,
+            base TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS deltas (
+            session_id TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            delta TEXT NOT NULL,
+            PRIMARY KEY (session_id, seq)
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path: str, commit_every: int = SAVE_STORE_COMMIT_EVERY):
+        self.path = path
+        self.commit_every = commit_every
+        self._lock = threading.RLock()
+        self._pending = 0  # Saves written since the last commit
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    def list_sessions(self) -> List[Dict[str, Any]]:
+        """Describe every stored session: session_id, player_name, day, updated and deltas"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT session_id, player_name, day, updated, deltas FROM sessions ORDER BY session_id").fetchall()
+        return [{"session_id": session_id, "player_name": player_name, "day": day,
+                 "updated": updated, "deltas": deltas}
+                for session_id, player_name, day, updated, deltas in rows]
+
+    def load(self, session_id: str) -> tuple:
+        """Return (save_data, number of deltas) for a session; SessionNotFoundError if there is none"""
+        with self._lock:
+            row = self._conn.execute("SELECT base FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+            if row is None:
+                raise SessionNotFoundError(session_id)
+            deltas = self._conn.execute("SELECT delta FROM deltas WHERE session_id = ? ORDER BY seq",
+                                        (session_id,)).fetchall()
+        base = json.loads(row[0])
+        if base.get("format") != SAVE_FORMAT:
+            raise ValueError(f"Session {session_id} uses save format {base.get('format')}, expected {SAVE_FORMAT}")
+        save_data = base["state"]
+        for (delta,) in deltas:
+            apply_save_delta(save_data, json.loads(delta))
+        return save_data, len(deltas)
+
+    def save(self, session_id: str, record: Dict[str, Any], append: bool):
+        """Store a base record (replacing the session) or append a delta record to it"""
+        text = json.dumps(record, separators=(",", ":"))
+        now = datetime.now().isoformat()
+        with self._lock:
+            if not self._pending:
+                self._conn.execute("BEGIN")
+            self._conn.execute("SAVEPOINT save")
+            try:
+                if append:
+                    # No UPDATE ... RETURNING: it needs SQLite 3.35, newer than many Python builds link
+                    cursor = self._conn.execute(
+                        "UPDATE sessions SET deltas = deltas + 1, day = ?, updated = ? WHERE session_id = ?",
+                        (record.get("day", 0), now, session_id))
+                    if not cursor.rowcount:
+                        raise SessionNotFoundError(session_id)
+                    row = self._conn.execute("SELECT deltas FROM sessions WHERE session_id = ?",
+                                             (session_id,)).fetchone()
+                    self._conn.execute("INSERT INTO deltas (session_id, seq, delta) VALUES (?, ?, ?)",
+                                       (session_id, row[0], text))
+                else:
+                    game_data = record["state"].get("game_data", {})
+                    self._conn.execute("DELETE FROM deltas WHERE session_id = ?", (session_id,))
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO sessions (session_id, player_name, day, updated, deltas, base) "
+                        "VALUES (?, ?, ?, ?, 0, ?)",
+                        (session_id, game_data.get("player_name"), game_data.get("days_together", 0), now, text))
+            except BaseException:
+                # Undo just this save; earlier saves in the batch still commit
+                self._conn.execute("ROLLBACK TO save")
+                self._conn.execute("RELEASE save")
+                if not self._pending:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("RELEASE save")
+            self._pending += 1
+            if self._pending >= self.commit_every:
+                self.flush()
+
+    def delete(self, session_id: str):
+        """Remove a session and all its deltas"""
+        with self._lock:
+            if not self._pending:
+                self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM deltas WHERE session_id = ?", (session_id,))
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            self._pending += 1
+            self.flush()
+
+    def flush(self):
+        """Commit every save batched so far"""
+        with self._lock:
+            if self._pending:
+                self._conn.execute("COMMIT")
+                self._pending = 0
+
+    def close(self):
+        """Flush, then close the database connection"""
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+
+def write_save(target: Any, data: Any, append: bool):
+    """Write prepared save data to a save file path, or to a (SaveStore, session_id) slot"""
+    if isinstance(target, tuple):
+        store, session_id = target
+        store.save(session_id, data, append)
+    else:
+        write_save_file(target, data, append)
+
+
+class Autosaver:
+    """Saves a game every few days on a background thread.
+
+    The game's state is serialized on the calling thread at the end of a day,
+    which is fast; the thread only does the slow part, writing and fsyncing the
+    file. Writes happen in order. If one fails, appends queued behind it are
+    dropped, and the game's next save rewrites the whole file.
+    """
+
+    def __init__(self, game: "LifeSimulator", every_days: int = 7):
+        self.game = game
+        self.every_days = every_days
+        self.error = None  # Why the most recent write failed, or None if it succeeded
+        self._write_failed = threading.Event()  # Set by the thread; cleared by the game's next save
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+        game.autosaver = self
+
+    def day_finished(self):
+        """Call once a day's events are done; queues a save every `every_days` days"""
+        if self.every_days and self.game.game_data["days_together"] % self.every_days == 0:
+            self.submit(*self.game._prepare_save())
+
+    def submit(self, target: Any, data: Any, append: bool):
+        """Queue prepared save data for the background thread"""
+        self._queue.put((target, data, append))
+
+    def flush(self):
+        """Wait until every queued save has been written"""
+        self._queue.join()
+
+    def take_failure(self) -> bool:
+        """Whether a write failed since the last call, so the next save must be a fresh base"""
+        if not self._write_failed.is_set():
+            return False
+        self._write_failed.clear()
+        return True
+
+    def stop(self):
+        """Write anything still queued, then end the thread"""
+        self._queue.put(None)
+        self._thread.join()
+        if self.game.autosaver is self:
+            self.game.autosaver = None
+
+    def _run(self):
+        failed = False
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                target, data, append = item
+                if failed and append:
+                    continue  # The base these deltas extend never made it to disk
+                try:
+                    write_save(target, data, append)
+                    self.error = None
+                    failed = False
+                except SAVE_WRITE_ERRORS as e:
+                    self.error = e
+                    failed = True
+                    self._write_failed.set()  # The game thread drops its baseline on its next save
+            finally:
+                self._queue.task_done()
+
+
+class _StateRecord:
+    """Base for fixed-field game state that still reads and writes like the dict it replaced.
+
+    Fields are attributes (named in _names), so hot code uses plain attribute
+    access while saves, conditions and older callers keep using
+    record["field"] and record.get(...).
+    """
+
+    __slots__ = ()
+    _names = ()
+    _fields = frozenset()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self._fields:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._fields
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self) -> tuple:
+        return self._names
+
+    def values(self) -> list:
+        return [getattr(self, key) for key in self._names]
+
+    def items(self) -> list:
+        return [(key, getattr(self, key)) for key in self._names]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (_StateRecord, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.items())})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready form for saves"""
+        return {key: getattr(self, key) for key in self._names}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Build from to_dict() output (or the plain dict older code kept), ignoring unknown keys"""
+        return cls(**{key: data[key] for key in cls._names if key in data})
+
+
+class PlayerStats(_StateRecord):
+    """The player's stats, each 0-100"""
+
+    __slots__ = STAT_NAMES
+    _names = STAT_NAMES
+    _fields = frozenset(STAT_NAMES)
+
+    def __init__(self, happiness: int = 50, health: int = 50, stress: int = 30, financial_stability: int = 50,
+                 confidence: int = 50, personal_growth: int = 0, social_connection: int = 50,
+                 household_harmony: int = 50):
+        self.happiness = happiness
+        self.health = health
+        self.stress = stress
+        self.financial_stability = financial_stability
+        self.confidence = confidence
+        self.personal_growth = personal_growth
+        self.social_connection = social_connection
+        self.household_harmony = household_harmony  # Multi-partner dynamics
+
+
+class PartnerState(_StateRecord):
+    """One partner's personality, mood and history with the player"""
+
+    __slots__ = ("traits", "mood", "favorite", "love_language", "conflict_style", "backstory",
+                 "backstory_revealed", "surprise_cooldown")
+    _names = __slots__
+    _fields = frozenset(__slots__)
+
+    def __init__(self, traits: List[str] = None, mood: str = "content", favorite: str = "deep_talk",
+                 love_language: str = "time", conflict_style: str = "", backstory: Dict[str, str] = None,
+                 backstory_revealed: List[str] = None, surprise_cooldown: int = 0):
+        self.traits = traits if traits is not None else []
+        self.mood = mood
+        self.favorite = favorite  # Favorite quality time activity
+        self.love_language = love_language
+        self.conflict_style = conflict_style
+        self.backstory = backstory if backstory is not None else {}  # {element: text}
+        self.backstory_revealed = backstory_revealed if backstory_revealed is not None else []
+        self.surprise_cooldown = surprise_cooldown  # Days until they can plan another surprise
+
+
+class ArcProgress(_StateRecord):
+    """How far an active story arc has got"""
+
+    __slots__ = ("arc_id", "stage", "started_day", "next_stage_day")
+    _names = __slots__
+    _fields = frozenset(__slots__)
+
+    def __init__(self, arc_id: str, stage: int = 1, started_day: int = 0, next_stage_day: int = 0):
+        self.arc_id = arc_id
+        self.stage = stage
+        self.started_day = started_day
+        self.next_stage_day = next_stage_day  # Day the current stage's event becomes due
+
+
 class LifeSimulator:
-    def __init__(self, save_file: str = "game_state.json"):
+    def __init__(self, save_file: str = "game_state.json", events_dir: str = "events",
+                 verbose: bool = True, seed: Optional[int] = None,
+                 history_window: int = HISTORY_WINDOW, spill_history: bool = False,
+                 save_compression: Optional[str] = None,
+                 save_store: Optional[SaveStore] = None, session_id: Optional[str] = None):
         self.save_file = save_file
-        self.events_dir = "events"
-        self.stats = {
-            "happiness": 50,
-            "health": 50,
-            "stress": 30,
-            "financial_stability": 50,
-            "confidence": 50,
-            "personal_growth": 0,
-            "social_connection": 50,
-            "household_harmony": 50  # New stat for multi-partner dynamics
-        }
+        # With a save_store, saves go to its session_id slot instead of save_file
+        self.save_store = save_store
+        self.session_id = session_id
+        # "gzip", "lzma" or "" for plain JSON lines; None picks by save_file extension (.gz, .xz)
+        self.save_compression = save_compression
+        self.events_dir = events_dir
+        self.verbose = verbose  # False for headless runs: narration is dropped, results are returned
+        self.history_window = history_window  # Records each history log keeps in memory
+        self.spill_history = spill_history  # Also keep records that leave the window in <save>.<log>.jsonl
+        # Same seed + same choices = same game; without one, pick a seed so the run can still be replayed
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2 ** 63)
+        self._rngs = {}  # {stream name: random.Random}
+        self.seed_streams()
+        self.stats = PlayerStats()
         # Partner relationships tracked separately
         self.partner_relationships = {}  # {partner_name: relationship_value}
         # Extended partner data: traits, mood, favorite activity, love language, conflict style, backstory
-        self.partner_data = {}  # {partner_name: {traits: [], mood: str, favorite: str, love_language: str, conflict_style: str, backstory: {}}}
+        self.partner_data = {}  # {partner_name: PartnerState}
         # Achievements tracking
         self.achievements = {}  # {achievement_id: {unlocked: bool, date: str}}
         # Memories/anniversaries
-        self.memories = []  # [{day: int, type: str, description: str, partners: []}]
+        self.memories = self._new_history("memories", HISTORY_ROLLUPS["memories"])  # {day, type, description, partners}
         # Active story arcs
-        self.active_arcs = []  # [{arc_id: str, stage: int, started_day: int}]
+        self.active_arcs = []  # [ArcProgress]
         # Inside jokes built over time
         self.inside_jokes = []  # [{joke: str, day_created: int, partner: str}]
         # Shared goals progress
@@ -566,88 +2232,84 @@ class LifeSimulator:
             "difficulty": "balanced",  # cozy, balanced, dramatic, chaotic
             "include_intimate": False,  # Opt-in for intimate events
             "days_together": 0,
-            "events_experienced": [],
-            "stats_history": [],
             "current_event": None,
             "last_exciting_day": 0,  # For adventurous trait tracking
             "last_intimate_day": 0,  # For affectionate trait tracking
+            "seed": self.seed,
         }
-        self.events = {}
-        self.story_arcs = []  # Loaded by load_story_arcs
+        self.catalog = None  # Shared EventCatalog, set by load_events
+        self._include_intimate_events = False
+        self._contextual_cache = None  # (context, stat values, matched mask, matching events)
+        self._context_dirty = set()  # CONDITION_CONTEXT_GROUPS changed since the cached context
+        self._save_baseline = None  # What the save file holds, so the next save can append a delta
+        self.autosaver = None  # Background Autosaver writing this game's saves, if any
+        # Event and partner-action history: a recent window plus rollups of everything
+        self.event_history = self._new_history("events", HISTORY_ROLLUPS["event_history"])
+        self.partner_action_history = self._new_history("partner_actions", HISTORY_ROLLUPS["partner_action_history"])
+        # Daily stat and relationship time series, recorded as each day ends
+        self.stats_history = StatsHistory()
         self.load_events()
 
-    def load_events(self, include_intimate: bool = False):
-        """Load all event files from the events directory"""
-        event_files = [
-            "good_surprises.json",
-            "relationship_events.json",
-            "health_events.json",
-            "natural_disasters.json",
-            "milestones.json",
-            "complications.json",
-            "career_events.json",
-            "personal_growth.json"
-        ]
-
-        # Add intimate events if opted in
-        if include_intimate:
-            event_files.append("intimate_events.json")
-
-        for event_file in event_files:
-            category = event_file.replace(".json", "")
-            file_path = os.path.join(self.events_dir, event_file)
-            try:
-                with open(file_path, 'r') as f:
-                    self.events[category] = json.load(f)
-                print(f"[OK] Loaded {len(self.events[category])} events from {category}")
-            except FileNotFoundError:
-                print(f"[!] Warning: Could not find {event_file}")
-                self.events[category] = []
-
-        # Load story arcs
-        self.load_story_arcs()
-
-        # Load contextual events
-        self.load_contextual_events()
-
-        # Load partner actions for turn-based play
-        self.load_partner_actions()
-
-    def load_contextual_events(self):
-        """Load contextual/conditional events"""
-        self.contextual_events = []
-        ctx_file = os.path.join(self.events_dir, "contextual_events.json")
-        try:
-            with open(ctx_file, 'r') as f:
-                self.contextual_events = json.load(f)
-            print(f"[OK] Loaded {len(self.contextual_events)} contextual events")
-        except FileNotFoundError:
-            print(f"[!] Warning: Could not find contextual_events.json")
-            self.contextual_events = []
-
-    def load_story_arcs(self):
-        """Load multi-stage story arcs"""
-        self.story_arcs = []
-        arc_file = os.path.join(self.events_dir, "story_arcs.json")
-        try:
-            with open(arc_file, 'r') as f:
-                self.story_arcs = json.load(f)
-            print(f"[OK] Loaded {len(self.story_arcs)} story arcs")
-        except FileNotFoundError:
-            print(f"[!] Warning: Could not find story_arcs.json")
-            self.story_arcs = []
+    def seed_streams(self, day: int = 0):
+        """(Re)seed every random stream from the game seed, and the day when resuming a save"""
+        for name in RNG_STREAMS:
+            salt = f"{self.seed}:{name}" if day == 0 else f"{self.seed}:{name}:{day}"
+            self._rngs[name] = random.Random(salt)
+
+    def rng(self, stream: str) -> random.Random:
+        """Get one of this game's named random streams (see RNG_STREAMS)"""
+        return self._rngs[stream]
+
+    def _new_history(self, name: str, rollup_fields: tuple, fresh: bool = False) -> HistoryLog:
+        """Create an empty history log, spilling next to the save file if enabled.
+
+        Games in a save_store share one save_file name, so their spill files
+        also carry the session id. A fresh log (a new game) empties its file.
+        """
+        spill_path = None
+        if self.spill_history:
+            base = os.path.splitext(self.save_file)[0]
+            if self.save_store is not None:
+                base = f"{base}.{self.session_id}"
+            spill_path = f"{base}.{name}.jsonl"
+            if fresh:
+                open(spill_path, 'w').close()
+        return HistoryLog(rollup_fields, self.history_window, spill_path)
+
+    def announce(self, text: str):
+        """Print game narration, unless this simulator is running headless"""
+        if self.verbose:
+            safe_print(text)
 
-    def load_partner_actions(self):
-        """Load partner-initiated actions for turn-based play"""
-        self.partner_actions = []
-        action_file = os.path.join(self.events_dir, "partner_actions.json")
-        try:
-            with open(action_file, 'r') as f:
-                self.partner_actions = json.load(f)
-            print(f"[OK] Loaded {len(self.partner_actions)} partner actions")
-        except FileNotFoundError:
-            print(f"[!] Warning: Could not find partner_actions.json")
-            self.partner_actions = []
+    def load_events(self, include_intimate: bool = False):
+        """Attach the shared event catalog and choose whether intimate events are in the pool"""
+        self.catalog = get_event_catalog(self.events_dir)
+        self.set_intimate_events(include_intimate)
+
+    def set_intimate_events(self, include_intimate: bool):
+        """Choose whether intimate events are in this game's pool"""
+        self._include_intimate_events = include_intimate
+        self._contextual_cache = None
+
+    @property
+    def events(self) -> Mapping:
+        """Read-only {category: events} view of the catalog for this game"""
+        return self.catalog.category_view(self._include_intimate_events)
+
+    @property
+    def story_arcs(self) -> tuple:
+        """Multi-stage story arcs from the catalog"""
+        return self.catalog.story_arcs
+
+    @property
+    def contextual_events(self) -> tuple:
+        """Contextual/conditional events from the catalog"""
+        return self.catalog.contextual_events
+
+    @property
+    def partner_actions(self) -> tuple:
+        """Partner-initiated actions for turn-based play"""
+        return self.catalog.partner_actions
 
     def get_partner_action(self, partner: str) -> Optional[Dict[str, Any]]:
         """Get a random partner action for their turn"""
@@ -699,7 +2361,7 @@ class LifeSimulator:
 
         # Select based on weights
         total_weight = sum(w for _, w in weighted_actions)
-        r = random.uniform(0, total_weight)
+        r = self.rng("partners").uniform(0, total_weight)
         current = 0
         for action, weight in weighted_actions:
             current += weight
@@ -712,7 +2374,7 @@ class LifeSimulator:
                 return action_copy
 
         # Fallback to random
-        action = random.choice(self.partner_actions)
+        action = self.rng("partners").choice(self.partner_actions)
         action_copy = action.copy()
         action_copy["title"] = action_copy["title"].replace("{partner}", partner)
         action_copy["description"] = action_copy["description"].replace("{partner}", partner)
@@ -817,7 +2479,7 @@ class LifeSimulator:
 
         # Pick the highest scoring choice (with some randomness)
         # Add small random factor so it's not always identical
-        weighted_scores = [(i, s + random.uniform(0, 0.5)) for i, s in enumerate(scores)]
+        weighted_scores = [(i, s + self.rng("partners").uniform(0, 0.5)) for i, s in enumerate(scores)]
         weighted_scores.sort(key=lambda x: x[1], reverse=True)
 
         return weighted_scores[0][0]
@@ -833,20 +2495,17 @@ class LifeSimulator:
         success = roll >= dc
 
         if success:
-            effects = action.get("effects_success", action.get("effects", {})).copy()
+            base_effects = action.get("effects_success", action.get("effects", {}))
         else:
-            effects = action.get("effects_failure", {}).copy()
+            base_effects = action.get("effects_failure", {})
 
-        # Apply effects
-        for stat, change in effects.items():
-            if stat == "relationship":
-                current = self.partner_relationships.get(partner, 50)
-                self.partner_relationships[partner] = max(0, min(100, current + change))
-            elif stat in self.stats:
-                self.stats[stat] = max(0, min(100, self.stats[stat] + change))
+        # Apply effects (relationship changes go to the acting partner)
+        base_effects = compile_effects(base_effects)
+        self._apply_compiled_effects(base_effects, relationship_partner=partner, partner_only=True)
+        effects = base_effects.copy()
 
         # Record the action
-        self.game_data.setdefault("partner_actions_taken", []).append({
+        self.partner_action_history.append({
             "day": self.game_data["days_together"],
             "partner": partner,
             "action_id": action.get("id"),
@@ -870,7 +2529,7 @@ class LifeSimulator:
             "d100": 100
         }
         sides = dice_values.get(dice_type, 20)
-        return random.randint(1, sides)
+        return self.rng("dice").randint(1, sides)
 
     def get_average_relationship(self) -> float:
         """Get average relationship across all partners"""
@@ -892,26 +2551,24 @@ class LifeSimulator:
 
     def get_partner_traits(self, partner: str) -> List[str]:
         """Get traits for a partner"""
-        if partner in self.partner_data:
-            return self.partner_data[partner].get("traits", [])
-        return []
+        state = self.partner_data.get(partner)
+        return state.traits if state is not None else []
 
     def get_partner_mood(self, partner: str) -> str:
         """Get current mood for a partner"""
-        if partner in self.partner_data:
-            return self.partner_data[partner].get("mood", "content")
-        return "content"
+        state = self.partner_data.get(partner)
+        return state.mood if state is not None else "content"
 
     def set_partner_mood(self, partner: str, mood: str):
         """Set mood for a partner"""
         if partner in self.partner_data and mood in PARTNER_MOODS:
-            self.partner_data[partner]["mood"] = mood
+            self.partner_data[partner].mood = mood
+            self._context_dirty.add("partners")
 
     def get_partner_favorite(self, partner: str) -> str:
         """Get favorite quality time activity for a partner"""
-        if partner in self.partner_data:
-            return self.partner_data[partner].get("favorite", "deep_talk")
-        return "deep_talk"
+        state = self.partner_data.get(partner)
+        return state.favorite if state is not None else "deep_talk"
 
     def update_partner_mood(self, partner: str):
         """Update partner mood based on recent events and relationship"""
@@ -933,18 +2590,19 @@ class LifeSimulator:
             base_mood = "sad"
 
         # Anxious partners are more likely to be stressed
-        if "anxious" in traits and self.stats.get("stress", 0) > 50:
+        if "anxious" in traits and self.stats.stress > 50:
             if base_mood == "content":
                 base_mood = "stressed"
 
         # Random chance to shift mood (adds unpredictability)
-        if random.random() < 0.2:  # 20% chance of mood shift
+        if self.rng("partners").random() < 0.2:  # 20% chance of mood shift
             moods = list(PARTNER_MOODS.keys())
             # Weight toward base_mood
             weights = [3 if m == base_mood else 1 for m in moods]
-            base_mood = random.choices(moods, weights=weights)[0]
+            base_mood = self.rng("partners").choices(moods, weights=weights)[0]
 
-        self.partner_data[partner]["mood"] = base_mood
+        self.partner_data[partner].mood = base_mood
+        self._context_dirty.add("partners")
 
     def add_memory(self, memory_type: str, description: str, partners: List[str] = None):
         """Add a memory/milestone to the game"""
@@ -968,9 +2626,9 @@ class LifeSimulator:
                 "day": self.game_data["days_together"],
                 "description": description
             }
-            safe_print(f"\n*** ACHIEVEMENT UNLOCKED: {achievement_id} ***")
+            self.announce(f"\n*** ACHIEVEMENT UNLOCKED: {achievement_id} ***")
             if description:
-                safe_print(f"    {description}")
+                self.announce(f"    {description}")
             return True
         return False
 
@@ -1012,73 +2670,55 @@ class LifeSimulator:
         if difficulty == "cozy" and days >= 100:
             self.unlock_achievement("Cozy Life", "100 peaceful days on Cozy mode")
 
+    def draw_day_event(self) -> tuple:
+        """Pick today's event and its type: story arc > special event > random event"""
+        event = self.get_arc_event()
+        if event:
+            return event, "arc"
+        event = self.check_special_event()
+        if event:
+            return event, "special"
+        return self.get_random_event(), "normal"
+
     def get_random_event(self) -> Dict[str, Any]:
         """Select a random event from all categories, with relationship gating and weighting"""
-        all_events = []
         avg_relationship = self.get_average_relationship()
-        num_partners = len(self.partner_relationships)
-        difficulty = self.get_difficulty()
 
         # Check for contextual events first (40% chance to prioritize if available)
         contextual_matches = self.get_contextual_events()
-        if contextual_matches and random.random() < 0.4:
-            event = random.choice(contextual_matches)
+        if contextual_matches and self.rng("events").random() < 0.4:
+            event = self.rng("events").choice(contextual_matches)
             return self.personalize_contextual_event(event)
 
-        # Weight multiplier for relationship events based on partner count
-        relationship_weight = 1 + (num_partners - 1) * 0.5
+        entries, cumulative, total = self.get_sampling_table(avg_relationship)
 
-        # Crisis categories (negative events) - weighted by difficulty
-        crisis_categories = ["complications", "natural_disasters", "health_events"]
-
-        for category, events_list in self.events.items():
-            for event in events_list:
-                event_copy = event.copy()
-                event_copy['category'] = category
-
-                # Gate intimate events behind relationship thresholds
-                if category == "intimate_events":
-                    min_relationship = event_copy.get("min_relationship", 60)
-                    if avg_relationship < min_relationship:
-                        continue
-
-                # Determine how many copies to add (weighting)
-                copies = 1
-
-                # Relationship event weighting for multi-partner
-                if category == "relationship_events" and num_partners > 1:
-                    copies = int(relationship_weight)
-
-                # Crisis weighting based on difficulty
-                if category in crisis_categories:
-                    crisis_weight = difficulty["crisis_weight"]
-                    copies = max(1, int(copies * crisis_weight))
-
-                # Add the weighted copies
-                for _ in range(copies):
-                    all_events.append(event_copy.copy())
-
-        # Also add contextual events to the pool (lower weight)
-        for ctx_event in contextual_matches:
-            ctx_copy = ctx_event.copy()
-            ctx_copy['category'] = 'contextual'
-            all_events.append(ctx_copy)
-
-        if not all_events:
+        # Contextual events share the pool at weight 1 each (lower weight)
+        pool_size = total + len(contextual_matches)
+        if not pool_size:
             return None
 
         # Select event
-        event = random.choice(all_events)
+        r = self.rng("events").randrange(pool_size)
+        if r >= total:
+            return self.personalize_contextual_event(contextual_matches[r - total])
 
-        # Handle contextual vs regular events
-        if event.get('category') == 'contextual':
-            return self.personalize_contextual_event(event)
+        category, event = entries[bisect.bisect_right(cumulative, r)]
+        event = event.copy()
+        event['category'] = category
 
         # Add bonus relationship effects to positive events
         event = self.add_relationship_bonus(event)
 
         return self.personalize_event(event)
 
+    def get_sampling_table(self, avg_relationship: float = None) -> tuple:
+        """Get the catalog's (entries, cumulative weights, total) draw table for this game"""
+        if avg_relationship is None:
+            avg_relationship = self.get_average_relationship()
+        return self.catalog.sampling_table(self._include_intimate_events,
+                                           self.game_data.get("difficulty", "balanced"),
+                                           len(self.partner_relationships), avg_relationship)
+
     def add_relationship_bonus(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """Add small relationship bonuses to positive non-relationship events"""
         category = event.get("category", "")
@@ -1091,12 +2731,11 @@ class LifeSimulator:
         bonding_categories = ["good_surprises", "milestones", "personal_growth"]
 
         if category in bonding_categories:
-            effects = event.get("effects", {})
+            effects = compile_effects(event.get("effects", {}))
             # If the event is net positive (more gains than losses), add a small relationship boost
             net_effect = sum(v for k, v in effects.items() if k != "stress") - effects.get("stress", 0)
             if net_effect > 0 and "relationship" not in effects:
-                event["effects"] = effects.copy()
-                event["effects"]["relationship"] = 1  # Small boost for sharing good moments
+                event["effects"] = effects.with_effect("relationship", 1)  # Small boost for sharing good moments
                 event["group_event"] = True  # Good moments are shared with everyone
 
         return event
@@ -1118,7 +2757,7 @@ class LifeSimulator:
             partner_str = " and ".join(partners) if len(partners) > 1 else partners[0]
         else:
             # Pick a random partner for individual events
-            selected_partner = random.choice(partners)
+            selected_partner = self.rng("events").choice(partners)
             partner_str = selected_partner
             event_copy["involved_partner"] = selected_partner
 
@@ -1131,20 +2770,64 @@ class LifeSimulator:
 
     def apply_effects(self, effects: Dict[str, int], involved_partner: str = None):
         """Apply event effects to player stats and partner relationships"""
-        for stat, change in effects.items():
-            if stat == "relationship":
-                # Apply relationship changes
-                if involved_partner and involved_partner in self.partner_relationships:
+        self._apply_compiled_effects(effects, relationship_partner=involved_partner)
+
+    def _apply_compiled_effects(self, effects: Mapping, relationship_partner: str = None,
+                                partner_only: bool = False):
+        """Apply effects in one pass, clamping stats and relationships to 0-100.
+
+        A relationship change goes to relationship_partner if they are a
+        partner, otherwise to everyone; with partner_only it always goes to
+        relationship_partner.
+        """
+        stats = self.stats
+        relationships = self.partner_relationships
+        for stat, kind, value in compile_effects(effects).entries:
+            if kind == STAT_EFFECT:
+                total = getattr(stats, stat) + value
+                setattr(stats, stat, 0 if total < 0 else 100 if total > 100 else total)
+            elif kind == RELATIONSHIP_EFFECT:
+                if partner_only or relationship_partner in relationships:
                     # Single partner event - affect only that partner
-                    self.partner_relationships[involved_partner] = max(0, min(100,
-                        self.partner_relationships[involved_partner] + change))
+                    total = relationships.get(relationship_partner, 50) + value
+                    relationships[relationship_partner] = 0 if total < 0 else 100 if total > 100 else total
                 else:
                     # Group event or no specific partner - affect all partners
-                    for partner in self.partner_relationships:
-                        self.partner_relationships[partner] = max(0, min(100,
-                            self.partner_relationships[partner] + change))
-            elif stat in self.stats:
-                self.stats[stat] = max(0, min(100, self.stats[stat] + change))
+                    for partner, current in relationships.items():
+                        total = current + value
+                        relationships[partner] = 0 if total < 0 else 100 if total > 100 else total
+
+    def get_outcome_effects(self, event: Mapping[str, Any], success: bool) -> CompiledEffects:
+        """The effects an event resolves to on success or failure at the current difficulty"""
+        if event.get("effects_success") or event.get("effects_failure"):
+            # Events with explicit success/failure effects are only scaled by difficulty
+            positive, negative = 1, 1
+            if success and event.get("effects_success"):
+                base_effects = event["effects_success"]
+            elif not success and event.get("effects_failure"):
+                base_effects = event["effects_failure"]
+            else:
+                base_effects = event.get("effects", {})
+        else:
+            positive, negative = OUTCOME_SCALING[success]
+            base_effects = event.get("effects", {})
+        return compile_effects(base_effects).scaled(self.get_difficulty()["effect_multiplier"], positive, negative)
+
+    def preview_outcome(self, event: Mapping[str, Any]) -> Dict[str, Any]:
+        """The exact odds of an event and what each result would do, without rolling.
+
+        A d20 succeeds on any roll at or above the DC, so the chance is
+        (21 - DC) / 20 clamped to 0-1. The expected effects weigh both outcomes
+        by that chance, before stats and relationships are clamped to 0-100.
+        """
+        dc = event["roll_requirement"] + self.get_difficulty()["dc_modifier"]
+        chance = max(0, min(20, 21 - dc)) / 20
+        success = self.get_outcome_effects(event, True)
+        failure = self.get_outcome_effects(event, False)
+        expected = {stat: chance * success.get(stat, 0) + (1 - chance) * failure.get(stat, 0)
+                    for stat in {**success, **failure}}
+        return {"dc": dc, "success_chance": chance, "effects_success": success.copy(),
+                "effects_failure": failure.copy(), "expected_effects": expected}
 
     def get_stat_emoji(self, stat_name: str, value: int) -> str:
         """Get emoji representation of a stat"""
@@ -1236,55 +2919,24 @@ class LifeSimulator:
 
     def process_event_outcome(self, event: Dict[str, Any], roll: int, choice_index: int):
         """Process the outcome of an event based on dice roll and choice"""
-        difficulty = self.get_difficulty()
-        dc_modifier = difficulty["dc_modifier"]
-        effect_mult = difficulty["effect_multiplier"]
+        dc_modifier = self.get_difficulty()["dc_modifier"]
 
         # Adjust DC based on difficulty
         adjusted_dc = event["roll_requirement"] + dc_modifier
         success = roll >= adjusted_dc
 
-        # Check if event has separate success/failure effects (story arcs, special events)
-        if success and event.get("effects_success"):
-            base_effects = event["effects_success"]
-        elif not success and event.get("effects_failure"):
-            base_effects = event["effects_failure"]
+        if success:
+            self.announce(f"\n[d20] You rolled {roll}! (needed {adjusted_dc}) - SUCCESS!")
         else:
-            base_effects = event.get("effects", {})
+            self.announce(f"\n[d20] You rolled {roll}. (needed {adjusted_dc}) - The outcome is challenging...")
 
-        # Apply base effects, scaled by difficulty
-        effects = {}
-        for stat, value in base_effects.items():
-            effects[stat] = int(value * effect_mult)
-
-        # Modify effects based on success/failure (only if not using separate effect dicts)
-        if not (event.get("effects_success") or event.get("effects_failure")):
-            if success:
-                safe_print(f"\n[d20] You rolled {roll}! (needed {adjusted_dc}) - SUCCESS!")
-                # Success amplifies positive effects or reduces negative ones
-                for stat, value in effects.items():
-                    if value > 0:
-                        effects[stat] = int(value * 1.2)  # 20% bonus
-                    elif value < 0:
-                        effects[stat] = int(value * 0.8)  # 20% reduction in penalty
-            else:
-                safe_print(f"\n[d20] You rolled {roll}. (needed {adjusted_dc}) - The outcome is challenging...")
-                # Failure reduces positive effects or amplifies negative ones
-                for stat, value in effects.items():
-                    if value > 0:
-                        effects[stat] = int(value * 0.7)  # 30% reduction
-                    elif value < 0:
-                        effects[stat] = int(value * 1.3)  # 30% increase in penalty
-        else:
-            # Events with explicit success/failure effects
-            if success:
-                safe_print(f"\n[d20] You rolled {roll}! (needed {adjusted_dc}) - SUCCESS!")
-            else:
-                safe_print(f"\n[d20] You rolled {roll}. (needed {adjusted_dc}) - The outcome is challenging...")
+        # Look up the precomputed outcome for this event, difficulty and result
+        outcome = self.get_outcome_effects(event, success)
 
         # Get involved partner for relationship effects
         involved_partner = event.get("involved_partner")
-        self.apply_effects(effects, involved_partner)
+        self._apply_compiled_effects(outcome, involved_partner)
+        effects = outcome.copy()
 
         # Handle story arc progression
         if event.get("category") == "story_arc" and event.get("arc_id"):
@@ -1300,10 +2952,11 @@ class LifeSimulator:
             self.game_data["last_intimate_day"] = self.game_data["days_together"]
 
         # Record the event
-        self.game_data["events_experienced"].append({
+        self.event_history.append({
             "day": self.game_data["days_together"],
             "event_id": event["id"],
             "title": event["title"],
+            "category": event.get("category"),
             "roll": roll,
             "success": success,
             "choice": choice_index,
@@ -1322,10 +2975,16 @@ class LifeSimulator:
         self.game_data["difficulty"] = difficulty
         self.game_data["include_intimate"] = include_intimate
         self.game_data["days_together"] = 0
-        self.game_data["events_experienced"] = []
+        self.event_history.close()
+        self.partner_action_history.close()
+        self.event_history = self._new_history("events", HISTORY_ROLLUPS["event_history"], fresh=True)
+        self.partner_action_history = self._new_history("partner_actions", HISTORY_ROLLUPS["partner_action_history"],
+                                                        fresh=True)
+        self.stats_history = StatsHistory()
         self.game_data["start_date"] = datetime.now().isoformat()
         self.game_data["last_exciting_day"] = 0
         self.game_data["last_intimate_day"] = 0
+        self._save_baseline = None
 
         # Initialize partner relationships
         self.partner_relationships = {partner: 50 for partner in partners}
@@ -1339,40 +2998,41 @@ class LifeSimulator:
             else:
                 # Assign 1-2 random traits if not specified
                 available_traits = list(PARTNER_TRAITS.keys())
-                num_traits = random.randint(1, 2)
-                traits = random.sample(available_traits, num_traits)
+                num_traits = self.rng("partners").randint(1, 2)
+                traits = self.rng("partners").sample(available_traits, num_traits)
 
             # Assign random favorite activity
-            favorite = random.choice(QUALITY_TIME_ACTIVITIES)
+            favorite = self.rng("partners").choice(QUALITY_TIME_ACTIVITIES)
 
             # Assign love language
-            love_language = random.choice(list(LOVE_LANGUAGES.keys()))
+            love_language = self.rng("partners").choice(list(LOVE_LANGUAGES.keys()))
 
             # Assign conflict style
-            conflict_style = random.choice(list(CONFLICT_STYLES.keys()))
+            conflict_style = self.rng("partners").choice(list(CONFLICT_STYLES.keys()))
 
             # Generate backstory
             backstory = {
-                "dream": random.choice(BACKSTORY_ELEMENTS["dreams"]),
-                "fear": random.choice(BACKSTORY_ELEMENTS["fears"]),
-                "childhood": random.choice(BACKSTORY_ELEMENTS["childhood"]),
-                "past": random.choice(BACKSTORY_ELEMENTS["past_relationships"]),
+                "dream": self.rng("partners").choice(BACKSTORY_ELEMENTS["dreams"]),
+                "fear": self.rng("partners").choice(BACKSTORY_ELEMENTS["fears"]),
+                "childhood": self.rng("partners").choice(BACKSTORY_ELEMENTS["childhood"]),
+                "past": self.rng("partners").choice(BACKSTORY_ELEMENTS["past_relationships"]),
             }
 
-            self.partner_data[partner] = {
-                "traits": traits,
-                "mood": "content",
-                "favorite": favorite,
-                "love_language": love_language,
-                "conflict_style": conflict_style,
-                "backstory": backstory,
-                "backstory_revealed": [],  # Track which backstory elements have been revealed
-                "surprise_cooldown": 0,  # Days until they can plan another surprise
-            }
+            self.partner_data[partner] = PartnerState(
+                traits=traits,
+                mood="content",
+                favorite=favorite,
+                love_language=love_language,
+                conflict_style=conflict_style,
+                backstory=backstory,
+                backstory_revealed=[],  # Track which backstory elements have been revealed
+                surprise_cooldown=0,
+            )
 
         # Initialize achievements and memories
         self.achievements = {}
-        self.memories = []
+        self.memories.close()
+        self.memories = self._new_history("memories", HISTORY_ROLLUPS["memories"], fresh=True)
         self.active_arcs = []
 
         # Initialize new systems
@@ -1390,19 +3050,18 @@ class LifeSimulator:
             for i, p1 in enumerate(partners):
                 for p2 in partners[i+1:]:
                     # Metamours start with neutral-positive relationship
-                    self.metamour_relationships[(p1, p2)] = random.randint(45, 65)
+                    self.metamour_relationships[(p1, p2)] = self.rng("partners").randint(45, 65)
 
         # Add starting memory
         self.add_memory("beginning", "The start of our journey together", partners)
 
-        # Reload events with intimate option
-        self.load_events(include_intimate)
+        self.set_intimate_events(include_intimate)
 
         diff_label = DIFFICULTY_SETTINGS[difficulty]["label"].split(" - ")[0]
-        safe_print(f"\n* Starting a new life together! *")
-        safe_print(f"Player: {player_name}")
-        safe_print(f"Difficulty: {diff_label}")
-        safe_print(f"Season: {SEASONS[self.current_season]['label']} | Weather: {WEATHER_TYPES[self.current_weather]['label']}")
+        self.announce(f"\n* Starting a new life together! *")
+        self.announce(f"Player: {player_name}")
+        self.announce(f"Difficulty: {diff_label}")
+        self.announce(f"Season: {SEASONS[self.current_season]['label']} | Weather: {WEATHER_TYPES[self.current_weather]['label']}")
 
         for partner in partners:
             data = self.partner_data[partner]
@@ -1410,20 +3069,21 @@ class LifeSimulator:
             favorite = data["favorite"].replace("_", " ").title()
             love_lang = LOVE_LANGUAGES[data["love_language"]]["label"]
             conflict = CONFLICT_STYLES[data["conflict_style"]]["label"]
-            safe_print(f"\nPartner: {partner}")
-            safe_print(f"  Traits: {', '.join(trait_labels)}")
-            safe_print(f"  Love Language: {love_lang}")
-            safe_print(f"  Conflict Style: {conflict}")
-            safe_print(f"  Favorite activity: {favorite}")
+            self.announce(f"\nPartner: {partner}")
+            self.announce(f"  Traits: {', '.join(trait_labels)}")
+            self.announce(f"  Love Language: {love_lang}")
+            self.announce(f"  Conflict Style: {conflict}")
+            self.announce(f"  Favorite activity: {favorite}")
 
         if len(partners) > 1:
-            safe_print(f"\nConfiguration: {PARTNER_CONFIGS[partner_config]['label']}")
+            self.announce(f"\nConfiguration: {PARTNER_CONFIGS[partner_config]['label']}")
         if include_intimate:
-            safe_print(f"[18+] Intimate events: Enabled")
-        safe_print(f"\nYour journey begins...\n")
+            self.announce(f"[18+] Intimate events: Enabled")
+        self.announce(f"\nYour journey begins...\n")
 
     def next_day(self):
         """Progress to the next day"""
+        self.record_stats_history()
         self.game_data["days_together"] += 1
         difficulty = self.get_difficulty()
         volatility = difficulty["stat_volatility"]
@@ -1440,14 +3100,14 @@ class LifeSimulator:
         weather_data = WEATHER_TYPES.get(self.current_weather, {})
         mood_mod = weather_data.get("mood_bonus", 0)
         if mood_mod != 0:
-            self.stats["happiness"] = max(0, min(100, self.stats["happiness"] + mood_mod))
+            self.stats.happiness = max(0, min(100, self.stats.happiness + mood_mod))
 
         # Natural stat changes (life happens) - scaled by difficulty
         swing_chance = 0.3 + (volatility - 2) * 0.1
-        if random.random() < swing_chance:
-            stat = random.choice(list(self.stats.keys()))
-            change = random.randint(-volatility, volatility)
-            self.stats[stat] = max(0, min(100, self.stats[stat] + change))
+        if self.rng("drift").random() < swing_chance:
+            stat = self.rng("drift").choice(list(self.stats.keys()))
+            change = self.rng("drift").randint(-volatility, volatility)
+            setattr(self.stats, stat, max(0, min(100, getattr(self.stats, stat) + change)))
 
         # Daily relationship drift
         self.apply_relationship_drift()
@@ -1483,7 +3143,14 @@ class LifeSimulator:
         # Daily moment flavor text (30% chance)
         moment = self.get_daily_moment()
         if moment:
-            safe_print(f"\n  ~ {moment}")
+            self.announce(f"\n  ~ {moment}")
+
+    def record_stats_history(self):
+        """Record the stats and every partner relationship as of the end of the current day"""
+        values = self.stats.to_dict()
+        for partner, value in self.partner_relationships.items():
+            values[RELATIONSHIP_COLUMN.format(partner)] = value
+        self.stats_history.record(self.game_data["days_together"], values)
 
     def apply_trait_effects(self):
         """Apply daily effects based on partner traits"""
@@ -1521,51 +3188,51 @@ class LifeSimulator:
         if days % 30 == 0:
             months = days // 30
             self.add_memory("monthly", f"{months} month{'s' if months > 1 else ''} together!")
-            safe_print(f"\n*** {months} MONTH ANNIVERSARY! ***")
+            self.announce(f"\n*** {months} MONTH ANNIVERSARY! ***")
 
         # Yearly anniversary
         if days % 365 == 0:
             years = days // 365
             self.add_memory("yearly", f"{years} year{'s' if years > 1 else ''} together!")
-            safe_print(f"\n*** {years} YEAR ANNIVERSARY! ***")
+            self.announce(f"\n*** {years} YEAR ANNIVERSARY! ***")
 
     def apply_personal_growth(self):
         """Apply passive personal growth from life experiences"""
         days = self.game_data["days_together"]
-        current_growth = self.stats.get("personal_growth", 0)
+        current_growth = self.stats.personal_growth
         growth = 0
 
         # Small chance of growth just from living life (10% per day)
-        if random.random() < 0.10:
+        if self.rng("drift").random() < 0.10:
             growth += 1
 
         # Growth from surviving challenges (check recent events)
-        recent_events = self.game_data.get("events_experienced", [])[-7:]  # Last week
+        recent_events = self.event_history.recent(7)  # Last week
         challenges_faced = sum(1 for e in recent_events if not e.get("success", True))
         if challenges_faced >= 2:
             # Learning from failures
-            if random.random() < 0.3:
+            if self.rng("drift").random() < 0.3:
                 growth += 1
 
         # Growth from maintaining strong relationships
         avg_rel = self.get_average_relationship()
-        if avg_rel >= 70 and random.random() < 0.15:
+        if avg_rel >= 70 and self.rng("drift").random() < 0.15:
             growth += 1
 
         # Growth from recovering from hard times
-        if self.stats.get("stress", 0) > 60 and random.random() < 0.2:
+        if self.stats.stress > 60 and self.rng("drift").random() < 0.2:
             growth += 1  # Growing through adversity
 
         # Growth milestone achievements
         if current_growth == 0 and growth > 0:
-            safe_print("  [Personal Growth] You're starting to grow...")
+            self.announce("  [Personal Growth] You're starting to grow...")
 
         # Apply growth (capped at 100)
         if growth > 0:
-            self.stats["personal_growth"] = min(100, current_growth + growth)
+            self.stats.personal_growth = min(100, current_growth + growth)
 
         # Personal growth milestones
-        new_growth = self.stats["personal_growth"]
+        new_growth = self.stats.personal_growth
         if current_growth < 25 <= new_growth:
             self.unlock_achievement("Self-Aware", "Reached 25 personal growth")
         if current_growth < 50 <= new_growth:
@@ -1577,60 +3244,23 @@ class LifeSimulator:
 
     def _generate_support_network(self) -> List[Dict]:
         """Generate a random support network for the player"""
-        network = []
-        # Everyone gets a best friend
-        network.append({
-            "name": random.choice(["Alex", "Jordan", "Sam", "Riley", "Casey", "Morgan"]),
-            "type": "best_friend",
-            "relationship": random.randint(60, 80)
-        })
-        # Maybe family
-        if random.random() < 0.7:
-            network.append({
-                "name": random.choice(["Mom", "Dad", "Sibling", "Cousin"]),
-                "type": "family",
-                "relationship": random.randint(40, 70)
-            })
-        # Maybe therapist
-        if random.random() < 0.3:
-            network.append({
-                "name": "Dr. " + random.choice(["Chen", "Williams", "Garcia", "Smith"]),
-                "type": "therapist",
-                "relationship": 50
-            })
-        return network
+        return generate_support_network(self.rng("partners"))
 
     def _get_random_weather(self) -> str:
         """Get random weather based on season"""
-        season = getattr(self, 'current_season', 'spring')
-        if season == "winter":
-            weights = {"sunny": 1, "cloudy": 3, "rainy": 1, "stormy": 1, "snowy": 3, "perfect": 0}
-        elif season == "summer":
-            weights = {"sunny": 4, "cloudy": 2, "rainy": 1, "stormy": 1, "snowy": 0, "perfect": 2}
-        elif season == "spring":
-            weights = {"sunny": 2, "cloudy": 2, "rainy": 3, "stormy": 1, "snowy": 0, "perfect": 2}
-        else:  # fall
-            weights = {"sunny": 2, "cloudy": 3, "rainy": 2, "stormy": 1, "snowy": 0, "perfect": 1}
-
-        weather_list = list(weights.keys())
-        weight_list = list(weights.values())
-        return random.choices(weather_list, weights=weight_list)[0]
+        return random_weather(getattr(self, 'current_season', 'spring'), self.rng("weather"))
 
     def _get_current_season(self) -> str:
         """Get current season based on real date or game day"""
         # Use real month for immersion
-        month = datetime.now().month
-        for season, data in SEASONS.items():
-            if month in data["months"]:
-                return season
-        return "spring"
+        return season_for_month(datetime.now().month)
 
     def get_love_language_bonus(self, partner: str, event: Dict[str, Any]) -> int:
         """Calculate bonus/penalty based on love language match"""
         if partner not in self.partner_data:
             return 0
 
-        love_lang = self.partner_data[partner].get("love_language", "time")
+        love_lang = self.partner_data[partner].love_language
         lang_data = LOVE_LANGUAGES.get(love_lang, {})
         keywords = lang_data.get("event_keywords", [])
 
@@ -1646,179 +3276,147 @@ class LifeSimulator:
             return 1  # Partial match
         return 0
 
-    def check_event_conditions(self, event: Dict[str, Any]) -> bool:
-        """Check if a contextual event's conditions are met"""
-        conditions = event.get("conditions", {})
-        if not conditions:
-            return True
-
-        partners = self.game_data.get("partners", [])
-
-        # Check weather condition
-        if "weather" in conditions:
-            if self.current_weather not in conditions["weather"]:
-                return False
-
-        # Check season condition
-        if "season" in conditions:
-            if self.current_season != conditions["season"]:
-                return False
-
-        # Check partner mood condition
-        if "partner_mood" in conditions:
-            mood_match = False
-            for partner in partners:
-                mood = self.get_partner_mood(partner)
-                if mood in conditions["partner_mood"]:
-                    mood_match = True
-                    break
-            if not mood_match:
-                return False
-
-        # Check partner traits condition
-        if "partner_traits" in conditions:
-            trait_match = False
-            for partner in partners:
-                traits = self.get_partner_traits(partner)
-                for trait in conditions["partner_traits"]:
-                    if trait in traits:
-                        trait_match = True
-                        break
-                if trait_match:
-                    break
-            if not trait_match:
-                return False
-
-        # Check partner love language condition
-        if "partner_love_language" in conditions:
-            lang_match = False
-            for partner in partners:
-                lang = self.partner_data.get(partner, {}).get("love_language", "")
-                if lang == conditions["partner_love_language"]:
-                    lang_match = True
-                    break
-            if not lang_match:
-                return False
-
-        # Check player stat conditions
-        if "player_stat" in conditions:
-            for stat, requirement in conditions["player_stat"].items():
-                value = self.stats.get(stat, 50)
-                if "min" in requirement and value < requirement["min"]:
-                    return False
-                if "max" in requirement and value > requirement["max"]:
-                    return False
-
-        # Check relationship level conditions
-        if "relationship" in conditions:
-            avg_rel = self.get_average_relationship()
-            req = conditions["relationship"]
-            if "min" in req and avg_rel < req["min"]:
-                return False
-            if "max" in req and avg_rel > req["max"]:
-                return False
-
-        # Check energy conditions
-        if "energy" in conditions:
-            req = conditions["energy"]
-            if "min" in req and self.energy < req["min"]:
-                return False
-            if "max" in req and self.energy > req["max"]:
-                return False
-
-        # Check for inside jokes
-        if conditions.get("has_inside_jokes") and not self.inside_jokes:
-            return False
-
-        # Check for active goals
-        if conditions.get("has_active_goal"):
-            active_goals = [g for g, d in self.shared_goals.items() if d.get("active")]
-            if not active_goals:
-                return False
+    def check_event_conditions(self, event: Mapping[str, Any]) -> bool:
+        """Check if a contextual event's conditions are met, compiling them like the catalog does"""
+        context = self.get_condition_context()
+        return all(predicate(context) for _, predicate in compile_event_conditions(event.get("conditions", {})))
 
-        # Check for metamours
-        if conditions.get("has_metamours") and len(partners) <= 1:
-            return False
+    def get_condition_context(self) -> Dict[str, Any]:
+        """Compute the shared inputs contextual conditions read, once per evaluation pass"""
+        context = self._numeric_condition_context()
+        for group in CONDITION_CONTEXT_GROUPS:
+            context.update(self._condition_context_group(group))
+        return context
 
-        # Check metamour relationship level
-        if "metamour_relationship" in conditions and self.metamour_relationships:
-            req = conditions["metamour_relationship"]
-            # Check any metamour pair
-            match = False
-            for pair, rel in self.metamour_relationships.items():
-                if "min" in req and rel >= req["min"]:
-                    match = True
-                    break
-                if "max" in req and rel <= req["max"]:
-                    match = True
-                    break
-            if not match:
-                return False
+    def mark_context_dirty(self, *groups: str):
+        """Note that state behind these CONDITION_CONTEXT_GROUPS (default: all) changed outside the usual mutators"""
+        self._context_dirty.update(groups or CONDITION_CONTEXT_GROUPS)
 
-        # Check for support network
-        if conditions.get("has_support_network") and not self.support_network:
-            return False
+    def _numeric_condition_context(self) -> Dict[str, Any]:
+        """The condition-context entries read straight from numeric state on every pass"""
+        avg_rel = self.get_average_relationship()
+        return {
+            "stats": self.stats,
+            "relationship": avg_rel,
+            "energy": self.energy,
+            "days_together": self.game_data.get("days_together", 0),
+            "conflict_active": avg_rel < 40 or self.stats.stress > 65,
+        }
 
-        # Check for unrevealed backstory
-        if conditions.get("backstory_unrevealed"):
-            has_unrevealed = False
+    def _condition_context_group(self, group: str) -> Dict[str, Any]:
+        """Compute the condition-context entries of one CONDITION_CONTEXT_GROUPS group"""
+        if group == "weather":
+            return {"weather": self.current_weather}
+        if group == "season":
+            return {"season": self.current_season}
+        if group == "partners":
+            partners = self.game_data.get("partners", [])
+            moods = set()
+            traits = set()
+            love_languages = set()
+            backstory_unrevealed = False
             for partner in partners:
-                data = self.partner_data.get(partner, {})
-                backstory = data.get("backstory", {})
-                revealed = data.get("backstory_revealed", [])
-                if len(revealed) < len(backstory):
-                    has_unrevealed = True
-                    break
-            if not has_unrevealed:
-                return False
-
-        # Check days together condition
-        if "days_together" in conditions:
-            days = self.game_data.get("days_together", 0)
-            req = conditions["days_together"]
-            if isinstance(req, dict):
-                if "min" in req and days < req["min"]:
-                    return False
-                if "max" in req and days > req["max"]:
-                    return False
-            elif isinstance(req, int) and days < req:
-                return False
-
-        # Check personal growth as direct condition (outside player_stat)
-        if "personal_growth" in conditions:
-            growth = self.stats.get("personal_growth", 0)
-            req = conditions["personal_growth"]
-            if isinstance(req, dict):
-                if "min" in req and growth < req["min"]:
-                    return False
-                if "max" in req and growth > req["max"]:
-                    return False
-
-        # Check if conflict is active (proxy: low relationship or high stress)
-        if conditions.get("conflict_active"):
-            avg_rel = self.get_average_relationship()
-            stress = self.stats.get("stress", 50)
-            if not (avg_rel < 40 or stress > 65):
-                return False
-
-        # Check if surprise can be planned
-        if conditions.get("can_surprise"):
-            # Check that we have pending_surprises attribute and partners
-            if not hasattr(self, 'pending_surprises'):
-                return False
-            # Limit active surprises to prevent spam
-            if len(self.pending_surprises) >= 2:
-                return False
-
-        return True
+                data = self.partner_data.get(partner)
+                if data is None:
+                    moods.add("content")
+                    love_languages.add("")
+                    continue
+                moods.add(data.get("mood", "content"))
+                traits.update(data.get("traits", ()))
+                love_languages.add(data.get("love_language", ""))
+                if len(data.get("backstory_revealed", ())) < len(data.get("backstory", ())):
+                    backstory_unrevealed = True
+            return {"partner_mood": moods, "partner_traits": traits, "partner_love_language": love_languages,
+                    "backstory_unrevealed": backstory_unrevealed, "has_metamours": len(partners) > 1}
+        if group == "goals":
+            return {"has_active_goal": any(goal.get("active") for goal in self.shared_goals.values())}
+        if group == "metamours":
+            return {"metamour_relationship": list(self.metamour_relationships.values())}
+        if group == "inside_jokes":
+            return {"has_inside_jokes": bool(self.inside_jokes)}
+        if group == "support_network":
+            return {"has_support_network": bool(self.support_network)}
+        if group == "surprises":
+            return {"can_surprise": len(self.pending_surprises) < 2}
+        raise KeyError(group)
+
+    def get_contextual_candidates(self, context: Dict[str, Any] = None) -> int:
+        """Get a bitmask of contextual events whose discrete conditions all match"""
+        if context is None:
+            context = self.get_condition_context()
+        index = self.catalog.contextual_index
+        free = index["free"]
+
+        candidates = index["all"]
+        for key, key_postings in index["postings"].items():
+            value = context[key]
+            allowed = free[key]
+            if key in CONTEXTUAL_FLAG_CONDITIONS:
+                if value:
+                    continue
+            elif isinstance(value, str):
+                allowed |= key_postings.get(value, 0)
+            else:
+                for v in value:
+                    allowed |= key_postings.get(v, 0)
+            candidates &= allowed
+        return candidates
 
     def get_contextual_events(self) -> List[Dict[str, Any]]:
-        """Get all contextual events that match current conditions"""
-        matching = []
-        for event in self.contextual_events:
-            if self.check_event_conditions(event):
-                matching.append(event)
-        return matching
+        """Get all contextual events that match current conditions.
+
+        The match set and condition context are cached between calls. Each pass
+        recomputes only the context groups marked dirty since the last one, plus
+        the cheap numeric entries, and re-checks just the events that read an
+        entry whose value changed, so stable days skip condition work entirely.
+        """
+        dependents = self.catalog.contextual_dependents
+        stats = self.stats.values()
+
+        cache = self._contextual_cache
+        if cache is None:
+            context = self.get_condition_context()
+            self._context_dirty.clear()
+            matched = 0
+            dirty = self.catalog.contextual_index["all"]
+        else:
+            context, last_stats, matched, matching = cache
+            dirty = 0
+            updates = self._numeric_condition_context()
+            for group in self._context_dirty:
+                updates.update(self._condition_context_group(group))
+            self._context_dirty.clear()
+            context["stats"] = self.stats
+            for key, value in updates.items():
+                if key != "stats" and value != context[key]:
+                    context[key] = value
+                    dirty |= dependents.get(key, 0)
+            if stats != last_stats:
+                for stat, value, last in zip(STAT_NAMES, stats, last_stats):
+                    if value != last:
+                        dirty |= dependents.get(f"stats.{stat}", 0)
+            if not dirty:
+                self._contextual_cache = (context, stats, matched, matching)
+                return list(matching)
+
+        matched = (matched & ~dirty) | self._match_contextual_events(context, dirty)
+        events = self.contextual_events
+        matching = [events[i] for i in iter_mask_bits(matched)]
+        self._contextual_cache = (context, stats, matched, matching)
+        return list(matching)
+
+    def _match_contextual_events(self, context: Dict[str, Any], scope: int) -> int:
+        """Evaluate the contextual events in a scope mask, returning the mask that matches"""
+        range_predicates = self.catalog.contextual_range_predicates
+        matched = 0
+        # Only events whose discrete keys match are checked; range conditions decide the rest
+        for i in iter_mask_bits(self.get_contextual_candidates(context) & scope):
+            for pred in range_predicates[i]:
+                if not pred(context):
+                    break
+            else:
+                matched |= 1 << i
+        return matched
 
     def personalize_contextual_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """Personalize a contextual event with dynamic content"""
@@ -1827,25 +3425,25 @@ class LifeSimulator:
 
         # Replace {partner} placeholder
         if partners:
-            partner = random.choice(partners)
+            partner = self.rng("events").choice(partners)
             event_copy["description"] = event_copy["description"].replace("{partner}", partner)
             event_copy["involved_partner"] = partner
 
         # Replace {support_person} placeholder
         if self.support_network and "{support_person}" in event_copy.get("description", ""):
-            person = random.choice(self.support_network)
+            person = self.rng("events").choice(self.support_network)
             event_copy["description"] = event_copy["description"].replace("{support_person}", person["name"])
 
         # Replace {inside_joke} placeholder
         if self.inside_jokes and "{inside_joke}" in event_copy.get("description", ""):
-            joke = random.choice(self.inside_jokes)
+            joke = self.rng("events").choice(self.inside_jokes)
             event_copy["description"] = event_copy["description"].replace("{inside_joke}", joke["joke"])
 
         # Replace metamour placeholders
         if self.metamour_relationships:
             pairs = list(self.metamour_relationships.keys())
             if pairs:
-                pair = random.choice(pairs)
+                pair = self.rng("events").choice(pairs)
                 event_copy["description"] = event_copy["description"].replace("{partner1}", pair[0])
                 event_copy["description"] = event_copy["description"].replace("{partner2}", pair[1])
 
@@ -1857,8 +3455,9 @@ class LifeSimulator:
     def update_weather(self):
         """Update weather for the new day"""
         # 70% chance weather stays same, 30% it changes
-        if random.random() < 0.3:
+        if self.rng("weather").random() < 0.3:
             self.current_weather = self._get_random_weather()
+            self._context_dirty.add("weather")
 
     def update_season(self):
         """Check if season should change (every ~30 days)"""
@@ -1867,25 +3466,26 @@ class LifeSimulator:
             seasons = list(SEASONS.keys())
             current_idx = seasons.index(self.current_season)
             self.current_season = seasons[(current_idx + 1) % 4]
-            safe_print(f"\n*** Season changed to {SEASONS[self.current_season]['label']}! ***")
+            self._context_dirty.add("season")
+            self.announce(f"\n*** Season changed to {SEASONS[self.current_season]['label']}! ***")
 
     def get_daily_moment(self) -> Optional[str]:
         """Get a random daily moment (30% chance)"""
-        if random.random() > 0.3:
+        if self.rng("events").random() > 0.3:
             return None
 
         partners = self.game_data.get("partners", [])
         if not partners:
             return None
 
-        moment = random.choice(DAILY_MOMENTS)
-        partner = random.choice(partners)
+        moment = self.rng("events").choice(DAILY_MOMENTS)
+        partner = self.rng("events").choice(partners)
         return moment.replace("{partner}", partner)
 
     def reset_daily_energy(self):
         """Reset energy at start of day, modified by sleep quality and stress"""
         base_energy = 100
-        stress = self.stats.get("stress", 0)
+        stress = self.stats.stress
 
         # High stress reduces starting energy
         if stress > 70:
@@ -1912,7 +3512,7 @@ class LifeSimulator:
     def maybe_create_inside_joke(self, event: Dict[str, Any], partner: str):
         """Maybe create an inside joke from a memorable event"""
         # Only create jokes from fun/memorable events
-        if random.random() > 0.1:  # 10% chance
+        if self.rng("events").random() > 0.1:  # 10% chance
             return
 
         if len(self.inside_jokes) >= 10:  # Cap at 10 jokes
@@ -1925,11 +3525,12 @@ class LifeSimulator:
         ]
 
         joke = {
-            "joke": random.choice(templates),
+            "joke": self.rng("events").choice(templates),
             "day_created": self.game_data["days_together"],
             "partner": partner
         }
         self.inside_jokes.append(joke)
+        self._context_dirty.add("inside_jokes")
 
     def check_partner_surprise(self):
         """Check if any partner is planning/revealing a surprise"""
@@ -1940,18 +3541,18 @@ class LifeSimulator:
             if surprise["day_reveal"] <= days:
                 self._reveal_surprise(surprise)
                 self.pending_surprises.remove(surprise)
+                self._context_dirty.add("surprises")
 
         # Check if partners want to plan surprises
         for partner in self.partner_relationships:
             rel = self.partner_relationships[partner]
-            cooldown = self.partner_data[partner].get("surprise_cooldown", 0)
-
-            if cooldown > 0:
-                self.partner_data[partner]["surprise_cooldown"] = cooldown - 1
+            state = self.partner_data[partner]
+            if state.surprise_cooldown > 0:
+                state.surprise_cooldown -= 1
                 continue
 
             # High relationship = more likely to plan surprises
-            if rel >= 60 and random.random() < 0.05:  # 5% chance per day
+            if rel >= 60 and self.rng("surprises").random() < 0.05:  # 5% chance per day
                 self._plan_surprise(partner)
 
     def _plan_surprise(self, partner: str):
@@ -1959,12 +3560,13 @@ class LifeSimulator:
         surprise_types = ["gift", "date", "gesture", "memory"]
         surprise = {
             "partner": partner,
-            "type": random.choice(surprise_types),
+            "type": self.rng("surprises").choice(surprise_types),
             "day_planned": self.game_data["days_together"],
-            "day_reveal": self.game_data["days_together"] + random.randint(2, 5)
+            "day_reveal": self.game_data["days_together"] + self.rng("surprises").randint(2, 5)
         }
         self.pending_surprises.append(surprise)
-        self.partner_data[partner]["surprise_cooldown"] = 14  # 2 week cooldown
+        self._context_dirty.add("surprises")
+        self.partner_data[partner].surprise_cooldown = 14  # 2 week cooldown
 
     def _reveal_surprise(self, surprise: Dict):
         """Reveal a partner's surprise"""
@@ -1978,42 +3580,45 @@ class LifeSimulator:
             "memory": f"{partner} recreates a favorite memory from your time together!"
         }
 
-        safe_print(f"\n*** SURPRISE! ***")
-        safe_print(messages.get(surprise_type, f"{partner} surprises you!"))
+        self.announce(f"\n*** SURPRISE! ***")
+        self.announce(messages.get(surprise_type, f"{partner} surprises you!"))
 
         # Apply effects
         self.partner_relationships[partner] = min(100, self.partner_relationships[partner] + 3)
-        self.stats["happiness"] = min(100, self.stats["happiness"] + 3)
+        self.stats.happiness = min(100, self.stats.happiness + 3)
         self.add_memory("surprise", f"{partner}'s surprise: {surprise_type}", [partner])
 
     def maybe_reveal_backstory(self, partner: str):
         """Maybe reveal a backstory element during deep moments"""
-        if random.random() > 0.15:  # 15% chance during appropriate moments
+        if self.rng("events").random() > 0.15:  # 15% chance during appropriate moments
             return
 
-        data = self.partner_data.get(partner, {})
-        backstory = data.get("backstory", {})
-        revealed = data.get("backstory_revealed", [])
+        state = self.partner_data.get(partner)
+        if state is None:
+            return
+        backstory = state.backstory
+        revealed = state.backstory_revealed
 
         # Find unrevealed elements
         unrevealed = [k for k in backstory.keys() if k not in revealed]
         if not unrevealed:
             return
 
-        element = random.choice(unrevealed)
+        element = self.rng("events").choice(unrevealed)
         content = backstory[element]
 
-        safe_print(f"\n[{partner} opens up]")
+        self.announce(f"\n[{partner} opens up]")
         if element == "dream":
-            safe_print(f"  {partner} tells you they've {content}...")
+            self.announce(f"  {partner} tells you they've {content}...")
         elif element == "fear":
-            safe_print(f"  {partner} admits they're {content}...")
+            self.announce(f"  {partner} admits they're {content}...")
         elif element == "childhood":
-            safe_print(f"  {partner} shares that they {content}...")
+            self.announce(f"  {partner} shares that they {content}...")
         elif element == "past":
-            safe_print(f"  {partner} reveals they {content}...")
+            self.announce(f"  {partner} reveals they {content}...")
 
-        self.partner_data[partner]["backstory_revealed"].append(element)
+        revealed.append(element)
+        self._context_dirty.add("partners")
         self.partner_relationships[partner] = min(100, self.partner_relationships[partner] + 2)
         self.add_memory("backstory", f"{partner} shared about their {element}", [partner])
 
@@ -2024,10 +3629,10 @@ class LifeSimulator:
 
         for pair, rel in self.metamour_relationships.items():
             # Small random drift
-            drift = random.randint(-1, 1)
+            drift = self.rng("drift").randint(-1, 1)
 
             # Influenced by household harmony
-            harmony = self.stats.get("household_harmony", 50)
+            harmony = self.stats.household_harmony
             if harmony > 60:
                 drift += 1
             elif harmony < 40:
@@ -2035,6 +3640,7 @@ class LifeSimulator:
 
             new_rel = max(0, min(100, rel + drift))
             self.metamour_relationships[pair] = new_rel
+            self._context_dirty.add("metamours")
 
             # Achievement for metamour harmony
             if new_rel >= 80:
@@ -2058,7 +3664,7 @@ class LifeSimulator:
         goal_def = SHARED_GOALS.get(goal_id, {})
         goal_data = self.shared_goals.get(goal_id, {})
 
-        safe_print(f"\n*** GOAL ACHIEVED: {goal_def.get('label', goal_id)}! ***")
+        self.announce(f"\n*** GOAL ACHIEVED: {goal_def.get('label', goal_id)}! ***")
 
         # Apply rewards
         if "reward_relationship" in goal_def:
@@ -2067,17 +3673,18 @@ class LifeSimulator:
                     self.partner_relationships[partner] + goal_def["reward_relationship"])
 
         if "reward_happiness" in goal_def:
-            self.stats["happiness"] = min(100, self.stats["happiness"] + goal_def["reward_happiness"])
+            self.stats.happiness = min(100, self.stats.happiness + goal_def["reward_happiness"])
 
         if "reward_health" in goal_def:
-            self.stats["health"] = min(100, self.stats["health"] + goal_def["reward_health"])
+            self.stats.health = min(100, self.stats.health + goal_def["reward_health"])
 
         if "reward_personal_growth" in goal_def:
-            self.stats["personal_growth"] = min(100,
-                self.stats["personal_growth"] + goal_def["reward_personal_growth"])
+            self.stats.personal_growth = min(100,
+                self.stats.personal_growth + goal_def["reward_personal_growth"])
 
         goal_data["active"] = False
         goal_data["completed"] = True
+        self._context_dirty.add("goals")
         goal_data["completed_day"] = self.game_data["days_together"]
 
         self.add_memory("goal", f"Achieved: {goal_def.get('label', goal_id)}")
@@ -2096,9 +3703,10 @@ class LifeSimulator:
             "active": True,
             "started_day": self.game_data["days_together"]
         }
+        self._context_dirty.add("goals")
         goal_def = SHARED_GOALS[goal_id]
-        safe_print(f"\n*** NEW GOAL: {goal_def['label']} ***")
-        safe_print(f"    {goal_def['description']}")
+        self.announce(f"\n*** NEW GOAL: {goal_def['label']} ***")
+        self.announce(f"    {goal_def['description']}")
         return True
 
     # ================== STORY ARCS ==================
@@ -2119,7 +3727,7 @@ class LifeSimulator:
         drama_modifier = difficulty.get("crisis_weight", 1.0)
         trigger_chance = base_chance * drama_modifier
 
-        if random.random() > trigger_chance:
+        if self.rng("events").random() > trigger_chance:
             return False
 
         # Pick a random arc that isn't on cooldown
@@ -2130,14 +3738,14 @@ class LifeSimulator:
         if not available_arcs:
             return False
 
-        arc = random.choice(available_arcs)
-        self.active_arcs.append({
-            "arc_id": arc["id"],
-            "stage": 1,
-            "started_day": self.game_data["days_together"],
-            "next_stage_day": self.game_data["days_together"] + arc["stages"][0].get("next_stage_delay", 3)
-        })
-        safe_print(f"\n*** STORY ARC BEGINS: {arc['title']} ***")
+        arc = self.rng("events").choice(available_arcs)
+        self.active_arcs.append(ArcProgress(
+            arc["id"],
+            stage=1,
+            started_day=self.game_data["days_together"],
+            next_stage_day=self.game_data["days_together"] + arc["stages"][0].get("next_stage_delay", 3),
+        ))
+        self.announce(f"\n*** STORY ARC BEGINS: {arc['title']} ***")
         return True
 
     def get_arc_event(self) -> Optional[Dict[str, Any]]:
@@ -2147,11 +3755,11 @@ class LifeSimulator:
 
         current_day = self.game_data["days_together"]
         arc_data = self.active_arcs[0]
-        arc_id = arc_data["arc_id"]
-        stage = arc_data["stage"]
+        arc_id = arc_data.arc_id
+        stage = arc_data.stage
 
         # Check if it's time for this stage
-        if current_day < arc_data.get("next_stage_day", current_day):
+        if current_day < arc_data.next_stage_day:
             return None
 
         # Find the arc definition
@@ -2194,8 +3802,8 @@ class LifeSimulator:
 
     def progress_arc(self, arc_id: str, success: bool):
         """Progress or complete a story arc after an event"""
-        for i, arc_data in enumerate(self.active_arcs):
-            if arc_data["arc_id"] == arc_id:
+        for arc_data in self.active_arcs:
+            if arc_data.arc_id == arc_id:
                 # Find arc definition
                 arc_def = None
                 for arc in self.story_arcs:
@@ -2206,7 +3814,7 @@ class LifeSimulator:
                 if not arc_def:
                     return
 
-                current_stage = arc_data["stage"]
+                current_stage = arc_data.stage
                 max_stage = len(arc_def["stages"])
 
                 if current_stage >= max_stage:
@@ -2218,17 +3826,17 @@ class LifeSimulator:
                     stage_def = arc_def["stages"][current_stage]  # Current stage for delay
                     delay = stage_def.get("next_stage_delay", 3)
 
-                    self.active_arcs[i]["stage"] = next_stage
-                    self.active_arcs[i]["next_stage_day"] = self.game_data["days_together"] + delay
+                    arc_data.stage = next_stage
+                    arc_data.next_stage_day = self.game_data["days_together"] + delay
 
-                    safe_print(f"\n[Story Arc] {arc_def['title']} - Stage {next_stage} coming in {delay} days...")
+                    self.announce(f"\n[Story Arc] {arc_def['title']} - Stage {next_stage} coming in {delay} days...")
                 break
 
     def complete_arc(self, arc_id: str, success: bool):
         """Complete a story arc and apply final effects"""
         # Find and remove from active arcs
         for i, arc_data in enumerate(self.active_arcs):
-            if arc_data["arc_id"] == arc_id:
+            if arc_data.arc_id == arc_id:
                 self.active_arcs.pop(i)
                 break
 
@@ -2246,7 +3854,7 @@ class LifeSimulator:
 
         if arc_def:
             outcome = "RESOLVED" if success else "WEATHERED"
-            safe_print(f"\n*** STORY ARC {outcome}: {arc_def['title']} ***")
+            self.announce(f"\n*** STORY ARC {outcome}: {arc_def['title']} ***")
             self.add_memory("story_arc", f"Story arc '{arc_def['title']}' - {'Success' if success else 'Struggled through'}")
 
             # Achievement for completing arcs
@@ -2274,7 +3882,7 @@ class LifeSimulator:
         # Base 15% chance, increased by crisis weight
         cascade_chance = 0.15 * (crisis_weight - 1.0)
 
-        if random.random() > cascade_chance:
+        if self.rng("events").random() > cascade_chance:
             return None
 
         # Get a complication or disaster event
@@ -2288,12 +3896,12 @@ class LifeSimulator:
             return None
 
         # Pick a cascade event
-        cascade = random.choice(cascade_events).copy()
+        cascade = self.rng("events").choice(cascade_events).copy()
         cascade["category"] = "crisis_cascade"
         cascade["title"] = f"[CASCADE] {cascade['title']}"
         cascade["description"] = f"Things go from bad to worse... {cascade['description']}"
 
-        safe_print(f"\n!!! CRISIS CASCADE !!! One problem leads to another...")
+        self.announce(f"\n!!! CRISIS CASCADE !!! One problem leads to another...")
         return self.personalize_event(cascade)
 
     # ================== SPECIAL/RARE EVENTS ==================
@@ -2376,8 +3984,8 @@ class LifeSimulator:
                 })
 
         # Random chance for any special event
-        if special_events and random.random() < 0.15:  # 15% chance when conditions met
-            event = random.choice(special_events)
+        if special_events and self.rng("events").random() < 0.15:  # 15% chance when conditions met
+            event = self.rng("events").choice(special_events)
             return self.personalize_event(event)
 
         return None
@@ -2391,7 +3999,7 @@ class LifeSimulator:
         drift_range = difficulty["drift_range"]
         recovery_bonus = difficulty["recovery_bonus"]
 
-        harmony = self.stats.get("household_harmony", 50)
+        harmony = self.stats.household_harmony
         num_partners = len(self.partner_relationships)
 
         for partner in self.partner_relationships:
@@ -2401,14 +4009,14 @@ class LifeSimulator:
             harmony_factor = (harmony - 50) / 100  # -0.5 to +0.5
 
             # Random daily fluctuation scaled by difficulty
-            drift = random.randint(-drift_range, drift_range) + round(harmony_factor * drift_range)
+            drift = self.rng("drift").randint(-drift_range, drift_range) + round(harmony_factor * drift_range)
 
             # Recovery mechanics scaled by difficulty
-            if current < 40 and random.random() < 0.3:
+            if current < 40 and self.rng("drift").random() < 0.3:
                 drift += recovery_bonus  # Can be negative on chaotic!
 
             # High relationships harder to maintain
-            if current > 80 and random.random() < 0.3:
+            if current > 80 and self.rng("drift").random() < 0.3:
                 drift -= 1
 
             # Apply the drift
@@ -2418,7 +4026,7 @@ class LifeSimulator:
         if num_partners > 1:
             avg_rel = sum(self.partner_relationships.values()) / num_partners
             harmony_drift = round((avg_rel - 50) / 25 * (drift_range / 2))
-            self.stats["household_harmony"] = max(0, min(100, harmony + harmony_drift))
+            self.stats.household_harmony = max(0, min(100, harmony + harmony_drift))
 
     def quality_time(self, partner_names: List[str], activity: str = None) -> Dict[str, int]:
         """Spend quality time with selected partner(s), boosting their relationship"""
@@ -2462,7 +4070,7 @@ class LifeSimulator:
 
                 # Personal growth from meaningful activities
                 if activity == "deep_talk":
-                    self.stats["personal_growth"] = min(100, self.stats.get("personal_growth", 0) + 1)
+                    self.stats.personal_growth = min(100, self.stats.personal_growth + 1)
                     effects["personal_growth"] = effects.get("personal_growth", 0) + 1
 
                 # Mood modifier
@@ -2488,7 +4096,7 @@ class LifeSimulator:
                 elif "extrovert" in traits:
                     neglect_chance = 0.5
 
-                if random.random() < neglect_chance:
+                if self.rng("partners").random() < neglect_chance:
                     penalty = -1
                     if "extrovert" in traits:
                         penalty = PARTNER_TRAITS["extrovert"].get("neglect_penalty", -2)
@@ -2498,19 +4106,20 @@ class LifeSimulator:
 
         return effects
 
-    def save_game(self):
-        """Save current game state"""
+    def _snapshot_state(self) -> Dict[str, Any]:
+        """Collect the full game state as JSON-ready data (what save_game writes)"""
         # Convert tuple keys to strings for JSON serialization
         metamour_json = {f"{k[0]}|{k[1]}": v for k, v in self.metamour_relationships.items()}
 
-        save_data = {
+        return {
+            "save_version": SAVE_VERSION,
             "game_data": self.game_data,
-            "stats": self.stats,
+            "stats": self.stats.to_dict(),
             "partner_relationships": self.partner_relationships,
-            "partner_data": self.partner_data,
+            "partner_data": {partner: state.to_dict() for partner, state in self.partner_data.items()},
             "achievements": self.achievements,
-            "memories": self.memories,
-            "active_arcs": self.active_arcs,
+            "memories": self.memories.to_dict(),
+            "active_arcs": [arc.to_dict() for arc in self.active_arcs],
             "inside_jokes": self.inside_jokes,
             "shared_goals": self.shared_goals,
             "support_network": self.support_network,
@@ -2519,91 +4128,204 @@ class LifeSimulator:
             "energy": self.energy,
             "metamour_relationships": metamour_json,
             "pending_surprises": self.pending_surprises,
-            "last_saved": datetime.now().isoformat()
+            "event_history": self.event_history.to_dict(),
+            "partner_action_history": self.partner_action_history.to_dict(),
+            "stats_history": self.stats_history.to_dict(),
         }
-        with open(self.save_file, 'w') as f:
-            json.dump(save_data, f, indent=2)
-        safe_print(f"[SAVED] Game saved!")
+
+    def _restore_state(self, save_data: Dict[str, Any]):
+        """Replace the game state with a current-version snapshot (see migrate_save_data)"""
+        self._save_baseline = None
+        self.game_data = save_data["game_data"]
+        self.stats = PlayerStats.from_dict(save_data["stats"])
+
+        # Resume the saved game's random streams
+        self.seed = self.game_data["seed"]
+        self.seed_streams(self.game_data.get("days_together", 0))
+
+        self.partner_relationships = save_data["partner_relationships"]
+        self.partner_data = {partner: PartnerState.from_dict(data)
+                             for partner, data in save_data["partner_data"].items()}
+        self.achievements = save_data["achievements"]
+        self.active_arcs = [ArcProgress.from_dict(arc) for arc in save_data["active_arcs"]]
+        self.inside_jokes = save_data["inside_jokes"]
+        self.shared_goals = save_data["shared_goals"]
+        self.support_network = save_data["support_network"]
+        self.current_weather = save_data["current_weather"]
+        self.current_season = save_data["current_season"]
+        self.energy = save_data["energy"]
+        self.pending_surprises = save_data["pending_surprises"]
+        self.event_history.load_dict(save_data["event_history"])
+        self.partner_action_history.load_dict(save_data["partner_action_history"])
+        self.memories.load_dict(save_data["memories"])
+        self.stats_history = StatsHistory()
+        self.stats_history.load_dict(save_data["stats_history"])
+
+        # Metamour pairs are saved as "partner1|partner2" strings
+        self.metamour_relationships = {}
+        for k, v in save_data["metamour_relationships"].items():
+            parts = k.split("|")
+            if len(parts) == 2:
+                self.metamour_relationships[(parts[0], parts[1])] = v
+
+        # Only the intimate view changes; the shared catalog is already loaded
+        self.set_intimate_events(self.game_data.get("include_intimate", False))
+
+    def get_rng_state(self) -> Dict[str, list]:
+        """Get the exact position of every random stream, as JSON-ready lists"""
+        states = {}
+        for name, rng in self._rngs.items():
+            version, internal, gauss_next = rng.getstate()
+            states[name] = [version, list(internal), gauss_next]
+        return states
+
+    def set_rng_state(self, states: Dict[str, list]):
+        """Put every random stream back where get_rng_state() found it"""
+        for name, (version, internal, gauss_next) in states.items():
+            self._rngs[name].setstate((version, tuple(internal), gauss_next))
+
+    def save_game(self):
+        """Save current game state, appending only what changed since the last save"""
+        target, data, append = self._prepare_save()
+        if self.autosaver:
+            # Keep this save in order behind any autosaves still being written
+            self.autosaver.submit(target, data, append)
+            self.autosaver.flush()
+            if self.autosaver.error:
+                raise self.autosaver.error
+        else:
+            try:
+                write_save(target, data, append)
+            except SAVE_WRITE_ERRORS:
+                self._save_baseline = None  # Unknown what reached the file; rewrite it next time
+                raise
+        if self.save_store is not None:
+            # Stores batch their commits; an explicit save must be durable before it is reported
+            try:
+                self.save_store.flush()
+            except SAVE_WRITE_ERRORS:
+                self._save_baseline = None
+                raise
+        self.announce(f"[SAVED] Game saved!")
+
+    def get_save_target(self) -> Any:
+        """Where saves go: the save file path, or (save_store, session_id)"""
+        if self.save_store is not None:
+            return self.save_store, self.session_id
+        return self.save_file
+
+    def get_save_compression(self) -> Optional[str]:
+        """How saves are compressed: the save_compression setting, else by save file extension"""
+        if self.save_store is not None:
+            return None  # Stores hold records, not bytes
+        if self.save_compression is not None:
+            return self.save_compression or None
+        return SAVE_COMPRESSION_EXTENSIONS.get(os.path.splitext(self.save_file)[1].lower())
+
+    def _prepare_save(self) -> tuple:
+        """Serialize the next save as (target, data, append): a fresh base, or a delta on the last one.
+
+        Data for a save file is the encoded bytes; for a save store it is the record itself.
+        """
+        if self.autosaver is not None and self.autosaver.take_failure():
+            self._save_baseline = None  # Unknown what reached the file; rewrite it
+        save_data = self._snapshot_state()
+        save_data["last_saved"] = datetime.now().isoformat()
+        target = self.get_save_target()
+        compression = self.get_save_compression()
+        baseline = self._save_baseline
+        if (baseline is None or baseline["file"] != target or baseline["compression"] != compression
+                or baseline["deltas"] >= SAVE_COMPACT_EVERY
+                or (self.save_store is None and not os.path.exists(self.save_file))):
+            # No usable base snapshot (or too many deltas on it): write a fresh one
+            record = {"type": "base", "format": SAVE_FORMAT, "state": save_data}
+            self._save_baseline = self._make_save_baseline(save_data, 0, compression)
+            append = False
+        else:
+            record = self._save_delta(flatten_save_data(save_data), baseline)
+            baseline["deltas"] += 1
+            append = True
+        if self.save_store is not None:
+            return target, record, append
+        return target, encode_save_record(record, compression, "delta" if append else "base"), append
+
+    def _make_save_baseline(self, save_data: Dict[str, Any], deltas: int,
+                            compression: Optional[str]) -> Dict[str, Any]:
+        """Remember what a save file now holds: append-only list counts and every other part encoded"""
+        baseline = {"file": self.get_save_target(), "compression": compression, "deltas": deltas,
+                    "counts": {}, "encoded": {}}
+        parts = flatten_save_data(save_data)
+        for path, value in parts.items():
+            if path in SAVE_APPEND_ONLY and isinstance(value, list):
+                count_path = SAVE_APPEND_ONLY[path]
+                baseline["counts"][path] = parts.get(count_path, len(value)) if count_path else len(value)
+            else:
+                baseline["encoded"][path] = json.dumps(value)
+        return baseline
+
+    def _save_delta(self, parts: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the delta record from the saved baseline to the current parts, updating the baseline"""
+        delta = {"type": "delta", "day": self.game_data.get("days_together", 0), "set": [], "append": []}
+        counts = baseline["counts"]
+        encoded = baseline["encoded"]
+        for path, value in parts.items():
+            if path in SAVE_APPEND_ONLY and isinstance(value, list):
+                count_path = SAVE_APPEND_ONLY[path]
+                count = parts.get(count_path, len(value)) if count_path else len(value)
+                added = count - counts[path] if path in counts else -1
+                if 0 <= added <= len(value):
+                    if added:
+                        delta["append"].append((path, value[len(value) - added:]))
+                        counts[path] = count
+                    continue
+                # Replaced outright (e.g. a new game): write it whole, then append from here
+                delta["set"].append((path, value))
+                counts[path] = count
+                continue
+            value_json = json.dumps(value)
+            if encoded.get(path) != value_json:
+                delta["set"].append((path, value))
+                encoded[path] = value_json
+        return delta
 
     def load_game(self) -> bool:
-        """Load saved game state"""
+        """Load saved game state; False if there is none.
+
+        A save that cannot be migrated or restored raises rather than being
+        mistaken for a missing one.
+        """
         try:
-            with open(self.save_file, 'r') as f:
-                save_data = json.load(f)
-            self.game_data = save_data["game_data"]
-            self.stats = save_data["stats"]
-
-            # Load partner relationships (with backwards compatibility)
-            self.partner_relationships = save_data.get("partner_relationships", {})
-
-            # Handle legacy saves that used single ai_name
-            if not self.partner_relationships and "ai_name" in self.game_data:
-                legacy_name = self.game_data.get("ai_name", "AI")
-                self.partner_relationships = {legacy_name: save_data["stats"].get("relationship", 50)}
-                self.game_data["partners"] = [legacy_name]
-                self.game_data["partner_config"] = "solo"
-
-            # Load extended data (with backwards compatibility)
-            self.partner_data = save_data.get("partner_data", {})
-            self.achievements = save_data.get("achievements", {})
-            self.memories = save_data.get("memories", [])
-            self.active_arcs = save_data.get("active_arcs", [])
-
-            # Load new systems (with backwards compatibility)
-            self.inside_jokes = save_data.get("inside_jokes", [])
-            self.shared_goals = save_data.get("shared_goals", {})
-            self.support_network = save_data.get("support_network", self._generate_support_network())
-            self.current_weather = save_data.get("current_weather", self._get_random_weather())
-            self.current_season = save_data.get("current_season", self._get_current_season())
-            self.energy = save_data.get("energy", 100)
-            self.pending_surprises = save_data.get("pending_surprises", [])
-
-            # Load metamour relationships (convert string keys back to tuples)
-            metamour_json = save_data.get("metamour_relationships", {})
-            self.metamour_relationships = {}
-            for k, v in metamour_json.items():
-                parts = k.split("|")
-                if len(parts) == 2:
-                    self.metamour_relationships[(parts[0], parts[1])] = v
-
-            # Initialize partner_data for any partners missing new fields (legacy saves)
-            for partner in self.partner_relationships:
-                if partner not in self.partner_data:
-                    self.partner_data[partner] = {
-                        "traits": random.sample(list(PARTNER_TRAITS.keys()), random.randint(1, 2)),
-                        "mood": "content",
-                        "favorite": random.choice(QUALITY_TIME_ACTIVITIES)
-                    }
-                # Add new fields to existing partner_data
-                if "love_language" not in self.partner_data[partner]:
-                    self.partner_data[partner]["love_language"] = random.choice(list(LOVE_LANGUAGES.keys()))
-                if "conflict_style" not in self.partner_data[partner]:
-                    self.partner_data[partner]["conflict_style"] = random.choice(list(CONFLICT_STYLES.keys()))
-                if "backstory" not in self.partner_data[partner]:
-                    self.partner_data[partner]["backstory"] = {
-                        "dream": random.choice(BACKSTORY_ELEMENTS["dreams"]),
-                        "fear": random.choice(BACKSTORY_ELEMENTS["fears"]),
-                        "childhood": random.choice(BACKSTORY_ELEMENTS["childhood"]),
-                        "past": random.choice(BACKSTORY_ELEMENTS["past_relationships"]),
-                    }
-                    self.partner_data[partner]["backstory_revealed"] = []
-                if "surprise_cooldown" not in self.partner_data[partner]:
-                    self.partner_data[partner]["surprise_cooldown"] = 0
-
-            # Reload events with intimate option
-            include_intimate = self.game_data.get("include_intimate", False)
-            self.load_events(include_intimate)
-
-            partners_str = ", ".join(self.game_data.get("partners", ["AI"]))
-            safe_print(f"[LOADED] Game loaded! Day {self.game_data['days_together']} of your journey together.")
-            safe_print(f"Partners: {partners_str}")
-            safe_print(f"Season: {SEASONS[self.current_season]['label']} | Weather: {WEATHER_TYPES[self.current_weather]['label']}")
-            safe_print(f"Achievements unlocked: {len([a for a in self.achievements.values() if a.get('unlocked')])}")
-            return True
-        except FileNotFoundError:
-            print("No saved game found.")
+            if self.save_store is not None:
+                save_data, deltas = self.save_store.load(self.session_id)
+                compression = None
+            else:
+                save_data, deltas, compression = read_save_file(self.save_file)
+        except (FileNotFoundError, SessionNotFoundError):
+            self.announce("No saved game found.")
             return False
 
+        # Older saves are migrated once: the next save rewrites them as a fresh base snapshot,
+        # as it does for legacy single-document saves
+        if save_data.get("save_version", 0) != SAVE_VERSION:
+            migrate_save_data(save_data)
+            deltas = None
+        baseline = self._make_save_baseline(save_data, deltas, compression) if deltas is not None else None
+        self._restore_state(save_data)
+        self._save_baseline = baseline
+
+        partners_str = ", ".join(self.game_data.get("partners", ["AI"]))
+        self.announce(f"[LOADED] Game loaded! Day {self.game_data['days_together']} of your journey together.")
+        self.announce(f"Partners: {partners_str}")
+        self.announce(f"Season: {SEASONS[self.current_season]['label']} | Weather: {WEATHER_TYPES[self.current_weather]['label']}")
+        self.announce(f"Achievements unlocked: {len([a for a in self.achievements.values() if a.get('unlocked')])}")
+        return True
+
+    def estimate_memory(self) -> int:
+        """Rough bytes this game keeps in memory, for capping how many games a server holds"""
+        records = len(self.event_history) + len(self.partner_action_history) + len(self.memories)
+        cells = len(self.stats_history) * len(self.stats_history.columns)
+        return SESSION_BASE_BYTES + records * SESSION_RECORD_BYTES + cells * SESSION_STATS_CELL_BYTES
+
     def get_game_summary(self) -> str:
         """Get a summary of the current game state"""
         partners = self.game_data.get("partners", [])
@@ -2623,7 +4345,7 @@ class LifeSimulator:
   Configuration: {config_label}
   Difficulty: {diff_label}
   Days Together: {self.game_data['days_together']}
-  Events Experienced: {len(self.game_data['events_experienced'])}
+  Events Experienced: {self.event_history.total}
   Intimate Events: {intimate}
 ================================================================
 """
@@ -2668,6 +4390,979 @@ After they choose, we'll roll a d20 to see how things unfold (DC {event['roll_re
         return prompt
 
 
+class DecisionPolicy:
+    """Supplies the player's decisions for HeadlessRunner.
+
+    The base policy always takes the first response, skips quality time and
+    accepts whatever each partner chooses. Subclass and override any hook.
+    """
+
+    name = "first"
+
+    def choose_response(self, game: LifeSimulator, event: Dict[str, Any], cascade: bool = False) -> int:
+        """Pick a response index for an event (or the crisis cascade that followed it)"""
+        return 0
+
+    def choose_quality_time(self, game: LifeSimulator, partners: List[str]) -> List[str]:
+        """Pick which partners to spend quality time with (empty list skips)"""
+        return []
+
+    def choose_activity(self, game: LifeSimulator, partners: List[str]) -> Optional[str]:
+        """Pick a quality time activity, or None for no particular activity"""
+        return None
+
+    def confirm_partner_choice(self, game: LifeSimulator, partner: str, action: Dict[str, Any],
+                               ai_choice_index: int) -> int:
+        """Accept or override the choice a partner made on their turn"""
+        return ai_choice_index
+
+
+class RandomPolicy(DecisionPolicy):
+    """Picks every decision uniformly at random"""
+
+    name = "random"
+
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+
+    def choose_response(self, game, event, cascade=False):
+        return self.rng.randrange(len(event["responses"]))
+
+    def choose_quality_time(self, game, partners):
+        pick = self.rng.randrange(len(partners) + 2)
+        if pick < len(partners):
+            return [partners[pick]]
+        return list(partners) if pick == len(partners) else []
+
+    def choose_activity(self, game, partners):
+        return self.rng.choice(QUALITY_TIME_ACTIVITIES)
+
+
+class AttentivePolicy(DecisionPolicy):
+    """Spends quality time with the partner who needs it most, doing their favorite activity"""
+
+    name = "attentive"
+
+    def choose_quality_time(self, game, partners):
+        return [min(partners, key=lambda p: game.partner_relationships.get(p, 50))]
+
+    def choose_activity(self, game, partners):
+        return game.get_partner_favorite(partners[0])
+
+
+class HeadlessRunner:
+    """Runs the full daily loop without a console, with a policy making every decision.
+
+    Each day follows the same pipeline as main(): next_day, the day's event,
+    its outcome, any crisis cascade, quality time, then partner turns. Results
+    come back as plain dicts instead of printed narration.
+    """
+
+    def __init__(self, game: LifeSimulator, policy: DecisionPolicy = None, verbose: bool = False,
+                 journal: "ReplayJournal" = None):
+        self.game = game
+        self.policy = policy or DecisionPolicy()
+        self.journal = journal  # Records each day's decisions so the run can be replayed
+        game.verbose = verbose
+
+    def run(self, days: int):
+        """Play up to the given number of days, yielding each day's result"""
+        for _ in range(days):
+            result = self.run_day()
+            if result is None:
+                return
+            yield result
+
+    def run_day(self) -> Optional[Dict[str, Any]]:
+        """Play one day and return what happened (None if no event could be drawn)"""
+        game = self.game
+        game.next_day()
+
+        event, event_type = game.draw_day_event()
+        if not event:
+            return None
+
+        result = {
+            "day": game.game_data["days_together"],
+            "event": self.play_event(event, event_type),
+            "cascade": None,
+            "quality_time": None,
+            "partner_turns": [],
+        }
+
+        cascade_event = game.check_crisis_cascade(event, result["event"]["success"])
+        if cascade_event:
+            result["cascade"] = self.play_event(cascade_event, "cascade", cascade=True)
+
+        partners = game.game_data.get("partners", [])
+        if len(partners) > 1:
+            selected = [p for p in self.policy.choose_quality_time(game, partners) if p in partners]
+            if selected:
+                activity = self.policy.choose_activity(game, selected)
+                result["quality_time"] = {
+                    "partners": selected,
+                    "activity": activity,
+                    "effects": game.quality_time(selected, activity),
+                }
+
+        for partner in partners:
+            if game.rng("partners").random() < PARTNER_TURN_CHANCE and game.partner_actions:
+                turn = self.play_partner_turn(partner)
+                if turn:
+                    result["partner_turns"].append(turn)
+
+        result["stats"] = game.stats.to_dict()
+        result["relationships"] = dict(game.partner_relationships)
+        if self.journal:
+            self.journal.record_day(game, day_decisions(result))
+        return result
+
+    def play_event(self, event: Dict[str, Any], event_type: str, cascade: bool = False) -> Dict[str, Any]:
+        """Resolve one event with the policy's response and a d20 roll"""
+        game = self.game
+        choice_index = self.policy.choose_response(game, event, cascade)
+        if not 0 <= choice_index < len(event["responses"]):
+            choice_index = 0
+        roll = game.roll_dice("d20")
+        success, effects = game.process_event_outcome(event, roll, choice_index)
+        return {
+            "id": event["id"],
+            "type": event_type,
+            "category": event.get("category"),
+            "involved_partner": event.get("involved_partner"),
+            "choice": choice_index,
+            "roll": roll,
+            "success": success,
+            "effects": effects,
+        }
+
+    def play_partner_turn(self, partner: str) -> Optional[Dict[str, Any]]:
+        """Let a partner take their turn, with the policy confirming their choice"""
+        game = self.game
+        action = game.get_partner_action(partner)
+        if not action:
+            return None
+        ai_choice_index = game.get_partner_choice(partner, action)
+        choice_index = self.policy.confirm_partner_choice(game, partner, action, ai_choice_index)
+        if not 0 <= choice_index < len(action["partner_choices"]):
+            choice_index = ai_choice_index
+        roll = game.roll_dice("d20")
+        success, effects = game.process_partner_action(action, roll, choice_index)
+        return {
+            "partner": partner,
+            "id": action.get("id"),
+            "ai_choice": ai_choice_index,
+            "choice": choice_index,
+            "roll": roll,
+            "success": success,
+            "effects": effects,
+        }
+
+
+def day_decisions(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the decisions a journal needs to replay a HeadlessRunner day result"""
+    quality_time = result["quality_time"]
+    return {
+        "event": result["event"]["id"],
+        "choice": result["event"]["choice"],
+        "cascade": result["cascade"]["choice"] if result["cascade"] else None,
+        "quality_time": quality_time["partners"] if quality_time else None,
+        "activity": quality_time["activity"] if quality_time else None,
+        "partner_choices": [turn["choice"] for turn in result["partner_turns"]],
+    }
+
+
+class ReplayPolicy(DecisionPolicy):
+    """Feeds a journal's recorded decisions back to HeadlessRunner, one day at a time"""
+
+    name = "replay"
+
+    def __init__(self):
+        self.record = {}
+        self._partner_choices = iter(())
+
+    def load_day(self, record: Dict[str, Any]):
+        """Queue up the decisions recorded for the next day"""
+        self.record = record
+        self._partner_choices = iter(record.get("partner_choices", ()))
+
+    def choose_response(self, game, event, cascade=False):
+        return self.record["cascade"] if cascade else self.record["choice"]
+
+    def choose_quality_time(self, game, partners):
+        return self.record.get("quality_time") or []
+
+    def choose_activity(self, game, partners):
+        return self.record.get("activity")
+
+    def confirm_partner_choice(self, game, partner, action, ai_choice_index):
+        return next(self._partner_choices, ai_choice_index)
+
+
+class ReplayJournal:
+    """Append-only JSON-lines log from which a game can be rebuilt.
+
+    The journal holds a header line (seed and setup), a checkpoint of the
+    full state plus random stream positions at the start and on each resume,
+    and one line of decisions per day in between. Replaying re-runs those
+    days from the latest checkpoint. Days are cheap to replay, so further
+    checkpoints every checkpoint_every days are off by default; they would
+    make the journal far larger than the save.
+
+    A resume checkpoint is a branch point: days played after the save it
+    resumes from and never saved stay in the file, but are abandoned, and the
+    game's history continues from the branch.
+    """
+
+    FORMAT = 1
+
+    def __init__(self, path: str, checkpoint_every: int = 0):
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        self._file = None
+
+    def _write(self, entry: Dict[str, Any]):
+        """Append one line and flush it, so a crash loses at most the current day"""
+        if self._file is None:
+            self._file = open(self.path, 'a')
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def start(self, game: LifeSimulator):
+        """Begin a fresh journal for a newly set up game"""
+        self.close()
+        self._file = open(self.path, 'w')
+        data = game.game_data
+        self._write({
+            "type": "header",
+            "format": self.FORMAT,
+            "seed": game.seed,
+            "player_name": data.get("player_name"),
+            "partners": data.get("partners"),
+            "partner_config": data.get("partner_config"),
+            "difficulty": data.get("difficulty"),
+            "include_intimate": data.get("include_intimate"),
+        })
+        self.checkpoint(game)
+
+    def resume(self, game: LifeSimulator):
+        """Continue the journal of a loaded game, or start a new one if it has none"""
+        try:
+            with open(self.path, 'r') as f:
+                header = json.loads(f.readline() or "null")
+        except (FileNotFoundError, ValueError):
+            header = None
+        if not header or header.get("format") != self.FORMAT or header.get("seed") != game.seed:
+            self.start(game)
+            return
+        # Loading reseeds the random streams, so replay has to pick up from here
+        self.checkpoint(game, branch=True)
+
+    def checkpoint(self, game: LifeSimulator, branch: bool = False):
+        """Record the full state and random stream positions so replay can start here.
+
+        A branch checkpoint drops any day records after its day that were
+        written before it (unsaved days the loaded game never played).
+        """
+        self._write({
+            "type": "checkpoint",
+            "day": game.game_data["days_together"],
+            "branch": branch,
+            "state": game._snapshot_state(),
+            "rng": game.get_rng_state(),
+        })
+
+    def record_day(self, game: LifeSimulator, decisions: Dict[str, Any]):
+        """Record one finished day's decisions, checkpointing every checkpoint_every days"""
+        day = game.game_data["days_together"]
+        self._write({"type": "day", "day": day, **decisions})
+        if self.checkpoint_every and day % self.checkpoint_every == 0:
+            self.checkpoint(game)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_journal(path: str, from_start: bool = False) -> tuple:
+    """Read a journal's header, a checkpoint and the entries recorded after it.
+
+    Uses the latest checkpoint and returns only its day entries, parsing just
+    the checkpoint line it needs. With from_start, uses the first checkpoint
+    and returns every later entry in file order, checkpoints included.
+    """
+    header = None
+    checkpoint_line = None
+    entry_lines = []
+    with open(path, 'r') as f:
+        for line in f:
+            if line.startswith('{"type":"day"'):
+                entry_lines.append(line)
+            elif line.startswith('{"type":"checkpoint"'):
+                if checkpoint_line is None or not from_start:
+                    checkpoint_line = line
+                    entry_lines = []
+                else:
+                    entry_lines.append(line)
+            elif line.startswith('{"type":"header"'):
+                header = json.loads(line)
+    if header is None or checkpoint_line is None:
+        raise ValueError(f"{path} is not a replay journal")
+    if header.get("format") != ReplayJournal.FORMAT:
+        raise ValueError(f"{path} uses journal format {header.get('format')}, expected {ReplayJournal.FORMAT}")
+    return header, json.loads(checkpoint_line), [json.loads(line) for line in entry_lines]
+
+
+def replay_journal(path: str, events_dir: str = "events", verify: bool = False) -> LifeSimulator:
+    """Rebuild a journaled game by restoring a checkpoint and replaying the days after it.
+
+    With verify, replay starts from the first checkpoint instead and walks the
+    journal in order, checking each replayed day's event and each later
+    checkpoint's state against what was recorded. A mismatch raises ValueError
+    naming the first divergent day. Random streams are taken from each
+    checkpoint passed, since a game resumed with load_game reseeds them. A
+    branch checkpoint earlier than the replayed day restarts replay from it,
+    so abandoned unsaved days are verified and then dropped.
+    """
+    header, checkpoint, entries = read_journal(path, from_start=verify)
+    game = LifeSimulator(events_dir=events_dir, verbose=False, seed=header["seed"])
+    migrate_save_data(checkpoint["state"])
+    game._restore_state(checkpoint["state"])
+    game.set_rng_state(checkpoint["rng"])
+
+    policy = ReplayPolicy()
+    runner = HeadlessRunner(game, policy)
+    for record in entries:
+        if record["type"] == "checkpoint":
+            migrate_save_data(record["state"])
+            if record.get("branch") and record["day"] < game.game_data["days_together"]:
+                game._restore_state(record["state"])
+            elif json.loads(json.dumps(game._snapshot_state())) != record["state"]:
+                raise ValueError(f"Replay of {path} diverged from its checkpoint on day {record['day']}")
+            game.set_rng_state(record["rng"])
+            continue
+        policy.load_day(record)
+        result = runner.run_day()
+        if result is None or result["day"] != record["day"]:
+            raise ValueError(f"Replay of {path} stopped early at day {record['day']}")
+        if verify and result["event"]["id"] != record["event"]:
+            raise ValueError(f"Replay of {path} diverged on day {record['day']}: drew "
+                             f"{result['event']['id']}, journal recorded {record['event']}")
+    return game
+
+
+# Decision policies available to simulate() and --simulate, by name
+SIMULATION_POLICIES = {
+    "first": DecisionPolicy,
+    "random": RandomPolicy,
+    "attentive": AttentivePolicy,
+}
+
+# A partner relationship below this counts as a breakup in campaign summaries
+BREAKUP_RELATIONSHIP = 20
+
+
+def _init_simulation_worker(events_dir: str):
+    """Load the shared catalog once per worker process, quietly"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        get_event_catalog(events_dir).preload()
+
+
+def run_campaign(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Play one headless campaign and summarize how it went"""
+    policy_cls = SIMULATION_POLICIES[spec["policy"]]
+    policy = policy_cls(spec["seed"]) if policy_cls is RandomPolicy else policy_cls()
+
+    game = LifeSimulator(save_file=os.devnull, events_dir=spec["events_dir"], verbose=False,
+                         seed=spec["seed"])
+    num_partners = PARTNER_CONFIGS[spec["partner_config"]]["count"]
+    partners = [f"AI_{i + 1}" for i in range(num_partners)]
+    game.new_game("Player", partners, spec["partner_config"], spec["difficulty"],
+                  spec.get("include_intimate", False))
+
+    first_breakup_day = None
+    days_played = 0
+    for day in HeadlessRunner(game, policy).run(spec["days"]):
+        days_played = day["day"]
+        if first_breakup_day is None and any(v < BREAKUP_RELATIONSHIP for v in day["relationships"].values()):
+            first_breakup_day = day["day"]
+
+    return {
+        "difficulty": spec["difficulty"],
+        "partner_config": spec["partner_config"],
+        "policy": spec["policy"],
+        "seed": spec["seed"],
+        "days_played": days_played,
+        "final_stats": game.stats.to_dict(),
+        "final_relationships": dict(game.partner_relationships),
+        "arcs_completed": len(game.game_data.get("completed_arcs", [])),
+        "achievements": sorted(a for a, data in game.achievements.items() if data.get("unlocked")),
+        "first_breakup_day": first_breakup_day,
+    }
+
+
+def simulate(difficulties: List[str], partner_configs: List[str], policies: List[str],
+             campaigns: int = 1, days: int = 365, seed: int = 0, workers: Optional[int] = None,
+             events_dir: str = "events", include_intimate: bool = False):
+    """Run campaigns for every difficulty x partner config x policy across worker processes.
+
+    Each campaign gets its own seed (seed, seed + 1, ...) so any single run can
+    be replayed. Summaries are yielded as campaigns finish, not in submission order.
+    """
+    specs = []
+    for difficulty in difficulties:
+        for partner_config in partner_configs:
+            for policy in policies:
+                for _ in range(campaigns):
+                    specs.append({
+                        "difficulty": difficulty,
+                        "partner_config": partner_config,
+                        "policy": policy,
+                        "seed": seed + len(specs),
+                        "days": days,
+                        "events_dir": events_dir,
+                        "include_intimate": include_intimate,
+                    })
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_simulation_worker,
+                             initargs=(events_dir,)) as executor:
+        futures = [executor.submit(run_campaign, spec) for spec in specs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def print_simulation_report(summaries: List[Dict[str, Any]]):
+    """Print breakup rate and average outcomes per difficulty, partner config and policy"""
+    groups = {}
+    for summary in summaries:
+        key = (summary["difficulty"], summary["partner_config"], summary["policy"])
+        groups.setdefault(key, []).append(summary)
+
+    print(f"{'difficulty':10s} {'partners':9s} {'policy':9s} {'runs':>5s} {'breakups':>8s} "
+          f"{'1st day':>7s} {'arcs':>5s} {'happy':>5s}", file=sys.stderr)
+    for (difficulty, partner_config, policy), runs in sorted(groups.items()):
+        breakups = [r["first_breakup_day"] for r in runs if r["first_breakup_day"] is not None]
+        first_day = f"{sum(breakups) / len(breakups):7.0f}" if breakups else f"{'-':>7s}"
+        arcs = sum(r["arcs_completed"] for r in runs) / len(runs)
+        happiness = sum(r["final_stats"]["happiness"] for r in runs) / len(runs)
+        print(f"{difficulty:10s} {partner_config:9s} {policy:9s} {len(runs):5d} "
+              f"{len(breakups) / len(runs):8.0%} {first_day} {arcs:5.1f} {happiness:5.0f}", file=sys.stderr)
+
+
+# JSON API server: sessions are held in memory, and game steps run on a thread pool
+SERVER_MAX_BODY = 64 * 1024  # Largest request body accepted, in bytes
+SERVER_MAX_HEADERS = 64  # Most header lines accepted in one request
+SERVER_MAX_HEADER_BYTES = 16 * 1024  # Largest request line plus headers, in bytes
+SERVER_IDLE_TIMEOUT = 30.0  # Seconds a connection may wait on the client for its next bytes
+HTTP_REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+                405: "Method Not Allowed", 409: "Conflict",
+                413: "Payload Too Large", 431: "Request Header Fields Too Large",
+                500: "Internal Server Error"}
+
+
+class _ApiError(Exception):
+    """A request the server refuses, with the HTTP status to answer it with"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _RequestPolicy(DecisionPolicy):
+    """Makes whatever decisions the current request asked for"""
+
+    def __init__(self):
+        self.choice = 0
+        self.partner_choices = {}  # {partner: choice index overriding their own}
+
+    def choose_response(self, game, event, cascade):
+        return self.choice
+
+    def confirm_partner_choice(self, game, partner, action, ai_choice_index):
+        return self.partner_choices.get(partner, ai_choice_index)
+
+
+class ServerSession:
+    """One hosted game and where it is in the current day.
+
+    Requests for a session take its lock, so its steps run one at a time in
+    the order they arrived, while other sessions carry on in parallel.
+    """
+
+    def __init__(self, session_id: str, game: LifeSimulator):
+        self.session_id = session_id
+        self.game = game
+        self.policy = _RequestPolicy()
+        self.runner = HeadlessRunner(game, self.policy)
+        self.lock = asyncio.Lock()
+        self.pending = None  # (event, event type, is cascade) awaiting resolve_event
+        self.partner_turn_day = None  # Day partners last took their turns
+
+    @classmethod
+    def from_saved(cls, session_id: str, game: LifeSimulator) -> "ServerSession":
+        """Wrap a loaded game, picking its day back up where stash_turn() left it"""
+        session = cls(session_id, game)
+        turn = game.game_data.get("server_turn")
+        if turn:
+            session.pending = tuple(turn["pending"]) if turn["pending"] else None
+            session.partner_turn_day = turn["partner_turn_day"]
+        game.game_data["server_turn"] = None
+        return session
+
+    def stash_turn(self):
+        """Keep the day's progress in game_data, so it survives the game being saved and reloaded"""
+        pending = None
+        if self.pending:
+            event, event_type, cascade = self.pending
+            pending = [thaw_event_data(event), event_type, cascade]
+        self.game.game_data["server_turn"] = {"pending": pending, "partner_turn_day": self.partner_turn_day}
+
+    def save(self):
+        """Save the game along with the day's progress"""
+        self.stash_turn()
+        self.game.save_game()
+
+    def status(self) -> Dict[str, Any]:
+        """Where the game stands: day, stats, relationships, weather and any pending event"""
+        game = self.game
+        return {
+            "session_id": self.session_id,
+            "day": game.game_data["days_together"],
+            "stats": game.stats.to_dict(),
+            "relationships": dict(game.partner_relationships),
+            "energy": game.energy,
+            "season": game.current_season,
+            "weather": game.current_weather,
+            "pending_event": self.pending[0]["id"] if self.pending else None,
+        }
+
+    def pending_event(self) -> Dict[str, Any]:
+        """The event waiting for a response, as JSON-ready data"""
+        if not self.pending:
+            raise _ApiError(409, "No event is waiting; call next_day")
+        event, event_type, cascade = self.pending
+        return {"day": self.game.game_data["days_together"], "type": event_type, "cascade": cascade,
+                "event": thaw_event_data(event), "preview": self.game.preview_outcome(event)}
+
+    def next_day(self) -> Dict[str, Any]:
+        """Start the next day and draw its event"""
+        if self.pending:
+            raise _ApiError(409, "Resolve the pending event before starting the next day")
+        self.game.next_day()
+        event, event_type = self.game.draw_day_event()
+        if not event:
+            raise _ApiError(409, "No events available")
+        self.pending = (event, event_type, False)
+        return self.pending_event()
+
+    def resolve_event(self, choice: int) -> Dict[str, Any]:
+        """Answer the pending event; a failure may bring a crisis cascade, which becomes pending"""
+        if not self.pending:
+            raise _ApiError(409, "No event is waiting; call next_day")
+        event, event_type, cascade = self.pending
+        self.policy.choice = choice
+        outcome = self.runner.play_event(event, event_type, cascade=cascade)
+        self.pending = None
+        result = {"outcome": outcome, "cascade": None, "stats": dict(self.game.stats)}
+        if not cascade:
+            cascade_event = self.game.check_crisis_cascade(event, outcome["success"])
+            if cascade_event:
+                self.pending = (cascade_event, "cascade", True)
+                result["cascade"] = self.pending_event()
+        return result
+
+    def quality_time(self, partners: List[str], activity: Optional[str]) -> Dict[str, Any]:
+        """Spend quality time with some of the partners"""
+        known = self.game.game_data.get("partners", [])
+        if not partners or any(p not in known for p in partners):
+            raise _ApiError(400, f"partners must be chosen from {', '.join(known)}")
+        if activity is not None and activity not in QUALITY_TIME_ACTIVITIES:
+            raise _ApiError(400, f"activity must be one of {', '.join(QUALITY_TIME_ACTIVITIES)}")
+        return {"partners": partners, "activity": activity,
+                "effects": self.game.quality_time(partners, activity)}
+
+    def partner_turn(self, overrides: Dict[str, int]) -> Dict[str, Any]:
+        """Give each partner their chance to act today, with optional choice overrides"""
+        day = self.game.game_data["days_together"]
+        if self.partner_turn_day == day:
+            raise _ApiError(409, "Partners already took their turns today")
+        self.partner_turn_day = day
+        self.policy.partner_choices = overrides
+        turns = []
+        for partner in self.game.game_data.get("partners", []):
+            if self.game.rng("partners").random() < PARTNER_TURN_CHANCE and self.game.partner_actions:
+                turn = self.runner.play_partner_turn(partner)
+                if turn:
+                    turns.append(turn)
+        return {"turns": turns, "relationships": dict(self.game.partner_relationships)}
+
+
+# Most games a GameServer keeps in memory at once; the rest wait in their saves
+SESSION_POOL_SIZE = 1000
+
+
+class SessionPool:
+    """The games a server keeps in memory, evicting the least recently used to their saves.
+
+    Residents are capped by count and by estimated bytes. An evicted session is
+    saved in the background (pending event included) and reloaded on its next
+    request, so callers only see the extra latency. Sessions busy with a
+    request are never evicted.
+    """
+
+    def __init__(self, create_game, run, max_sessions: int = SESSION_POOL_SIZE,
+                 max_bytes: Optional[int] = None):
+        self.create_game = create_game  # session_id -> LifeSimulator saving to that session's slot
+        self.run = run  # Coroutine running a blocking call off the event loop
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._sessions = OrderedDict()  # {session_id: ServerSession}, least recently used first
+        self._sizes = {}  # {session_id: estimated bytes}
+        self._evicting = {}  # {session_id: eviction task still saving}
+        self._loading = {}  # {session_id: rehydration task}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def is_resident(self, session: "ServerSession") -> bool:
+        """Whether this session object is the one in memory (not evicted since it was fetched)"""
+        return self._sessions.get(session.session_id) is session
+
+    def sessions(self) -> List["ServerSession"]:
+        """Sessions currently in memory"""
+        return list(self._sessions.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Residency and hit/miss/eviction counters"""
+        return {"resident": len(self._sessions), "resident_bytes": sum(self._sizes.values()),
+                "max_sessions": self.max_sessions, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    async def get(self, session_id: str) -> Optional["ServerSession"]:
+        """Find a session, reloading it from its save if it was evicted (None if it has no save)"""
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self.hits += 1
+            self._sessions.move_to_end(session_id)
+            return session
+        self.misses += 1
+        if session_id not in self._loading:
+            self._loading[session_id] = asyncio.ensure_future(self._rehydrate(session_id))
+        try:
+            return await asyncio.shield(self._loading[session_id])
+        finally:
+            self._loading.pop(session_id, None)
+
+    async def _rehydrate(self, session_id: str) -> Optional["ServerSession"]:
+        eviction = self._evicting.get(session_id)
+        if eviction is not None:
+            await eviction  # Load what the eviction saved, not the save before it
+        if session_id in self._sessions:
+            return self._sessions[session_id]  # Put back by a failed eviction
+        game = await self.run(self.create_game, session_id)
+        if not await self.run(game.load_game):
+            return None
+        session = ServerSession.from_saved(session_id, game)
+        self.add(session)
+        return session
+
+    def add(self, session: "ServerSession"):
+        """Take a session into memory as the most recently used"""
+        self._sessions[session.session_id] = session
+        self.update(session)
+
+    def update(self, session: "ServerSession"):
+        """Re-estimate a session's size after a request, evicting others if over the limits"""
+        self._sizes[session.session_id] = session.game.estimate_memory()
+        self._trim()
+
+    def _over_limits(self) -> bool:
+        if len(self._sessions) > self.max_sessions:
+            return True
+        return self.max_bytes is not None and sum(self._sizes.values()) > self.max_bytes
+
+    def _trim(self):
+        """Start evicting least recently used idle sessions until back under the limits"""
+        for session_id in list(self._sessions):
+            if not self._over_limits():
+                return
+            session = self._sessions[session_id]
+            if session.lock.locked() or len(self._sessions) == 1:
+                continue  # In use; try the next oldest
+            self._start_eviction(session)
+
+    def _start_eviction(self, session: "ServerSession"):
+        session_id = session.session_id
+        del self._sessions[session_id]
+        del self._sizes[session_id]
+        task = asyncio.ensure_future(self._evict(session))
+        self._evicting[session_id] = task
+        task.add_done_callback(lambda _: self._evicting.pop(session_id, None))
+
+    async def _evict(self, session: "ServerSession"):
+        async with session.lock:
+            try:
+                # save_game() commits a save store before returning, so the save is durable
+                # before the game leaves memory
+                await self.run(session.save)
+            except Exception as e:
+                # Keep the game rather than lose it; it is retried on a later trim
+                safe_print(f"[!] Could not evict session {session.session_id}: {type(e).__name__}: {e}")
+                self._keep(session)
+                return
+            except BaseException:
+                self._keep(session)  # Cancelled mid-save
+                raise
+        self.evictions += 1
+
+    def _keep(self, session: "ServerSession"):
+        """Put back a session whose eviction failed"""
+        self._sessions[session.session_id] = session
+        self._sizes[session.session_id] = session.game.estimate_memory()
+
+    async def evict_all(self):
+        """Save and drop every resident session, e.g. on shutdown"""
+        for session in list(self._sessions.values()):
+            self._start_eviction(session)
+        if self._evicting:
+            await asyncio.gather(*self._evicting.values())
+
+
+class GameServer:
+    """Hosts many games at once behind a small JSON-over-HTTP API.
+
+    Routes (request and response bodies are JSON):
+      GET  /sessions                      sessions in memory, plus SessionPool counters
+      POST /sessions                      new_game: player_name, partners, partner_config,
+                                          difficulty, include_intimate, seed
+      GET  /sessions/{id}                 day, stats and relationships
+      POST /sessions/{id}/load            load the session's save (any request does this)
+      POST /sessions/{id}/next_day        start the next day and draw its event
+      GET  /sessions/{id}/event           the event waiting for a response
+      POST /sessions/{id}/resolve_event   choice
+      POST /sessions/{id}/quality_time    partners, activity
+      POST /sessions/{id}/partner_turn    choices: {partner: index} overrides
+      POST /sessions/{id}/save
+    Games save to `save_store` when given, otherwise to <save_dir>/<id>.json,
+    and idle ones are evicted there by the SessionPool. A connection that sends
+    nothing for idle_timeout seconds is closed.
+    """
+
+    def __init__(self, events_dir: str = "events", save_store: Optional[SaveStore] = None,
+                 save_dir: str = "saves", workers: Optional[int] = None,
+                 max_sessions: int = SESSION_POOL_SIZE, max_bytes: Optional[int] = None,
+                 idle_timeout: float = SERVER_IDLE_TIMEOUT):
+        self.events_dir = events_dir
+        self.idle_timeout = idle_timeout
+        self.save_store = save_store
+        self.save_dir = save_dir
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="game")
+        self.sessions = SessionPool(self.create_game, self._run, max_sessions, max_bytes)
+
+    def create_game(self, session_id: str, seed: Optional[int] = None) -> LifeSimulator:
+        """Make a quiet game whose saves go to this server's store or save directory"""
+        if self.save_store is not None:
+            return LifeSimulator(events_dir=self.events_dir, verbose=False, seed=seed,
+                                 save_store=self.save_store, session_id=session_id)
+        return LifeSimulator(save_file=os.path.join(self.save_dir, f"{session_id}.json"),
+                             events_dir=self.events_dir, verbose=False, seed=seed)
+
+    async def serve(self, address: str):
+        """Serve until cancelled on "host:port", or on a Unix socket when the address is a path"""
+        if self.save_store is None:
+            os.makedirs(self.save_dir, exist_ok=True)
+        if os.sep in address or not address.rpartition(":")[2].isdigit():
+            server = await asyncio.start_unix_server(self._handle_connection, path=address,
+                                                     limit=SERVER_MAX_HEADER_BYTES)
+        else:
+            host, _, port = address.rpartition(":")
+            server = await asyncio.start_server(self._handle_connection, host or "127.0.0.1", int(port),
+                                                limit=SERVER_MAX_HEADER_BYTES)
+        safe_print(f"[OK] Serving on {address}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.sessions.evict_all()
+            self.executor.shutdown(wait=True)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer HTTP/1.1 requests on one connection until the client closes it or goes idle"""
+        try:
+            while True:
+                try:
+                    request_line = await self._readline(reader, 400)
+                    if not request_line.strip():
+                        break
+                    method, target, version, headers = await self._read_head(reader, request_line)
+                    body = await self._read_body(reader, headers)
+                except _ApiError as e:
+                    # Refused before the request was fully read, so the connection can't be reused
+                    status, payload, keep_alive = e.status, {"error": str(e)}, False
+                else:
+                    status, payload = await self.handle_request(method, target.split("?")[0], body)
+                    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+                writer.write(f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+                             f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            pass  # The client went away or sat idle past idle_timeout
+        finally:
+            writer.close()
+
+    async def _readline(self, reader: asyncio.StreamReader, too_long: int) -> bytes:
+        """Read one line within the idle timeout, refusing lines over the header size limit"""
+        try:
+            return await asyncio.wait_for(reader.readline(), self.idle_timeout)
+        except ValueError:  # The stream limit is SERVER_MAX_HEADER_BYTES
+            raise _ApiError(too_long, f"Request lines and headers are limited to "
+                                      f"{SERVER_MAX_HEADER_BYTES} bytes") from None
+
+    async def _read_head(self, reader: asyncio.StreamReader, request_line: bytes) -> tuple:
+        """Parse a request line and read its headers; returns (method, target, version, headers)"""
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+        except ValueError:
+            raise _ApiError(400, "Malformed request line") from None
+        headers = {}
+        count = 0
+        size = len(request_line)
+        while True:
+            line = await self._readline(reader, 431)
+            if not line.strip():
+                break
+            count += 1
+            size += len(line)
+            if count > SERVER_MAX_HEADERS or size > SERVER_MAX_HEADER_BYTES:
+                raise _ApiError(431, f"Requests are limited to {SERVER_MAX_HEADERS} headers "
+                                     f"and {SERVER_MAX_HEADER_BYTES} bytes of them")
+            name, colon, value = line.decode("latin-1").partition(":")
+            if not colon:
+                raise _ApiError(400, "Malformed header line")
+            headers[name.strip().lower()] = value.strip()
+        return method, target, version, headers
+
+    async def _read_body(self, reader: asyncio.StreamReader, headers: Dict[str, str]) -> bytes:
+        """Read the request body its Content-Length announces, within the idle timeout"""
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise _ApiError(400, "Content-Length must be a number") from None
+        if length < 0:
+            raise _ApiError(400, "Content-Length must not be negative")
+        if length > SERVER_MAX_BODY:
+            raise _ApiError(413, f"Request bodies are limited to {SERVER_MAX_BODY} bytes")
+        return await asyncio.wait_for(reader.readexactly(length), self.idle_timeout) if length else b""
+
+    async def handle_request(self, method: str, path: str, body: bytes) -> tuple:
+        """Route one request; returns (HTTP status, JSON-ready payload)"""
+        try:
+            params = json.loads(body) if body.strip() else {}
+            if not isinstance(params, dict):
+                raise _ApiError(400, "Request body must be a JSON object")
+            parts = [part for part in path.split("/") if part]
+            if not parts or parts[0] != "sessions" or len(parts) > 3:
+                raise _ApiError(404, f"No such endpoint: {path}")
+            if len(parts) == 1:
+                if method == "GET":
+                    return 200, {"sessions": [session.status() for session in self.sessions.sessions()],
+                                 "pool": self.sessions.stats()}
+                if method == "POST":
+                    return 201, await self._new_game(params)
+                raise _ApiError(405, f"{method} not allowed on {path}")
+            return 200, await self._session_request(method, parts[1], parts[2] if len(parts) == 3 else None, params)
+        except _ApiError as e:
+            return e.status, {"error": str(e)}
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+
+    async def _run(self, func, *args):
+        """Run a game step on the thread pool so the event loop keeps serving other sessions"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, functools.partial(func, *args))
+
+    async def _new_game(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        partner_config = params.get("partner_config", "solo")
+        difficulty = params.get("difficulty", "balanced")
+        partners = params.get("partners") or ["AI"]
+        if partner_config not in PARTNER_CONFIGS:
+            raise _ApiError(400, f"partner_config must be one of {', '.join(PARTNER_CONFIGS)}")
+        if difficulty not in DIFFICULTY_SETTINGS:
+            raise _ApiError(400, f"difficulty must be one of {', '.join(DIFFICULTY_SETTINGS)}")
+        if not isinstance(partners, list) or not all(isinstance(p, str) and p for p in partners):
+            raise _ApiError(400, "partners must be a list of names")
+        count = PARTNER_CONFIGS[partner_config]["count"]
+        allowed = range(4, 9) if partner_config == "polycule" else range(count, count + 1)  # As setup_new_game
+        if len(partners) not in allowed or len(set(partners)) != len(partners):
+            raise _ApiError(400, f"{partner_config} needs {allowed.start}"
+                                 f"{'' if len(allowed) == 1 else f'-{allowed.stop - 1}'} differently named partners")
+        session_id = secrets.token_hex(8)
+        game = await self._run(self.create_game, session_id, params.get("seed"))
+        await self._run(game.new_game, str(params.get("player_name", "Player")), partners, partner_config,
+                        difficulty, bool(params.get("include_intimate", False)))
+        session = ServerSession(session_id, game)
+        self.sessions.add(session)
+        return session.status()
+
+    async def _session(self, session_id: str) -> ServerSession:
+        if not all(c.isalnum() or c in "-_" for c in session_id):
+            raise _ApiError(400, "Session ids are letters, digits, '-' and '_'")
+        session = await self.sessions.get(session_id)
+        if session is None:
+            raise _ApiError(404, f"No session {session_id}")
+        return session
+
+    async def _session_request(self, method: str, session_id: str, action: Optional[str],
+                               params: Dict[str, Any]) -> Dict[str, Any]:
+        while True:
+            session = await self._session(session_id)
+            async with session.lock:
+                if not self.sessions.is_resident(session):
+                    continue  # Evicted while this request waited; fetch it again
+                try:
+                    return await self._session_action(session, method, action, params)
+                finally:
+                    self.sessions.update(session)
+
+    async def _session_action(self, session: ServerSession, method: str, action: Optional[str],
+                              params: Dict[str, Any]) -> Dict[str, Any]:
+        if (method, action) in (("GET", None), ("POST", "load")):
+            return session.status()
+        if method == "GET" and action == "event":
+            return session.pending_event()
+        if method != "POST":
+            raise _ApiError(405, f"{method} not allowed here")
+        if action == "next_day":
+            return await self._run(session.next_day)
+        if action == "resolve_event":
+            choice = params.get("choice")
+            event = session.pending[0] if session.pending else None
+            if event is not None and (not isinstance(choice, int)
+                                      or not 0 <= choice < len(event["responses"])):
+                raise _ApiError(400, f"choice must be 0-{len(event['responses']) - 1}")
+            return await self._run(session.resolve_event, choice)
+        if action == "quality_time":
+            return await self._run(session.quality_time, params.get("partners"), params.get("activity"))
+        if action == "partner_turn":
+            overrides = params.get("choices") or {}
+            if not isinstance(overrides, dict) or not all(isinstance(v, int) for v in overrides.values()):
+                raise _ApiError(400, "choices must map partner names to choice indexes")
+            return await self._run(session.partner_turn, overrides)
+        if action == "save":
+            await self._run(session.save)
+            return session.status()
+        raise _ApiError(404, f"No such endpoint: {action}")
+
+
 def setup_new_game(game: LifeSimulator):
     """Interactive setup for a new game with partner configuration"""
     print("\n=================== NEW GAME SETUP ===================\n")
@@ -2759,8 +5454,124 @@ def setup_new_game(game: LifeSimulator):
     game.new_game(player_name, partners, partner_config, difficulty, include_intimate, partner_traits)
 
 
-def main():
+def main(argv: List[str] = None):
     """Main game loop for command-line play"""
+    parser = argparse.ArgumentParser(description="Unwritten Chapters - a life simulation for humans and AI")
+    parser.add_argument("--events-dir", default="events", help="Directory holding the event JSON files")
+    parser.add_argument("--build-catalog", action="store_true",
+                        help="Validate the event files and write a compiled catalog bundle, then exit")
+    parser.add_argument("--simulate", action="store_true",
+                        help="Run headless Monte Carlo campaigns, printing one JSON summary per line, then exit")
+    parser.add_argument("--campaigns", type=int, default=10, help="Campaigns per combination (with --simulate)")
+    parser.add_argument("--days", type=int, default=365, help="Days per campaign (with --simulate)")
+    parser.add_argument("--difficulty", default=",".join(DIFFICULTY_SETTINGS),
+                        help="Comma-separated difficulties to simulate")
+    parser.add_argument("--partner-config", default="solo", help="Comma-separated partner configs to simulate")
+    parser.add_argument("--policy", default="random",
+                        help=f"Comma-separated decision policies to simulate ({', '.join(SIMULATION_POLICIES)})")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first campaign (with --simulate)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--include-intimate", action="store_true", help="Include intimate events in simulated campaigns")
+    parser.add_argument("--save-file", default="game_state.json",
+                        help="Save file to play from (.gz or .xz saves are compressed)")
+    parser.add_argument("--serve", metavar="ADDRESS",
+                        help="Serve the JSON API on HOST:PORT, or on a Unix socket path")
+    parser.add_argument("--max-sessions", type=int, default=SESSION_POOL_SIZE,
+                        help="Most games --serve keeps in memory; idle ones beyond it are saved and dropped")
+    parser.add_argument("--max-session-mb", type=float, default=None,
+                        help="Estimated memory --serve may spend on resident games")
+    parser.add_argument("--save-dir", default="saves",
+                        help="Where --serve saves sessions when there is no --save-db")
+    parser.add_argument("--migrate", metavar="DIR",
+                        help=f"Upgrade every save in DIR to save version {SAVE_VERSION} (in parallel), then exit")
+    parser.add_argument("--save-db", metavar="DB",
+                        help="Keep saves in a SQLite save store instead of --save-file")
+    parser.add_argument("--session", default="default",
+                        help="Session id to play within --save-db")
+    parser.add_argument("--list-sessions", action="store_true",
+                        help="With --save-db, list the stored sessions and exit")
+    parser.add_argument("--compress", choices=["gzip", "lzma"], default=None,
+                        help="Compress saves regardless of the save file's extension")
+    parser.add_argument("--journal", default=None,
+                        help="Replay journal kept during play (default: the save file plus .journal, "
+                             "or the --save-db path plus the session id)")
+    parser.add_argument("--checkpoint-every", type=int, default=0, metavar="DAYS",
+                        help="Also checkpoint the full state in the journal every DAYS days (0 = off)")
+    parser.add_argument("--autosave", type=int, default=0, metavar="DAYS",
+                        help="Save in the background every DAYS days during play (0 = off)")
+    parser.add_argument("--replay", metavar="JOURNAL",
+                        help="Rebuild a game from its replay journal, show its stats, then exit")
+    parser.add_argument("--verify", action="store_true",
+                        help="With --replay, replay from the first checkpoint and check every recorded outcome")
+    args = parser.parse_args(argv)
+
+    if args.build_catalog:
+        sys.exit(0 if build_catalog_bundle(args.events_dir) else 1)
+
+    if args.migrate:
+        results = []
+        for result in migrate_saves(args.migrate, args.workers):
+            print(json.dumps(result), flush=True)
+            results.append(result)
+        failed = sum(1 for r in results if "error" in r)
+        rewritten = sum(1 for r in results if r.get("rewritten"))
+        print(f"{len(results)} saves: {rewritten} rewritten, {failed} failed", file=sys.stderr)
+        sys.exit(1 if failed else 0)
+
+    if args.replay:
+        try:
+            game = replay_journal(args.replay, args.events_dir, verify=args.verify)
+        except (OSError, ValueError) as e:
+            print(f"[!] {e}")
+            sys.exit(1)
+        if args.verify:
+            safe_print(f"[OK] Replay matches the journal through day {game.game_data['days_together']}")
+        print(game.get_game_summary())
+        game.display_stats()
+        return
+
+    if args.simulate:
+        difficulties = args.difficulty.split(",")
+        partner_configs = args.partner_config.split(",")
+        policies = args.policy.split(",")
+        for value, known, flag in ((difficulties, DIFFICULTY_SETTINGS, "--difficulty"),
+                                   (partner_configs, PARTNER_CONFIGS, "--partner-config"),
+                                   (policies, SIMULATION_POLICIES, "--policy")):
+            unknown = [v for v in value if v not in known]
+            if unknown:
+                parser.error(f"{flag}: unknown {', '.join(unknown)} (choose from {', '.join(known)})")
+
+        summaries = []
+        for summary in simulate(difficulties, partner_configs, policies, args.campaigns, args.days,
+                                args.seed, args.workers, args.events_dir, args.include_intimate):
+            print(json.dumps(summary), flush=True)
+            summaries.append(summary)
+        print_simulation_report(summaries)
+        return
+
+    save_store = SQLiteSaveStore(args.save_db) if args.save_db else None
+    if args.list_sessions:
+        if not save_store:
+            parser.error("--list-sessions needs --save-db")
+        for session in save_store.list_sessions():
+            print(f"{session['session_id']}: {session['player_name']}, day {session['day']} "
+                  f"(saved {session['updated']})")
+        save_store.close()
+        return
+
+    if args.serve:
+        max_bytes = int(args.max_session_mb * 1024 * 1024) if args.max_session_mb else None
+        server = GameServer(args.events_dir, save_store, args.save_dir, args.workers,
+                            args.max_sessions, max_bytes)
+        try:
+            asyncio.run(server.serve(args.serve))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if save_store:
+                save_store.close()
+        return
+
     print("=" * 64)
     print("        UNWRITTEN CHAPTERS v1.0 - \"First Page\"")
     print("")
@@ -2770,16 +5581,25 @@ def main():
     print("\n  The pages are blank. The pen is shared.")
     print("  What will you write?\n")
 
-    game = LifeSimulator()
+    game = LifeSimulator(save_file=args.save_file, events_dir=args.events_dir,
+                         save_compression=args.compress, save_store=save_store, session_id=args.session)
 
     print("1. New Game")
     print("2. Load Game")
     choice = input("\nChoice: ").strip()
 
+    journal_path = args.journal
+    if journal_path is None:
+        # One journal per save, so separate games never append to each other's
+        journal_path = f"{args.save_db}.{args.session}.journal" if save_store else f"{args.save_file}.journal"
+    journal = ReplayJournal(journal_path, args.checkpoint_every)
     if choice == "2" and game.load_game():
-        pass
+        journal.resume(game)
     else:
         setup_new_game(game)
+        journal.start(game)
+
+    autosaver = Autosaver(game, args.autosave) if args.autosave > 0 else None
 
     print(game.get_game_summary())
     game.display_stats()
@@ -2791,16 +5611,7 @@ def main():
         game.next_day()
 
         # Priority: Story arc event > Special event > Random event
-        event = game.get_arc_event()
-        event_type = "arc"
-
-        if not event:
-            event = game.check_special_event()
-            event_type = "special"
-
-        if not event:
-            event = game.get_random_event()
-            event_type = "normal"
+        event, event_type = game.draw_day_event()
 
         if not event:
             print("No events available!")
@@ -2816,8 +5627,8 @@ def main():
         if game.active_arcs:
             arc_data = game.active_arcs[0]
             for arc in game.story_arcs:
-                if arc["id"] == arc_data["arc_id"]:
-                    safe_print(f"[STORY ARC ACTIVE: {arc['title']} - Stage {arc_data['stage']}]")
+                if arc["id"] == arc_data.arc_id:
+                    safe_print(f"[STORY ARC ACTIVE: {arc['title']} - Stage {arc_data.stage}]")
                     break
 
         if involved:
@@ -2843,6 +5654,8 @@ def main():
             choice_index = 0
 
         print(f"\nYou chose: {event['responses'][choice_index]}")
+        decisions = {"event": event["id"], "choice": choice_index, "cascade": None,
+                     "quality_time": None, "activity": None, "partner_choices": []}
 
         # Roll the dice
         roll = game.roll_dice("d20")
@@ -2877,6 +5690,7 @@ def main():
                 cascade_index = 0
 
             print(f"\nYou chose: {cascade_event['responses'][cascade_index]}")
+            decisions["cascade"] = cascade_index
             cascade_roll = game.roll_dice("d20")
             cascade_success, cascade_effects = game.process_event_outcome(cascade_event, cascade_roll, cascade_index)
 
@@ -2939,6 +5753,8 @@ def main():
                     except ValueError:
                         pass
 
+                decisions["quality_time"] = selected_partners
+                decisions["activity"] = selected_activity
                 qt_effects = game.quality_time(selected_partners, selected_activity)
                 print("\nQuality time effects:")
                 for key, value in qt_effects.items():
@@ -2950,10 +5766,10 @@ def main():
                         print(f"  {direction} {key}: {value:+d}")
 
         # =============== PARTNER'S TURN ===============
-        # Give each partner a chance to initiate something (70% chance per partner)
+        # Give each partner a chance to initiate something
         partners = game.game_data.get("partners", [])
         for partner in partners:
-            if random.random() < 0.7 and game.partner_actions:  # 70% chance for partner action
+            if game.rng("partners").random() < PARTNER_TURN_CHANCE and game.partner_actions:
                 partner_action = game.get_partner_action(partner)
                 if partner_action:
                     print("\n" + "="*60)
@@ -2991,6 +5807,7 @@ def main():
                         except ValueError:
                             pass
 
+                    decisions["partner_choices"].append(final_choice_index)
                     final_choice = partner_action['partner_choices'][final_choice_index]
                     print(f"\n{partner} chose: {final_choice}")
 
@@ -3016,6 +5833,9 @@ def main():
                                 stat_display = f"Relationship ({partner})"
                             print(f"  {direction} {stat_display}: {change:+d}")
 
+        journal.record_day(game, decisions)
+        if autosaver:
+            autosaver.day_finished()
         game.display_stats()
 
         # Ask to continue
@@ -3027,6 +5847,11 @@ def main():
             if save == 'y':
                 game.save_game()
             safe_print(f"\nThanks for playing! You spent {game.game_data['days_together']} days together.")
+            journal.close()
+            if autosaver:
+                autosaver.stop()
+            if save_store:
+                save_store.close()
             break
 
 